@@ -10,7 +10,7 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from theme_css import get_theme_css
+from theme_css import get_theme_html
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent / '.env'
@@ -53,8 +53,11 @@ def get_theme_colors(theme='dark'):
             'accent_border': 'rgba(14, 165, 233, 0.28)',
         }
 
-# Apply theme-specific CSS from imported module
-st.markdown(get_theme_css(st.session_state.get('theme', 'dark')), unsafe_allow_html=True)
+# Apply theme-specific CSS (precomputed once per process, served as a cached static file)
+st.markdown(
+    get_theme_html(st.session_state.get('theme', 'dark'), bool(st.get_option("server.enableStaticServing"))),
+    unsafe_allow_html=True
+)
 
 # Initialize session state
 if 'authenticated' not in st.session_state:
@@ -104,6 +107,9 @@ def main():
             """, unsafe_allow_html=True)
 
             if st.button("Logout", use_container_width=True):
+                from utils import stop_status_sweeper
+
+                stop_status_sweeper()
                 st.session_state.authenticated = False
                 st.session_state.client = None
                 st.session_state.access_token = None
@@ -371,8 +377,11 @@ def show_configuration_page():
 def authenticate_oauth(client_id, client_secret, domain_name, cert_path, key_path):
     """Authenticate using OAuth 2.0."""
     try:
-        from tauc_openapi import ApiClient
-        from tauc_openapi.models import GetAccessTokenRequest, GetAccessTokenResponse
+        from tauc_openapi import ApiClient, TAUCApiException
+        from tauc_openapi.execute.auth_manager import AccessTokenManager
+
+        # Optional token cache shared by all dashboard processes
+        AccessTokenManager.configure_store(os.getenv("TAUC_TOKEN_CACHE_DIR"))
 
         with st.spinner("🔄 Authenticating..."):
             # Build client
@@ -384,22 +393,16 @@ def authenticate_oauth(client_id, client_secret, domain_name, cert_path, key_pat
                 client_key_path=key_path
             )
 
-            # Get access token
-            token_request = GetAccessTokenRequest()
-            token_response = client.access_token_call(token_request, GetAccessTokenResponse)
-
-            if not token_response.is_success():
-                st.error(f"❌ Authentication failed: {token_response.msg} (Code: {token_response.error_code})")
-                return
-
-            # Validate access token was returned
-            if not token_response.result or not token_response.result.access_token:
-                st.error("❌ Authentication succeeded but no access token was returned.")
+            # Get access token (a still-valid cached token is reused)
+            try:
+                access_token = client.get_access_token()
+            except TAUCApiException as e:
+                st.error(f"❌ Authentication failed: {e}")
                 return
 
             # Store in session
             st.session_state.client = client
-            st.session_state.access_token = token_response.result.access_token
+            st.session_state.access_token = access_token
             st.session_state.authenticated = True
             st.session_state.auth_type = "OAuth 2.0"
 
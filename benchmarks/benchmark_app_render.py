@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Startup and rerun time budget harness for the dashboard.
+
+Drives app.py headlessly with Streamlit's testing API (AppTest) against a
+stubbed SDK client, so no network or certificates are needed, and reports:
+- cold start: first run of app.main() in a fresh session, with the
+  dashboard's own modules (theme_css, pages, tauc_openapi) unloaded
+- warm rerun: rerunning the same session with nothing changed
+- per page: rerun after selecting each page in the sidebar (each
+  pages/*.show() rendered through app.main())
+
+Timings are the median of several runs. Exits with status 1 if any timing
+exceeds its budget, or if a run raised an exception.
+
+Usage:
+    python benchmarks/benchmark_app_render.py [cold_ms] [warm_ms] [page_ms] [runs]
+"""
+
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, ROOT)
+
+import requests  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "app.py")
+
+# Default budgets in milliseconds
+DEFAULT_BUDGETS = {"cold": 1500.0, "warm": 250.0, "page": 400.0}
+
+PAGES = [
+    "🏠 Home",
+    "📦 Inventory",
+    "🔧 Network Management",
+    "🔍 Device Lookup",
+    "🌐 Service Activation",
+    "📦 Asset Management",
+]
+
+# Modules unloaded before each cold start (Streamlit itself stays imported,
+# as it would in a running server)
+APP_MODULES = ("theme_css", "pages", "utils", "tauc_openapi")
+
+
+class StubClient:
+    """
+    Stand-in for ApiClient returning canned successful responses.
+
+    Responses are real response_class instances parsed from a canned HTTP
+    response, so pages go through the same decoding as with the real client.
+    """
+
+    def __init__(self):
+        """Initialize the stub client."""
+        self.calls: List[str] = []
+        # Account identity, as on ApiClient (keys the per-account inventory mirror)
+        self.domain_name = "tauc.example"
+        self.client_id = "stub-client"
+        self.access_key = None
+
+    @property
+    def account_key(self) -> str:
+        """Account identity key, as on ApiClient."""
+        return f"{self.domain_name}|{self.client_id or self.access_key}"
+
+    def api_call(self, request, response_class, access_token=None):
+        """Return an empty successful response for any request."""
+        self.calls.append(type(request).__name__)
+        return response_class(self._http_response(b'{"errorCode":0,"msg":"success","result":{"total":0,"data":[]}}'))
+
+    def access_token_call(self, request, response_class):
+        """Return a canned access token."""
+        self.calls.append(type(request).__name__)
+        return response_class(self._http_response(
+            b'{"errorCode":0,"msg":"success","result":{"accessToken":"stub","expiresIn":3600}}'
+        ))
+
+    @staticmethod
+    def _http_response(content: bytes) -> requests.Response:
+        """Build a requests.Response holding content."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers["Content-Type"] = "application/json"
+        response._content = content
+        return response
+
+
+def unload_app_modules() -> None:
+    """Remove the dashboard's modules from sys.modules."""
+    for name in list(sys.modules):
+        if name.split(".")[0] in APP_MODULES:
+            del sys.modules[name]
+
+
+def new_session(client: StubClient) -> AppTest:
+    """Create an authenticated AppTest session using the stub client."""
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.session_state["authenticated"] = True
+    at.session_state["client"] = client
+    at.session_state["access_token"] = "stub"
+    at.session_state["auth_type"] = "AK/SK"
+    return at
+
+
+def timed_run(at: AppTest) -> float:
+    """Run (or rerun) the app and return the elapsed time in ms."""
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if at.exception:
+        raise RuntimeError(f"App raised: {at.exception[0].message}")
+    return elapsed
+
+
+def measure(runs: int) -> Dict[str, List[float]]:
+    """
+    Collect cold, warm and per-page timings.
+
+    Args:
+        runs: Number of samples per timing
+
+    Returns:
+        Timing name -> samples in ms
+    """
+    samples: Dict[str, List[float]] = {"cold": [], "warm": []}
+    samples.update({page: [] for page in PAGES})
+
+    for _ in range(runs):
+        unload_app_modules()
+        at = new_session(StubClient())
+        samples["cold"].append(timed_run(at))
+        samples["warm"].append(timed_run(at))
+
+        for page in PAGES:
+            at.sidebar.radio[0].set_value(page)
+            samples[page].append(timed_run(at))
+
+    return samples
+
+
+def main():
+    """Run the harness."""
+    budgets = dict(DEFAULT_BUDGETS)
+    for index, name in enumerate(("cold", "warm", "page"), start=1):
+        if len(sys.argv) > index:
+            budgets[name] = float(sys.argv[index])
+    runs = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+
+    print("=" * 60)
+    print(f"Dashboard render times (median of {runs})")
+    print("=" * 60)
+
+    try:
+        samples = measure(runs)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    failed = []
+    for name, values in samples.items():
+        budget = budgets.get(name, budgets["page"])
+        median = statistics.median(values)
+        status = "✅" if median <= budget else "❌"
+        label = name if name in budgets else f"page: {name}"
+        print(f"  {status} {label:<32} {median:8.1f} ms   (budget {budget:.0f} ms)")
+        if median > budget:
+            failed.append(label)
+
+    if failed:
+        print(f"\n❌ Over budget: {', '.join(failed)}")
+        return 1
+
+    print("\n✅ All render times within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
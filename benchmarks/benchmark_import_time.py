@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Import-time regression check for tauc_openapi.models.
+
+Runs ``python -X importtime -c "import tauc_openapi.models"`` in a fresh
+interpreter (best of several runs), reports the cumulative import time and
+fails if it exceeds the budget, or if importing the package eagerly loads
+any model module (they should only load on first attribute access).
+
+Usage:
+    python benchmarks/benchmark_import_time.py [budget_ms] [runs]
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+TARGET = "tauc_openapi.models"
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_once() -> tuple:
+    """
+    Import the package in a fresh interpreter.
+
+    Returns:
+        (cumulative import time in ms, names of model modules that were loaded)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    )
+
+    cumulative_us = 0
+    loaded = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        if name == TARGET:
+            cumulative_us = int(match.group(2))
+        elif name.startswith(TARGET + "."):
+            loaded.append(name)
+
+    return cumulative_us / 1000, loaded
+
+
+def main():
+    """Run the check."""
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print("=" * 60)
+    print(f"Import time: {TARGET}")
+    print("=" * 60)
+
+    samples = []
+    loaded = []
+    for _ in range(runs):
+        elapsed, loaded = measure_once()
+        samples.append(elapsed)
+
+    best = min(samples)
+    print(f"  best of {runs}: {best:.1f} ms (budget {budget_ms:.1f} ms)")
+    print(f"  all runs: {', '.join(f'{s:.1f}' for s in samples)} ms")
+
+    failed = False
+    if loaded:
+        print(f"❌ Model modules loaded eagerly: {', '.join(loaded)}")
+        failed = True
+    if best > budget_ms:
+        print(f"❌ Import time over budget by {best - budget_ms:.1f} ms")
+        failed = True
+
+    if failed:
+        return 1
+
+    print("✅ Import time within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
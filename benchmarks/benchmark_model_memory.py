@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory per network for high-cardinality result types.
+
+Decodes synthetic GetNetworkNameListV2 and inventory payloads and reports
+bytes allocated per network (tracemalloc), comparing plain dataclasses
+(per-instance __dict__) with the slotted result types.
+
+Usage:
+    python benchmarks/benchmark_model_memory.py [networks]
+"""
+
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tauc_openapi.models import GetNetworkNameListV2Response, GetNATLockedInventoryResponse  # noqa: E402
+
+
+@dataclass
+class PlainNetworkData:
+    """NetworkData as a plain dataclass (before)."""
+    id: Optional[int] = None
+    network_name: Optional[str] = None
+
+
+@dataclass
+class PlainMeshUnit:
+    """Inventory MeshUnit as a plain dataclass (before)."""
+    sn: Optional[str] = None
+    mac: Optional[str] = None
+
+
+@dataclass
+class PlainInventoryData:
+    """InventoryData as a plain dataclass (before)."""
+    network_name: Optional[str] = None
+    mesh_unit_list: Optional[List[PlainMeshUnit]] = None
+
+
+def plain_network_list(data: list) -> list:
+    """Decode the way the hand-written parser did, into plain dataclasses."""
+    return [PlainNetworkData(id=item.get("id"), network_name=item.get("networkName")) for item in data]
+
+
+def plain_inventory(data: list) -> list:
+    """Decode the way the hand-written parser did, into plain dataclasses."""
+    return [
+        PlainInventoryData(
+            network_name=item.get("networkName"),
+            mesh_unit_list=[PlainMeshUnit(sn=u.get("sn"), mac=u.get("mac")) for u in item["meshUnitList"]]
+        )
+        for item in data
+    ]
+
+
+def measure(fn, payload, count: int) -> float:
+    """Return bytes allocated per network while decoding payload."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn(payload)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def main():
+    """Run the benchmark."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    # Input strings are created up front so only the decoded objects are measured
+    name_list = [{"id": i, "networkName": f"Network-{i}"} for i in range(count)]
+    inventory = [
+        {"networkName": f"Network-{i}",
+         "meshUnitList": [{"sn": f"SN{i}A", "mac": f"{i:012X}"}, {"sn": f"SN{i}B", "mac": f"{i + 1:012X}"}]}
+        for i in range(count)
+    ]
+    slotted_list = GetNetworkNameListV2Response()._parse_result
+    slotted_inventory = GetNATLockedInventoryResponse()._parse_result
+
+    print("=" * 60)
+    print(f"Result model memory ({count:,} networks)")
+    print("=" * 60)
+
+    rows = [
+        ("Network name list", plain_network_list, name_list,
+         lambda p: slotted_list({"total": count, "data": p})),
+        ("Inventory (2 mesh units)", plain_inventory, inventory,
+         lambda p: slotted_inventory({"total": count, "data": p})),
+    ]
+    for label, plain_fn, payload, slotted_fn in rows:
+        plain = measure(plain_fn, payload, count)
+        slotted = measure(slotted_fn, payload, count)
+        print(f"  {label:<26} before {plain:7.1f} B/network   after {slotted:7.1f} B/network   "
+              f"({(1 - slotted / plain) * 100:.0f}% less)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark listing a large fleet with ApiClient.paginate().
+
+Runs the paginator against a local stand-in for the network name list
+endpoint (page size capped at 100, configurable per-request latency) and
+compares fetching one page at a time with concurrent page fan-out. Checks
+that every run returns all networks once, in order.
+
+Usage:
+    python benchmarks/benchmark_pagination.py [networks] [latency_ms] [workers ...]
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import requests  # noqa: E402
+
+from tauc_openapi.base.client_type import ClientType  # noqa: E402
+from tauc_openapi.execute import api_client  # noqa: E402
+from tauc_openapi.execute.api_client import ApiClient  # noqa: E402
+from tauc_openapi.models import GetNetworkNameListV2Request, GetNetworkNameListV2Response  # noqa: E402
+
+MAX_PAGE_SIZE = 100
+
+
+class StandInTransport:
+    """Local stand-in for HttpClient serving a network name list."""
+
+    def __init__(self, networks: int, latency: float):
+        self.networks = networks
+        self.latency = latency
+        self.requests = 0
+
+    def request(self, method, url, headers=None, params=None, json_data=None, data=None):
+        self.requests += 1
+        time.sleep(self.latency)
+
+        page = int(params["page"])
+        size = min(int(params["pageSize"]), MAX_PAGE_SIZE)
+        start = page * size
+        rows = [{"id": i + 1, "networkName": f"Network-{i + 1}"}
+                for i in range(start, min(start + size, self.networks))]
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response._content = json.dumps({
+            "errorCode": 0,
+            "result": {"total": self.networks, "page": page, "pageSize": size, "data": rows}
+        }).encode("utf-8")
+        return response
+
+    def close(self):
+        pass
+
+
+def build_client(transport: StandInTransport) -> ApiClient:
+    """Build an AK/SK client using the stand-in transport."""
+    http_client_class = api_client.HttpClient
+    api_client.HttpClient = lambda cert_path, key_path: transport
+    try:
+        return ApiClient(ClientType.ACCESS_KEY, "tauc.example", "client.crt", "client.key",
+                         access_key="access-key", secret="secret-key")
+    finally:
+        api_client.HttpClient = http_client_class
+
+
+def main():
+    """Run the benchmark."""
+    networks = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    worker_counts = [int(arg) for arg in sys.argv[3:]] or [1, 4, 8, 16]
+
+    print("=" * 60)
+    print(f"Paginated listing: {networks:,} networks, {latency_ms:.0f} ms per request")
+    print("=" * 60)
+
+    expected = list(range(1, networks + 1))
+    baseline = None
+    for workers in worker_counts:
+        transport = StandInTransport(networks, latency_ms / 1000)
+        client = build_client(transport)
+        request = GetNetworkNameListV2Request(networkStatus="ONLINE")
+
+        start = time.perf_counter()
+        ids = [network.id for network in client.paginate(request, GetNetworkNameListV2Response, max_workers=workers)]
+        elapsed = time.perf_counter() - start
+
+        if ids != expected:
+            print(f"❌ workers={workers}: got {len(ids):,} networks, expected all {networks:,} in order")
+            return 1
+
+        baseline = baseline or elapsed
+        print(f"  workers={workers:<3} {elapsed:7.2f} s   {transport.requests:5} requests   "
+              f"{baseline / elapsed:5.1f}x")
+
+    print("\n✅ All runs returned every network once, in order")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark X-Authorization signing throughput (signatures per second).
+
+Compares the per-call approach (hmac.new + uuid4 per request) with the
+Signer that reuses precomputed HMAC state and a counter-based nonce.
+
+Usage:
+    python benchmarks/benchmark_signer.py [iterations]
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tauc_openapi.execute.signer import Signer  # noqa: E402
+
+SECRET = "0123456789abcdef0123456789abcdef"
+ACCESS_KEY = "benchmark-access-key"
+URL = "/v1/openapi/network-system-management/details/123456"
+BODY = b'{"networkName":"Bench","meshUnitList":[{"sn":"SN0001","mac":"AABBCCDDEEFF"}]}'
+
+
+def legacy_x_auth(url: str, body: bytes) -> str:
+    """Per-call signing: rebuilds the HMAC key schedule and draws a uuid4."""
+    timestamp = int(time.time())
+    nonce = str(uuid.uuid4())
+    parts = []
+    if body and body != b"{}":
+        parts.append(base64.b64encode(hashlib.md5(body).digest()).decode('utf-8'))
+    parts.append(str(timestamp))
+    parts.append(nonce)
+    parts.append(url)
+    signature = hmac.new(
+        SECRET.encode('utf-8'), "\n".join(parts).encode('utf-8'), hashlib.sha256
+    ).hexdigest()
+    return ",".join([
+        f"Nonce={nonce}", f"AccessKey={ACCESS_KEY}",
+        f"Signature={signature}", f"Timestamp={timestamp}"
+    ])
+
+
+def measure(label: str, fn, iterations: int) -> float:
+    """Run fn iterations times and print signatures per second."""
+    start = time.perf_counter()
+    fn(iterations)
+    elapsed = time.perf_counter() - start
+    rate = iterations / elapsed
+    print(f"  {label:<28} {rate:>12,.0f} sig/s  ({elapsed * 1000:.1f} ms)")
+    return rate
+
+
+def main():
+    """Run the benchmark."""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    signer = Signer(SECRET, ACCESS_KEY)
+    prepared = [(URL, BODY)] * iterations
+
+    print("=" * 60)
+    print(f"Signing benchmark ({iterations:,} requests)")
+    print("=" * 60)
+
+    legacy = measure("legacy (hmac.new + uuid4)",
+                     lambda n: [legacy_x_auth(URL, BODY) for _ in range(n)], iterations)
+    single = measure("Signer.x_auth",
+                     lambda n: [signer.x_auth(URL, BODY) for _ in range(n)], iterations)
+    batch = measure("Signer.sign_batch",
+                    lambda n: signer.sign_batch(prepared), iterations)
+
+    print(f"\n  Speedup: x_auth {single / legacy:.2f}x, sign_batch {batch / legacy:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
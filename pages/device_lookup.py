@@ -14,6 +14,7 @@ def show():
             <div style='display:flex;flex-wrap:wrap;gap:0.6rem;margin-top:1rem;'>
                 <span class='tauc-chip'>SN + MAC required</span>
                 <span class='tauc-chip'>Normalized MAC input</span>
+                <span class='tauc-chip'>Bulk CSV lookup</span>
                 <span class='tauc-chip'>Quick exports</span>
             </div>
         </div>
@@ -23,7 +24,11 @@ def show():
 
     st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
 
-    lookup_device()
+    single_tab, bulk_tab = st.tabs(["Single Device", "Bulk Lookup"])
+    with single_tab:
+        lookup_device()
+    with bulk_tab:
+        show_bulk_lookup()
 
 
 def lookup_device():
@@ -273,71 +278,63 @@ Device ID: {device_id}
 
 
 def search_device(sn: str, mac: str):
-    """Search for device by SN and MAC (both required)."""
+    """Search for device by SN and MAC (both required); repeat lookups are served from the device cache."""
     try:
-        from tauc_openapi.models import GetDeviceIdRequest, GetDeviceIdResponse, GetDeviceInfoRequest, GetDeviceInfoResponse
+        from tauc_openapi.inventory import DeviceCache
+
+        cache = DeviceCache.for_account(st.session_state.client)
 
         # Step 1: Get Device ID
         endpoint1 = f"/v1/openapi/device-information/device-id?sn={sn}&mac={mac}"
         st.code(f"📡 Step 1: GET {endpoint1}", language="")
 
-        with st.spinner(f"Step 1: Looking up device ID for SN: {sn} and MAC: {mac}..."):
-            # Build request with BOTH parameters (API requires both)
-            request = GetDeviceIdRequest(sn=sn, mac=mac)
-
-            response = st.session_state.client.api_call(
-                request,
-                GetDeviceIdResponse,
-                st.session_state.access_token
-            )
+        with st.spinner(f"Looking up device for SN: {sn} and MAC: {mac}..."):
+            # Both SN and MAC are sent (the API requires both)
+            lookup = cache.resolve(st.session_state.client, sn, mac, st.session_state.access_token)
+            response = lookup.id_response
 
             if response.is_success():
-                if response.result and response.result.device_id:
-                    device_id = response.result.device_id
-                    st.success(f"✅ Step 1 Complete: Device ID obtained!")
+                if lookup.device_id:
+                    device_id = lookup.device_id
+                    source = " (cached)" if lookup.id_cached else ""
+                    st.success(f"✅ Step 1 Complete: Device ID obtained{source}!")
 
                     # Step 2: Get Detailed Device Information
                     endpoint2 = f"/v1/openapi/device-information/device-info/{device_id}"
                     st.code(f"📡 Step 2: GET {endpoint2}", language="")
 
-                    with st.spinner(f"Step 2: Fetching detailed device information..."):
-                        info_request = GetDeviceInfoRequest(device_id=device_id)
-
-                        info_response = st.session_state.client.api_call(
-                            info_request,
-                            GetDeviceInfoResponse,
-                            st.session_state.access_token
+                    info_response = lookup.info_response
+                    if lookup.device_info:
+                        source = " (cached)" if lookup.info_cached else ""
+                        st.success(f"✅ Step 2 Complete: Device details retrieved{source}!")
+
+                        # Display both responses
+                        display_device_information(
+                            sn=sn,
+                            mac=mac,
+                            device_id=device_id,
+                            device_info_list=lookup.device_info,
+                            id_response=response,
+                            info_response=info_response,
+                            endpoint1=endpoint1,
+                            endpoint2=endpoint2
                         )
+                    else:
+                        st.warning("Device ID obtained, but detailed information could not be retrieved.")
+                        st.error(f"Error: {info_response.msg} (Code: {info_response.error_code})")
 
-                        if info_response.is_success() and info_response.result:
-                            st.success(f"✅ Step 2 Complete: Device details retrieved!")
-
-                            # Display both responses
-                            display_device_information(
-                                sn=sn,
-                                mac=mac,
-                                device_id=device_id,
-                                device_info_list=info_response.result,
-                                id_response=response,
-                                info_response=info_response,
-                                endpoint1=endpoint1,
-                                endpoint2=endpoint2
-                            )
-                        else:
-                            st.warning("Device ID obtained, but detailed information could not be retrieved.")
-                            st.error(f"Error: {info_response.msg} (Code: {info_response.error_code})")
-
-                            # Show raw response for debugging
-                            with st.expander("🔍 View Error Response"):
-                                raw_json = info_response.get_raw_json()
-                                if raw_json:
-                                    st.json(raw_json)
+                        # Show raw response for debugging
+                        with st.expander("🔍 View Error Response"):
+                            raw_json = info_response.get_raw_json()
+                            if raw_json:
+                                st.json(raw_json)
 
                 else:
                     st.warning("Device found but no Device ID returned")
 
             else:
-                st.error(f"Device not found: {response.msg} (Code: {response.error_code})")
+                source = " (cached; asked again after a minute)" if lookup.id_cached else ""
+                st.error(f"Device not found: {response.msg} (Code: {response.error_code}){source}")
 
                 # Helpful error messages
                 if response.error_code == -70346:
@@ -380,17 +377,98 @@ def search_device(sn: str, mac: str):
             st.text(f"MAC Address: {mac}")
 
 
-# Additional utility: Bulk lookup
+# Bulk lookup: rows read from the upload per chunk, and results rendered per batch
+BULK_CHUNK_ROWS = 5000
+BULK_RENDER_EVERY = 250
+
+BULK_COLUMNS = ["SN", "MAC", "Status", "Device ID", "Category", "Role", "Model", "Firmware", "Cached", "Error"]
+
+
+def read_device_pairs(csv_file, invalid_rows: list, chunk_rows: int = BULK_CHUNK_ROWS):
+    """
+    Stream SN/MAC pairs from a CSV, validating and normalizing each chunk at once.
+
+    The first two columns are the serial number and MAC address (a header
+    row naming them is skipped). MACs are normalized to uppercase hex
+    without separators; rows with an empty SN or a MAC that is not 12 hex
+    digits are appended to invalid_rows as result rows instead of yielded.
+
+    Args:
+        csv_file: Uploaded file (or path) with SN,MAC rows
+        invalid_rows: List receiving result rows for invalid input
+        chunk_rows: Rows parsed per chunk
+
+    Yields:
+        (serial number, normalized MAC) pairs
+    """
+    import pandas as pd
+
+    chunks = pd.read_csv(
+        csv_file, header=None, usecols=[0, 1], names=["sn", "mac"], dtype=str,
+        keep_default_na=False, skipinitialspace=True, chunksize=chunk_rows
+    )
+    first = True
+    for chunk in chunks:
+        sn = chunk["sn"].str.strip()
+        raw_mac = chunk["mac"].str.strip()
+        if first and len(chunk) and raw_mac.iloc[0].lower().startswith("mac"):
+            sn, raw_mac = sn.iloc[1:], raw_mac.iloc[1:]
+        first = False
+
+        mac = raw_mac.str.replace(r"[^0-9A-Fa-f]", "", regex=True).str.upper()
+        valid = (sn != "") & raw_mac.str.fullmatch(r"[0-9A-Fa-f:.\-]+") & (mac.str.len() == 12)
+
+        for bad_sn, bad_mac in zip(sn[~valid], raw_mac[~valid]):
+            invalid_rows.append({
+                **dict.fromkeys(BULK_COLUMNS, ""), "SN": bad_sn, "MAC": bad_mac,
+                "Status": "Invalid input", "Cached": False,
+                "Error": "Serial number is empty" if not bad_sn else "MAC address must be 12 hex digits"
+            })
+        yield from zip(sn[valid], mac[valid])
+
+
+def bulk_result_row(lookup) -> dict:
+    """Flatten a DeviceLookup into a results table row."""
+    row = {
+        **dict.fromkeys(BULK_COLUMNS, ""), "SN": lookup.sn, "MAC": lookup.mac,
+        "Cached": lookup.id_cached and (lookup.info_response is None or lookup.info_cached)
+    }
+    response = lookup.id_response
+    if lookup.device_id:
+        row["Status"] = "Found"
+        row["Device ID"] = lookup.device_id
+        info = lookup.device_info[0] if lookup.device_info else None
+        if info is not None:
+            row.update({
+                "Category": info.device_category or "", "Role": info.topo_role or "",
+                "Model": info.device_model or "", "Firmware": info.fw_version or ""
+            })
+        elif lookup.info_response is not None:
+            row["Error"] = f"Device info: {lookup.info_response.msg} (Code: {lookup.info_response.error_code})"
+    elif response.error_code is not None and response.error_code != 0:
+        from tauc_openapi.inventory.device_cache import NEGATIVE_RESULT_CODES
+
+        row["Status"] = "Not found" if response.error_code in NEGATIVE_RESULT_CODES else "Error"
+        row["Error"] = f"{response.msg} (Code: {response.error_code})"
+    else:
+        row["Status"] = "Error"
+        row["Error"] = response.msg or "No device ID returned"
+    return row
+
+
 def show_bulk_lookup():
-    """Show bulk lookup interface (future enhancement)."""
-    st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
-    st.subheader("🔄 Bulk Lookup (Coming Soon)")
+    """Resolve an uploaded CSV of SN/MAC pairs, streaming results into a table."""
+    import pandas as pd
+    from tauc_openapi.inventory import BulkDeviceResolver
+    from utils.ui_components import display_export_buttons
+
+    st.subheader("Bulk Lookup")
 
     st.markdown(
         """
         <div class='tauc-notification'>
-            <div class='tauc-notification__title'>Bulk lookup preview</div>
-            <div class='tauc-notification__meta'>Upcoming support to upload CSVs with SN/MAC pairs for batch resolution. The control is disabled until the API is finalised.</div>
+            <div class='tauc-notification__title'>Upload SN/MAC pairs</div>
+            <div class='tauc-notification__meta'>One device per row: serial number, then MAC address (any separator). Device IDs and device information are resolved concurrently; devices looked up before are served from the cache.</div>
         </div>
         """,
         unsafe_allow_html=True,
@@ -399,9 +477,52 @@ def show_bulk_lookup():
     uploaded_file = st.file_uploader(
         "Upload CSV file",
         type=['csv'],
-        disabled=True,
-        help="This feature is not yet implemented"
+        help="Two columns: SN, MAC (an optional header row is skipped)",
+        key="bulk_lookup_file"
     )
 
-
-# Call bulk lookup at the end of main show function if needed
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        with_info = st.checkbox("Include device information", value=True, key="bulk_lookup_info")
+    with col2:
+        max_workers = st.number_input("Concurrent requests", min_value=1, max_value=32, value=8, key="bulk_lookup_workers")
+    with col3:
+        rate = st.number_input("Requests per second", min_value=1, max_value=200, value=20, key="bulk_lookup_rate")
+
+    if uploaded_file is not None and st.button("Resolve Devices", type="primary", key="bulk_lookup_run"):
+        invalid_rows = []
+        rows = []
+        expected = max(1, uploaded_file.getvalue().count(b"\n"))
+        progress = st.progress(0.0, text="Resolving devices...")
+        table = st.empty()
+
+        resolver = BulkDeviceResolver(
+            st.session_state.client, max_workers=int(max_workers), rate=float(rate),
+            access_token=st.session_state.access_token, with_info=with_info
+        )
+        try:
+            for lookup in resolver.resolve_many(read_device_pairs(uploaded_file, invalid_rows)):
+                rows.append(bulk_result_row(lookup))
+                if len(rows) % BULK_RENDER_EVERY == 0:
+                    done = len(rows) + len(invalid_rows)
+                    progress.progress(min(done / expected, 1.0), text=f"Resolved {done:,} devices...")
+                    table.dataframe(pd.DataFrame(rows, columns=BULK_COLUMNS), use_container_width=True, hide_index=True)
+        except Exception as e:
+            st.error(f"Bulk lookup error: {str(e)}")
+
+        rows.extend(invalid_rows)
+        progress.progress(1.0, text=f"Resolved {len(rows):,} devices ({resolver.api_calls:,} API calls)")
+        table.empty()
+        st.session_state.bulk_lookup_results = rows
+
+    rows = st.session_state.get("bulk_lookup_results")
+    if rows:
+        df = pd.DataFrame(rows, columns=BULK_COLUMNS)
+        counts = df["Status"].value_counts()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Found", int(counts.get("Found", 0)))
+        col2.metric("Not found", int(counts.get("Not found", 0)))
+        col3.metric("Errors", int(counts.get("Error", 0)))
+        col4.metric("Invalid input", int(counts.get("Invalid input", 0)))
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        display_export_buttons(rows, "device_bulk_lookup", key_prefix="bulk_lookup")
@@ -4,7 +4,12 @@ import streamlit as st
 import json
 
 import pandas as pd
-from typing import List, Dict
+from typing import List
+
+from utils import NETWORK_STATUSES, combine_network_frames, fetch_networks_by_status, get_snapshot_store
+
+# The inventory view reuses mirrored statuses refreshed within this many seconds
+INVENTORY_MAX_AGE = 300
 
 
 def show():
@@ -17,6 +22,7 @@ def show():
             <div style='display:flex;flex-wrap:wrap;gap:0.6rem;margin-top:1rem;'>
                 <span class='tauc-chip'>All statuses</span>
                 <span class='tauc-chip'>Real-time lookups</span>
+                <span class='tauc-chip'>Change tracking</span>
                 <span class='tauc-chip'>CSV / JSON export</span>
             </div>
         </div>
@@ -27,7 +33,7 @@ def show():
     st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
 
     # Tab layout
-    tab1, tab2 = st.tabs(["All Inventory", "NAT-Locked Devices"])
+    tab1, tab2, tab3 = st.tabs(["All Inventory", "NAT-Locked Devices", "Changes"])
 
     with tab1:
         show_all_inventory()
@@ -35,6 +41,9 @@ def show():
     with tab2:
         show_nat_locked_inventory()
 
+    with tab3:
+        show_inventory_changes()
+
 
 def show_all_inventory():
     """Display all inventory using GetNetworkNameListV2."""
@@ -43,12 +52,17 @@ def show_all_inventory():
     col1, col2, col3 = st.columns([2, 2, 1])
 
     with col1:
-        page_size = st.selectbox("Page Size", [25, 50, 100], index=0, help="Maximum results per status")
+        page_size = st.selectbox(
+            "Page Size",
+            ["Auto", 100, 200, 500, 1000],
+            index=0,
+            help="Results per request (all pages are fetched; Auto uses the largest size the API accepts)"
+        )
 
     with col2:
         status_filter = st.selectbox(
             "Status Filter",
-            ["ALL", "ONLINE", "OFFLINE", "ABNORMAL", "INVENTORY", "NAT-LOCKED", "SUSPEND"],
+            ["ALL"] + NETWORK_STATUSES,
             index=0,
             help="Filter by network status"
         )
@@ -58,63 +72,55 @@ def show_all_inventory():
         st.write("")  # Spacing
         fetch_button = st.button("Fetch Inventory", type="primary", key="fetch_all")
 
+    refresh = st.checkbox(
+        "Refresh from API",
+        value=False,
+        key="refresh_all_inventory",
+        help=f"Otherwise statuses refreshed in the last {INVENTORY_MAX_AGE // 60} minutes are read from the local mirror"
+    )
+
     if fetch_button:
         try:
-            from tauc_openapi.models import GetNetworkNameListV2Request, GetNetworkNameListV2Response
-
             # Show endpoint info
             endpoint = "/v1/openapi/network-system-management/network-name-list"
             st.code(f"📡 Endpoint: GET {endpoint}", language="")
 
             # Determine which statuses to query
             if status_filter == "ALL":
-                statuses_to_query = ["ONLINE", "OFFLINE", "ABNORMAL", "INVENTORY", "NAT-LOCKED", "SUSPEND"]
+                statuses_to_query = NETWORK_STATUSES
             else:
                 statuses_to_query = [status_filter]
 
-            all_networks = {}  # Use dict to avoid duplicates: {id: network_data}
-            total_fetched = 0
-            all_responses = []  # Store all API responses for display
-
             with st.spinner("Fetching all networks..."):
-                for status in statuses_to_query:
-                    st.caption(f"🔍 Querying {status} networks...")
-
-                    # API uses zero-indexed pages (page=0 for first page)
-                    request = GetNetworkNameListV2Request(
-                        page="0",
-                        pageSize=str(page_size),
-                        networkStatus=status
-                    )
-
-                    response = st.session_state.client.api_call(
-                        request,
-                        GetNetworkNameListV2Response,
-                        st.session_state.access_token
-                    )
-
-                    # Store response for viewing
-                    all_responses.append({
-                        "status": status,
-                        "response": response
-                    })
-
-                    if response.is_success() and response.result and response.result.data:
-                        count = len(response.result.data)
-                        st.caption(f"  ✅ Found {count} {status} network(s)")
-                        total_fetched += count
-
-                        # Add to combined results (using ID as key to avoid duplicates)
-                        for network in response.result.data:
-                            if network.id:
-                                all_networks[network.id] = {
-                                    "id": network.id,
-                                    "name": network.network_name or "Unnamed",
-                                    "status": status
-                                }
+                # All statuses are queried concurrently, every page of each;
+                # recently refreshed statuses are read from the local mirror
+                fetched = fetch_networks_by_status(
+                    statuses_to_query,
+                    None if page_size == "Auto" else page_size,
+                    None if refresh else INVENTORY_MAX_AGE
+                )
+                if fetched is None:
+                    return
+
+                all_responses = []  # First page of each status, for display
+                for summary in fetched["statuses"]:
+                    status = summary.status
+                    if summary.error:
+                        st.caption(f"  ⚠️ {status}: {summary.error}")
+                    elif summary.count:
+                        source = "local mirror" if summary.cached else "API"
+                        st.caption(f"  ✅ Found {summary.count} {status} network(s) ({source})")
                     else:
                         st.caption(f"  ℹ️ No {status} networks")
 
+                    if summary.response is not None:
+                        all_responses.append({
+                            "status": status,
+                            "response": summary.response
+                        })
+
+                all_networks = fetched["networks"]
+
                 st.markdown(
                     f"""
                     <div class='tauc-status-card' style='text-align:left; margin-bottom:1.4rem;'>
@@ -125,14 +131,14 @@ def show_all_inventory():
                     unsafe_allow_html=True,
                 )
 
-                if all_networks:
+                if len(all_networks):
                     display_network_list_results(all_networks, status_filter, endpoint, all_responses)
                 else:
                     st.markdown(
                         """
                         <div class='tauc-notification'>
                             <div class='tauc-notification__title'>No networks found</div>
-                            <div class='tauc-notification__meta'>Adjust your status filter or page size to broaden the search.</div>
+                            <div class='tauc-notification__meta'>Adjust your status filter to broaden the search.</div>
                         </div>
                         """,
                         unsafe_allow_html=True,
@@ -193,7 +199,6 @@ def show_nat_locked_inventory():
             endpoint = "/v1/openapi/network-system-management/network-name-list"
             st.code(f"📡 Endpoint: GET {endpoint}?networkStatus=NAT-LOCKED", language="")
 
-            all_networks = {}
             all_responses = []
 
             with st.spinner("Fetching NAT-locked networks..."):
@@ -216,8 +221,9 @@ def show_nat_locked_inventory():
                     "response": response
                 })
 
-                if response.is_success() and response.result and response.result.data:
-                    count = len(response.result.data)
+                frame = response.as_frame() if response.is_success() else None
+                if frame is not None and len(frame):
+                    count = len(frame)
                     st.markdown(
                         f"""
                         <div class='tauc-status-card' style='text-align:left; margin-bottom:1.4rem;'>
@@ -228,14 +234,8 @@ def show_nat_locked_inventory():
                         unsafe_allow_html=True,
                     )
 
-                    # Add to results
-                    for network in response.result.data:
-                        if network.id:
-                            all_networks[network.id] = {
-                                "id": network.id,
-                                "name": network.network_name or "Unnamed",
-                                "status": "NAT-LOCKED"
-                            }
+                    frame["status"] = "NAT-LOCKED"
+                    all_networks = combine_network_frames([frame])
 
                     display_network_list_results(all_networks, "NAT-LOCKED", endpoint, all_responses)
                 else:
@@ -268,8 +268,8 @@ def show_nat_locked_inventory():
             st.error(f"Failed to fetch NAT-locked inventory: {str(e)}")
 
 
-def display_network_list_results(all_networks: Dict, status_filter: str, endpoint: str, all_responses: List = None):
-    """Display network list results in a formatted way."""
+def display_network_list_results(all_networks: pd.DataFrame, status_filter: str, endpoint: str, all_responses: List = None):
+    """Display network list results (columns: id, network_name, status) in a formatted way."""
 
     st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
 
@@ -300,19 +300,12 @@ def display_network_list_results(all_networks: Dict, status_filter: str, endpoin
 
     st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
 
-    # Convert dict to list for display
-    networks_list = list(all_networks.values())
-
-    # Create DataFrame for display
-    df_data = []
-    for network in networks_list:
-        df_data.append({
-            "Network ID": network["id"],
-            "Network Name": network["name"],
-            "Status": network["status"]
-        })
-
-    df = pd.DataFrame(df_data)
+    # Display columns come straight from the columnar result
+    df = pd.DataFrame({
+        "Network ID": all_networks["id"],
+        "Network Name": all_networks["network_name"].fillna("Unnamed"),
+        "Status": all_networks["status"],
+    })
 
     # Display table
     st.dataframe(df, use_container_width=True, hide_index=True)
@@ -333,9 +326,9 @@ def display_network_list_results(all_networks: Dict, status_filter: str, endpoin
         )
 
     with col2:
-        import json
-
-        json_data = json.dumps(networks_list, indent=2)
+        json_data = df.rename(columns={
+            "Network ID": "id", "Network Name": "name", "Status": "status"
+        }).to_json(orient="records", indent=2)
         st.download_button(
             label="⬇️ Download JSON",
             data=json_data,
@@ -350,34 +343,141 @@ def display_network_list_results(all_networks: Dict, status_filter: str, endpoin
         with st.expander("🔍 View Raw API Responses"):
             for resp_data in all_responses:
                 st.markdown(f"### Status: {resp_data['status']}")
-                st.code(f"Endpoint: GET {endpoint}?page=0&pageSize=25&networkStatus={resp_data['status']}", language="")
+                st.code(f"Endpoint: GET {endpoint}?page=0&networkStatus={resp_data['status']} (first page)", language="")
 
                 response = resp_data['response']
 
-                # Build JSON response structure
-                response_json = {
+                # Raw JSON as received (no per-network objects needed)
+                st.json(response.get_raw_json() or {
                     "errorCode": response.error_code,
                     "msg": response.msg,
-                }
-
-                if response.result:
-                    result_data = {
-                        "total": response.result.total,
-                        "page": response.result.page,
-                        "pageSize": response.result.page_size,
-                        "data": []
-                    }
-
-                    if response.result.data:
-                        for network in response.result.data:
-                            result_data["data"].append({
-                                "id": network.id,
-                                "networkName": network.network_name
-                            })
+                    "result": None
+                })
+                st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
 
-                    response_json["result"] = result_data
-                else:
-                    response_json["result"] = None
 
-                st.json(response_json)
-                st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
+# Changes listed in the table (the summary counts every change)
+CHANGES_DISPLAY_LIMIT = 5000
+
+# Snapshots kept by default; older ones are pruned after each new snapshot
+SNAPSHOT_KEEP = 30
+
+CHANGE_LABELS = {
+    "networks_added": "➕ Networks added",
+    "networks_removed": "➖ Networks removed",
+    "renamed": "✏️ Renamed",
+    "status_changed": "🔄 Status changed",
+    "units_added": "➕ Mesh units added",
+    "units_removed": "➖ Mesh units removed",
+    "units_moved": "🔀 Mesh units moved",
+    "units_changed": "✏️ Mesh units changed",
+}
+
+
+def show_inventory_changes():
+    """Take inventory snapshots and show what changed between two of them."""
+    import datetime
+    from utils.ui_components import display_export_buttons
+
+    st.subheader("Inventory Changes")
+
+    st.markdown(
+        """
+        <div class='tauc-notification'>
+            <div class='tauc-notification__title'>Snapshots and diffs</div>
+            <div class='tauc-notification__meta'>A snapshot records every network (name, status) and every inventory mesh unit. Compare two snapshots to see new and deleted networks, renames, status flips and mesh units that moved.</div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    store = get_snapshot_store()
+    if store is None:
+        st.error("Not authenticated. Please login first.")
+        return
+
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        label = st.text_input("Snapshot label (optional)", key="snapshot_label", placeholder="e.g., before maintenance")
+    with col2:
+        keep = st.number_input("Keep newest", min_value=2, max_value=1000, value=SNAPSHOT_KEEP, key="snapshot_keep",
+                               help="Older snapshots are deleted after each new snapshot")
+    with col3:
+        st.write("")
+        st.write("")
+        take_button = st.button("Take Snapshot", type="primary", key="snapshot_take", use_container_width=True)
+
+    if take_button:
+        try:
+            with st.spinner("Listing networks and inventory..."):
+                info = store.take(label=label or None, access_token=st.session_state.access_token)
+                pruned = store.prune(keep=int(keep))
+            message = f"✓ Snapshot #{info.id}: {info.networks:,} networks, {info.mesh_units:,} mesh units"
+            if pruned:
+                message += f" ({pruned:,} older snapshots deleted)"
+            if info.complete:
+                st.success(message)
+            else:
+                st.warning(message + " (some listings failed; missing records will show as removed)")
+        except Exception as e:
+            st.error(f"Snapshot error: {str(e)}")
+
+    snapshots = store.list_snapshots()
+    if len(snapshots) < 2:
+        st.info("Take at least two snapshots (e.g. one per day) to compare them.")
+        return
+
+    def describe(info) -> str:
+        taken = datetime.datetime.fromtimestamp(info.taken_at).strftime("%Y-%m-%d %H:%M")
+        suffix = f" – {info.label}" if info.label else ""
+        return f"#{info.id} {taken}{suffix} ({info.networks:,} networks)"
+
+    # Default: newest snapshot against the newest one at least a day older
+    newest = snapshots[0]
+    day_before = store.latest(before=newest.taken_at - 86400) or snapshots[1]
+    ids = [info.id for info in snapshots]
+    by_id = {info.id: info for info in snapshots}
+
+    col1, col2 = st.columns(2)
+    with col1:
+        old_id = st.selectbox("From snapshot", ids, index=ids.index(day_before.id),
+                              format_func=lambda i: describe(by_id[i]), key="snapshot_old")
+    with col2:
+        new_id = st.selectbox("To snapshot", ids, index=0,
+                              format_func=lambda i: describe(by_id[i]), key="snapshot_new")
+
+    if st.button("Compare", key="snapshot_compare"):
+        if old_id == new_id:
+            st.warning("Select two different snapshots")
+            return
+        if by_id[old_id].taken_at > by_id[new_id].taken_at:
+            old_id, new_id = new_id, old_id
+
+        counts = {}
+        rows = []
+        for change in store.diff(old_id, new_id):
+            counts[change.category] = counts.get(change.category, 0) + 1
+            if len(rows) < CHANGES_DISPLAY_LIMIT:
+                old, new = change.old or {}, change.new or {}
+                rows.append({
+                    "Change": CHANGE_LABELS[change.category],
+                    "Type": "Network" if change.kind == "network" else "Mesh unit",
+                    "Key": str(change.key),
+                    "Before": ", ".join(f"{k}={old[k]}" for k in (change.fields or old) if k != "key" and old.get(k) is not None),
+                    "After": ", ".join(f"{k}={new[k]}" for k in (change.fields or new) if k != "key" and new.get(k) is not None),
+                })
+
+        if not counts:
+            st.success("No changes between these snapshots")
+            return
+
+        columns = st.columns(4)
+        for position, (category, label_text) in enumerate(CHANGE_LABELS.items()):
+            columns[position % 4].metric(label_text, f"{counts.get(category, 0):,}")
+
+        total = sum(counts.values())
+        if total > len(rows):
+            st.caption(f"Showing the first {len(rows):,} of {total:,} changes")
+        df = pd.DataFrame(rows)
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        display_export_buttons(rows, f"inventory_changes_{old_id}_{new_id}", key_prefix="snapshot_changes")
@@ -2,18 +2,46 @@
 
 import streamlit as st
 import json
+from typing import Optional
+
+from utils import (
+    LOOKUP_MAX_AGE,
+    crawl_inventory_details,
+    get_inventory_index,
+    get_inventory_mirror,
+    get_status_sweeper,
+    refresh_inventory,
+)
 
 
 def lookup_network_id(network_name: str) -> tuple[str, str]:
     """
     Look up network ID by network name.
 
+    The inventory index answers without an API call; names it does not
+    know (e.g. networks added elsewhere since it was loaded) are looked up
+    with GetNetworkId and added to it.
+
     Returns:
         tuple: (network_id, error_message) - network_id is None if lookup failed
     """
     try:
         from tauc_openapi.models.network_system_management import GetNetworkIdRequest, GetNetworkIdResponse
 
+        index = get_inventory_index()
+        if index is not None:
+            if index.expired:
+                refresh_inventory(max_age=LOOKUP_MAX_AGE)
+            matches = index.find_by_name(network_name)
+            if len(matches) == 1:
+                st.caption(f"📇 Found in inventory index: {matches[0]['name']} (ID: {matches[0]['id']})")
+                return str(matches[0]["id"]), None
+            if matches:
+                st.warning(f"Multiple networks match '{network_name}':")
+                for item in matches:
+                    st.write(f"  - {item['name']} (ID: {item['id']})")
+                return None, "Multiple matches found. Please be more specific."
+
         # Show endpoint being called
         endpoint = f"/v1/openapi/network-system-management/id?networkName={network_name}"
         st.caption(f"📡 Calling: GET {endpoint}")
@@ -29,6 +57,8 @@ def lookup_network_id(network_name: str) -> tuple[str, str]:
             if len(response.result) == 0:
                 return None, f"Network '{network_name}' not found"
             elif len(response.result) == 1:
+                if index is not None:
+                    index.add_network(response.result[0].id, response.result[0].networkName)
                 return str(response.result[0].id), None
             else:
                 # Multiple matches, let user choose
@@ -43,6 +73,13 @@ def lookup_network_id(network_name: str) -> tuple[str, str]:
         return None, f"Error looking up network ID: {str(e)}"
 
 
+def update_indexed_status(network_id: str, status: Optional[str]):
+    """Record a network's new status in the inventory index."""
+    index = get_inventory_index()
+    if index is not None:
+        index.set_status(int(network_id), status)
+
+
 def show():
     """Show network management page."""
     st.markdown(
@@ -54,6 +91,8 @@ def show():
                 <span class='tauc-chip'>NAT control</span>
                 <span class='tauc-chip'>Status insights</span>
                 <span class='tauc-chip'>Detailed metadata</span>
+                <span class='tauc-chip'>Fleet topology</span>
+                <span class='tauc-chip'>Outage monitoring</span>
             </div>
         </div>
         """,
@@ -63,7 +102,9 @@ def show():
     st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
 
     # Tab layout
-    tab1, tab2, tab3 = st.tabs(["NAT Control", "Network Status", "Network Details"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        ["NAT Control", "Network Status", "Network Details", "Fleet Topology", "Fleet Status (NOC)"]
+    )
 
     with tab1:
         show_nat_control()
@@ -74,6 +115,12 @@ def show():
     with tab3:
         show_network_details()
 
+    with tab4:
+        show_fleet_topology()
+
+    with tab5:
+        show_fleet_status()
+
 
 def show_nat_control():
     """NAT lock/unlock control panel."""
@@ -162,6 +209,7 @@ def lock_nat(network_id: str, network_name: str):
 
             if response.is_success():
                 st.success(f"✓ Successfully locked NAT for '{network_name}' (ID: {network_id})")
+                update_indexed_status(network_id, "NAT-LOCKED")
 
                 # Show raw JSON response
                 with st.expander("🔍 View Raw JSON Response"):
@@ -200,6 +248,8 @@ def unlock_nat(network_id: str, network_name: str):
 
             if response.is_success():
                 st.success(f"✓ Successfully unlocked NAT for '{network_name}' (ID: {network_id})")
+                # The status after unlocking is only known from the next listing
+                update_indexed_status(network_id, None)
 
                 # Show raw JSON response
                 with st.expander("🔍 View Raw JSON Response"):
@@ -372,6 +422,11 @@ def get_network_details(network_id: str, network_name: str):
                 if response.result and hasattr(response.result, 'network'):
                     network = response.result.network
 
+                    # Keep the mirror's copy current for fleet queries
+                    mirror = get_inventory_mirror()
+                    if mirror is not None and network and str(network_id).isdigit():
+                        mirror.store_details(int(network_id), network)
+
                     # Network Information
                     st.markdown("### 🌐 Network Information")
 
@@ -468,3 +523,248 @@ def get_network_details(network_id: str, network_name: str):
 
     except Exception as e:
         st.error(f"Error getting details: {str(e)}")
+
+
+def show_fleet_topology():
+    """Crawl every network's details and query the fleet's devices, roles and tags locally."""
+    import pandas as pd
+
+    st.subheader("Fleet Topology")
+
+    st.markdown(
+        """
+        <div class='tauc-notification'>
+            <div class='tauc-notification__title'>Local fleet queries</div>
+            <div class='tauc-notification__meta'>The crawl fetches network details (mesh units and tags) and device models for every network, rate limited, into the local inventory mirror. An interrupted crawl resumes where it stopped. Queries below read the mirror with no API calls.</div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    mirror = get_inventory_mirror()
+    if mirror is None:
+        st.error("Not authenticated. Please login first.")
+        return
+
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        max_age_hours = st.number_input(
+            "Keep details fetched within (hours)", min_value=0, max_value=168, value=24,
+            key="crawl_max_age", help="0 refetches every network"
+        )
+    with col2:
+        rate = st.number_input("Requests per second", min_value=1, max_value=100, value=10, key="crawl_rate")
+    with col3:
+        st.write("")
+        crawl_button = st.button("Crawl Details", type="primary", key="crawl_button", use_container_width=True)
+
+    if crawl_button:
+        progress = st.progress(0.0, text="Listing networks...")
+
+        def report(done: int, total: int):
+            if done % 50 == 0 or done == total:
+                progress.progress(done / total, text=f"Fetched {done:,} of {total:,} networks...")
+
+        try:
+            result = crawl_inventory_details(max_age=max_age_hours * 3600 or None, rate=float(rate), progress=report)
+            progress.progress(1.0, text=f"Crawl complete in {result.elapsed:.1f}s")
+            resumed = " (resumed)" if result.resumed else ""
+            st.success(
+                f"✓ Crawled {result.fetched:,} of {result.total:,} networks{resumed}: "
+                f"{result.changed:,} changed, {result.devices:,} device models fetched"
+            )
+            if result.failed or result.failed_devices:
+                st.warning(
+                    f"{len(result.failed):,} network details and {len(result.failed_devices):,} device info "
+                    "requests failed; the next crawl retries them."
+                )
+                with st.expander("Failed requests"):
+                    failed = {f"network {key}": error for key, error in result.failed.items()}
+                    failed.update({f"device {key}": error for key, error in result.failed_devices.items()})
+                    st.json(dict(list(failed.items())[:200]))
+        except Exception as e:
+            st.error(f"Crawl error: {str(e)}")
+
+    st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Mesh units by topology role**")
+        roles = mirror.topo_role_counts()
+        if roles:
+            st.dataframe(
+                pd.DataFrame({"Role": [r or "N/A" for r in roles], "Mesh Units": list(roles.values())}),
+                use_container_width=True, hide_index=True
+            )
+        else:
+            st.info("No details crawled yet")
+    with col2:
+        st.markdown("**Mesh units by model**")
+        models = mirror.model_counts()
+        if models:
+            st.dataframe(
+                pd.DataFrame({"Model": [m or "Unknown" for m in models], "Mesh Units": list(models.values())}),
+                use_container_width=True, hide_index=True
+            )
+
+    tags = mirror.tag_counts()
+    if tags:
+        with st.expander(f"Tags ({len(tags):,})"):
+            st.dataframe(pd.DataFrame(tags), use_container_width=True, hide_index=True)
+
+    st.markdown("### 🔎 Find Devices")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        sn = st.text_input("Serial Number", key="fleet_sn")
+    with col2:
+        mac = st.text_input("MAC Address", key="fleet_mac")
+    with col3:
+        model = st.text_input("Model", key="fleet_model")
+    with col4:
+        role = st.selectbox("Topology Role", ["Any", "MASTER", "SLAVE", "INACTIVE"], key="fleet_role")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        tag_name = st.text_input("Tag Name", key="fleet_tag_name")
+    with col2:
+        tag_value = st.text_input("Tag Value (optional)", key="fleet_tag_value")
+
+    if st.button("Search Fleet", key="fleet_search"):
+        role = None if role == "Any" else role
+        if sn or mac or model or role:
+            units = mirror.find_mesh_units(sn=sn or None, mac=mac or None, model=model or None, topo_role=role)
+            st.caption(f"{len(units):,} mesh units in {len({u['network_id'] for u in units}):,} networks")
+            if units:
+                st.dataframe(pd.DataFrame(units), use_container_width=True, hide_index=True)
+        if tag_name:
+            networks = mirror.find_by_tag(tag_name, tag_value or None)
+            st.caption(f"{len(networks):,} networks tagged {tag_name}{'=' + tag_value if tag_value else ''}")
+            if networks:
+                st.dataframe(pd.DataFrame(networks), use_container_width=True, hide_index=True)
+        if not (sn or mac or model or role or tag_name):
+            st.info("Enter a serial number, MAC, model, role or tag to search.")
+
+
+# Listing statuses swept by default (GetNetworkStatus reports these)
+SWEEP_STATUSES = ["ONLINE", "OFFLINE", "ABNORMAL"]
+
+
+def show_fleet_status():
+    """Sweep network statuses across the fleet and show outages and status changes."""
+    import datetime
+    import pandas as pd
+    from utils import NETWORK_STATUSES
+
+    st.subheader("Fleet Status (NOC)")
+
+    st.markdown(
+        """
+        <div class='tauc-notification'>
+            <div class='tauc-notification__title'>Status sweeps</div>
+            <div class='tauc-notification__meta'>Checks GetNetworkStatus for every network with the selected listing statuses, concurrently and rate limited, and reports only the networks whose status changed. Auto-sweep keeps running in the background while you use other pages.</div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        statuses = st.multiselect("Networks to sweep (listing status)", NETWORK_STATUSES, default=SWEEP_STATUSES, key="sweep_statuses")
+    with col2:
+        interval = st.number_input("Auto-sweep every (min)", min_value=1, max_value=1440, value=5, key="sweep_interval")
+    with col3:
+        rate = st.number_input("Requests per second", min_value=1, max_value=100, value=20, key="sweep_rate")
+
+    sweeper = get_status_sweeper(track=False)
+    running = sweeper is not None and sweeper.running
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        sweep_button = st.button("Sweep Now", type="primary", key="sweep_now", use_container_width=True, disabled=not statuses)
+    with col2:
+        start_button = st.button(
+            "Restart Auto-Sweep" if running else "Start Auto-Sweep", key="sweep_start",
+            use_container_width=True, disabled=not statuses
+        )
+    with col3:
+        stop_button = st.button("Stop Auto-Sweep", key="sweep_stop", use_container_width=True, disabled=not running)
+
+    if sweep_button or start_button:
+        try:
+            with st.spinner("Loading networks..."):
+                sweeper = get_status_sweeper(statuses)
+            sweeper.set_rate(float(rate))
+            if start_button:
+                sweeper.start(interval * 60)
+                st.success(f"✓ Auto-sweep of {len(sweeper):,} networks every {interval} min started")
+            else:
+                with st.spinner(f"Sweeping {len(sweeper):,} networks..."):
+                    result = sweeper.sweep()
+                st.success(
+                    f"✓ Checked {result.checked:,} networks in {result.elapsed:.1f}s: "
+                    f"{len(result.changes):,} status changes"
+                )
+                if result.failed:
+                    st.warning(f"{len(result.failed):,} status requests failed; their last known status is kept.")
+        except Exception as e:
+            st.error(f"Sweep error: {str(e)}")
+
+    if stop_button and sweeper is not None:
+        sweeper.stop()
+        st.info("Auto-sweep stopped")
+
+    if sweeper is None or not len(sweeper):
+        st.info("No sweep yet. Select the networks to watch and press Sweep Now.")
+        return
+
+    st.markdown("<div class='tauc-divider'></div>", unsafe_allow_html=True)
+
+    counts = sweeper.counts()
+    last = sweeper.last_sweep
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("🟢 Online", f"{counts.get('ONLINE', 0):,}")
+    col2.metric("🔴 Offline", f"{counts.get('OFFLINE', 0):,}")
+    col3.metric("🟡 Abnormal", f"{counts.get('ABNORMAL', 0):,}")
+    col4.metric("Tracked", f"{len(sweeper):,}")
+    if sweeper.last_sweep_at:
+        swept = datetime.datetime.fromtimestamp(sweeper.last_sweep_at).strftime("%H:%M:%S")
+        state = "auto-sweep running" if sweeper.running else "auto-sweep off"
+        if last.stopped:
+            state = f"stopped early, {state}"
+        st.caption(f"Last sweep {swept}: {last.checked:,} checked in {last.elapsed:.1f}s, {len(last.failed):,} failed ({state})")
+
+    mirror = get_inventory_mirror()
+
+    def network_name(network_id: int) -> str:
+        network = mirror.get_network(network_id) if mirror is not None else None
+        return network["name"] if network else ""
+
+    changes = sweeper.recent_changes()
+    st.markdown("### 🔔 Status Changes")
+    if changes:
+        st.dataframe(
+            pd.DataFrame([{
+                "Time": datetime.datetime.fromtimestamp(change.at).strftime("%Y-%m-%d %H:%M:%S"),
+                "Network ID": change.network_id,
+                "Network Name": network_name(change.network_id),
+                "From": change.old_status,
+                "To": change.new_status,
+            } for change in changes[:200]]),
+            use_container_width=True, hide_index=True
+        )
+    else:
+        st.info("No status changes seen yet")
+
+    outages = sweeper.networks_with_status("OFFLINE") + sweeper.networks_with_status("ABNORMAL")
+    st.markdown(f"### 🚨 Current Outages ({len(outages):,})")
+    if outages:
+        st.dataframe(
+            pd.DataFrame([{
+                "Network ID": network_id,
+                "Network Name": network_name(network_id),
+                "Status": sweeper.status_of(network_id),
+            } for network_id in outages[:500]]),
+            use_container_width=True, hide_index=True
+        )
+        if len(outages) > 500:
+            st.caption(f"Showing 500 of {len(outages):,}")
@@ -3,7 +3,7 @@
 import streamlit as st
 import json
 import time
-from utils import normalize_mac_address, validate_mac_address
+from utils import forget_networks, get_inventory_index, normalize_mac_address, refresh_inventory, validate_mac_address
 
 
 def show():
@@ -233,6 +233,11 @@ def add_network(network_name, mesh_units, pre_config):
         if response.is_success():
             st.success(f"✓ Network created successfully! Network ID: {response.result.id}")
 
+            # Make the new network findable by name right away
+            index = get_inventory_index()
+            if index is not None and response.result.id:
+                index.add_network(response.result.id, network_name)
+
             if response.result.failed_mesh_unit_list:
                 st.warning("Device registration failed:")
                 for unit in response.result.failed_mesh_unit_list:
@@ -614,73 +619,71 @@ def show_delete_networks():
 def lookup_and_delete_networks(network_names):
     """Lookup network IDs by name and delete networks."""
     try:
-        from tauc_openapi.models import GetNetworkNameListV2Request, GetNetworkNameListV2Response
-
-        # Fetch all networks using GetNetworkNameListV2
-        # Strategy: Try without networkStatus first, if that fails due to validation,
-        # try with each known status value
-        all_networks = {}  # Use dict to avoid duplicates: {id: network}
-
+        # Refresh all networks using GetNetworkNameListV2: every status at once, all pages
+        # (always from the API, since the IDs found are deleted)
         with st.spinner("Fetching all networks..."):
-            # API uses zero-indexed pages (page=0 for first page)
-            # Try each known status value to get all networks
-            network_statuses = ["ONLINE", "OFFLINE", "ABNORMAL", "INVENTORY"]
-
-            for status in network_statuses:
-                request = GetNetworkNameListV2Request(page="0", pageSize="100", networkStatus=status)
-
-                # Debug: Show exact request parameters
-                st.caption(f"📡 Fetching {status} networks...")
-                st.caption(f"   URL: {request.get_url()}")
-                st.caption(f"   Params: page={request.page}, pageSize={request.pageSize}, networkStatus={request.networkStatus}")
-
-                response = st.session_state.client.api_call(
-                    request,
-                    GetNetworkNameListV2Response,
-                    st.session_state.access_token
-                )
+            summaries = refresh_inventory()
+            if summaries is None:
+                st.error("Not authenticated. Please login first.")
+                return
+
+            for summary in summaries:
+                status = summary.status
+                response = summary.response
 
                 # Debug: Show response
-                st.caption(f"   Response: error_code={response.error_code}, msg={response.msg}")
-                if response.result:
-                    st.caption(f"   Result: total={response.result.total}, page={response.result.page}, data_count={len(response.result.data) if response.result.data else 0}")
-
-                if response.is_success() and response.result and response.result.data:
-                    st.caption(f"✓ Found {len(response.result.data)} {status} networks")
-                    for network in response.result.data:
-                        if network.id:
-                            all_networks[network.id] = network
-                elif not response.is_success() and response.error_code != -70301:
-                    # -70301 means "Network does not exist" which is OK (no networks with that status)
-                    # Other errors should be reported
-                    st.warning(f"Error fetching {status} networks: {response.msg} (Code: {response.error_code})")
-
-        if not all_networks:
-            st.error("No networks found in the system!")
+                st.caption(f"📡 {status} networks:")
+                if response is not None:
+                    st.caption(f"   Response: error_code={response.error_code}, msg={response.msg}")
+                    if response.result:
+                        st.caption(f"   Result: total={response.result.total}, data_count={summary.count}")
+                    st.caption(f"   Mirror: +{summary.added} added, {summary.updated} updated, -{summary.removed} removed")
+
+                if summary.error:
+                    # -70301 ("Network does not exist") is already treated as an empty status
+                    st.warning(f"Error fetching {status} networks: {summary.error}")
+                elif summary.count:
+                    st.caption(f"✓ Found {summary.count} {status} networks")
+
+        # A failed listing leaves that status's previous names in the mirror;
+        # a network renamed since could still match its old name, so never
+        # delete by name without a complete, current listing
+        failed_statuses = [summary.status for summary in summaries if summary.error]
+        if failed_statuses:
+            st.error(
+                f"Could not list {', '.join(failed_statuses)} networks, so names cannot be matched "
+                "reliably. No networks were deleted; please try again."
+            )
             return
 
-        st.success(f"📊 Total networks found: {len(all_networks)}")
+        index = get_inventory_index()
+        if not len(index):
+            st.error("No networks found in the system!")
+            return
 
-        # Build name to ID mapping (case-insensitive)
-        name_to_network = {}
-        for network in all_networks.values():
-            if network.network_name:
-                name_to_network[network.network_name.lower()] = {
-                    "id": network.id,
-                    "name": network.network_name
-                }
+        st.success(f"📊 Total networks found: {len(index)}")
 
-        # Match requested names to networks
+        # Match requested names to networks (case-insensitive index lookups)
         matched_networks = []
         not_found = []
+        ambiguous = {}
 
         for requested_name in network_names:
-            requested_lower = requested_name.lower()
-            if requested_lower in name_to_network:
-                matched_networks.append(name_to_network[requested_lower])
+            matches = index.find_by_name(requested_name)
+            if len(matches) == 1:
+                matched_networks.append({"id": matches[0]["id"], "name": matches[0]["name"]})
+            elif matches:
+                ambiguous[requested_name] = matches
             else:
                 not_found.append(requested_name)
 
+        # Never guess which of several same-named networks to delete
+        if ambiguous:
+            st.error("The following names match several networks and were skipped:")
+            for name, matches in ambiguous.items():
+                ids = ", ".join(str(m["id"]) for m in matches)
+                st.error(f"  - {name} (IDs: {ids})")
+
         # Show results
         if not_found:
             st.error("The following networks were not found:")
@@ -746,6 +749,10 @@ def delete_networks(network_ids, network_details):
                 })
                 st.caption(f"   ❌ Failed: {response.msg}")
 
+        # Keep the local inventory mirror and index in step
+        failed_ids = {failure["id"] for failure in failed_deletions}
+        forget_networks([i for i in network_ids if i not in failed_ids])
+
         # Show summary
         if success_count > 0:
             st.success(f"✅ Successfully deleted {success_count} of {len(network_ids)} network(s)!")
@@ -7,9 +7,13 @@ Provides programmatic access to manage TP-Link network devices including routers
 Version: 1.8.3
 """
 
-from .execute.api_client import ApiClient
 from .base.exceptions import TAUCApiException
 from .base.client_type import ClientType
+from .base.lazy_loader import lazy_exports
+
+# ApiClient pulls in requests/urllib3; load it on first use so that
+# importing only the models stays cheap
+__getattr__, __dir__ = lazy_exports(__name__, {"ApiClient": ".execute.api_client"})
 
 __version__ = "1.8.3"
 __all__ = ["ApiClient", "TAUCApiException", "ClientType"]
@@ -5,6 +5,8 @@ from .tauc_response import TAUCResponse
 from .exceptions import TAUCApiException
 from .client_type import ClientType
 from .request_url_collection import RequestUrlCollection
+from .streaming_body import StreamingBody
+from .columnar import ColumnarResponseMixin
 
 __all__ = [
     "TAUCRequest",
@@ -12,4 +14,6 @@ __all__ = [
     "TAUCApiException",
     "ClientType",
     "RequestUrlCollection",
+    "StreamingBody",
+    "ColumnarResponseMixin",
 ]
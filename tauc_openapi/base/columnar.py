@@ -0,0 +1,89 @@
+"""Columnar (DataFrame) access to paginated list responses."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# (column name, JSON key, pandas dtype) - the column name doubles as the
+# attribute name on the decoded row objects
+ColumnSpec = Tuple[Tuple[str, str, str], ...]
+
+
+class ColumnarResponseMixin:
+    """
+    Mixin giving list responses a columnar view of ``result.data``.
+
+    Columns are built straight from the decoded JSON rows, one list per
+    column, without creating per-row result objects (``result`` is decoded
+    lazily, see TAUCResponse). If ``result`` has already been accessed, the
+    columns are read from the decoded objects instead.
+
+    Subclasses describe their columns with ``frame_columns``. Rows holding
+    a nested list (e.g. mesh units) can be flattened with ``frame_explode``
+    = (JSON key, attribute name, columns): one output row per nested item,
+    or a single row with empty nested columns when the list is empty.
+    """
+
+    frame_columns: ColumnSpec = ()
+    frame_explode: Optional[Tuple[str, str, ColumnSpec]] = None
+
+    def _frame_spec(self) -> ColumnSpec:
+        """Get all output columns, nested ones last."""
+        nested = self.frame_explode[2] if self.frame_explode else ()
+        return tuple(self.frame_columns) + tuple(nested)
+
+    def columns(self) -> Dict[str, List[Any]]:
+        """
+        Get the result rows as columns.
+
+        Returns:
+            Ordered dict of column name -> list of values
+        """
+        spec = self._frame_spec()
+        columns: Dict[str, List[Any]] = {name: [] for name, _, _ in spec}
+
+        if self._result_pending:
+            raw = self._result_data
+            rows = (raw.get("data") if isinstance(raw, dict) else None) or []
+            read = dict.get
+            keys = {name: key for name, key, _ in spec}
+        else:
+            rows = getattr(self.result, "data", None) or []
+            read = getattr
+            keys = {name: name for name, _, _ in spec}
+
+        if self.frame_explode is None:
+            for name, _, _ in self.frame_columns:
+                key = keys[name]
+                columns[name] = [read(row, key, None) for row in rows]
+            return columns
+
+        nested_key, nested_attr, nested_spec = self.frame_explode
+        list_key = nested_key if self._result_pending else nested_attr
+        outer = [(columns[name], keys[name]) for name, _, _ in self.frame_columns]
+        inner = [(columns[name], keys[name]) for name, _, _ in nested_spec]
+
+        for row in rows:
+            items = read(row, list_key, None) or [None]
+            for item in items:
+                for column, key in outer:
+                    column.append(read(row, key, None))
+                for column, key in inner:
+                    column.append(None if item is None else read(item, key, None))
+
+        return columns
+
+    def as_frame(self):
+        """
+        Get the result rows as a pandas DataFrame with typed columns.
+
+        Requires pandas (a dashboard dependency, not an SDK one).
+
+        Returns:
+            pandas.DataFrame (empty, with the expected columns, if no rows)
+        """
+        import pandas as pd
+
+        columns = self.columns()
+        return pd.DataFrame({
+            name: pd.array(columns[name], dtype=dtype)
+            for name, _, dtype in self._frame_spec()
+        })
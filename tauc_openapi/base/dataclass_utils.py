@@ -0,0 +1,44 @@
+"""Helpers for compact result dataclasses."""
+
+from dataclasses import dataclass, fields
+
+
+def slotted_dataclass(cls=None, *, frozen: bool = False):
+    """
+    Dataclass decorator that also gives the class ``__slots__``.
+
+    Slotted instances have no per-instance ``__dict__``, which matters for
+    high-cardinality result types (hundreds of thousands of networks and
+    mesh units when mirroring a fleet). Equivalent to
+    ``@dataclass(slots=True)`` on Python 3.10+, but works on 3.7+.
+
+    Note that slotted instances do not support ``vars()``; use
+    ``dataclasses.asdict()`` instead.
+
+    Args:
+        cls: Class to decorate (when used without arguments)
+        frozen: Make instances immutable
+
+    Returns:
+        Slotted dataclass (or decorator, when called with arguments)
+    """
+    def wrap(cls):
+        cls = dataclass(cls, frozen=frozen)
+        cls_dict = dict(cls.__dict__)
+        field_names = tuple(f.name for f in fields(cls))
+
+        # Defaults live in the generated __init__, so the class attributes
+        # holding them can be dropped to make room for the slot descriptors
+        for name in field_names:
+            cls_dict.pop(name, None)
+        cls_dict.pop('__dict__', None)
+        cls_dict.pop('__weakref__', None)
+        cls_dict['__slots__'] = field_names
+
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
@@ -0,0 +1,49 @@
+"""PEP 562 lazy attribute loading for SDK packages."""
+
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str],
+    submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    The defining module is only imported when one of its names is first
+    accessed; the value is then cached in the package namespace so later
+    lookups are plain attribute reads.
+
+    Usage (in a package ``__init__``)::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"Name": ".module"})
+
+    Args:
+        package: Package name (``__name__`` of the calling package)
+        exports: Exported name -> module path relative to the package
+        submodules: Subpackage/module names also reachable as attributes
+
+    Returns:
+        (__getattr__, __dir__) functions for the package
+    """
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> object:
+        module_path = exports.get(name)
+        if module_path is not None:
+            value = getattr(importlib.import_module(module_path, package), name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports) | submodules)
+
+    return __getattr__, __dir__
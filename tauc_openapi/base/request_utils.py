@@ -2,16 +2,24 @@
 
 import json
 import re
-from typing import Dict, Optional, Any, get_type_hints
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union, get_type_hints
 from urllib.parse import urlencode
 from dataclasses import fields, is_dataclass
 from .tauc_request import TAUCRequest
+from .streaming_body import StreamingBody
 from .exceptions import TAUCApiException
 
 
 class RequestUtils:
     """Utilities for processing request parameters."""
 
+    # Compact separators - the exact bytes sent on the wire are the bytes signed
+    JSON_SEPARATORS = (',', ':')
+
+    # Lists marked with metadata={'stream': True} are streamed from this many items
+    STREAM_MIN_ITEMS = 1000
+
     @staticmethod
     def process_path_variables(url: str, request: TAUCRequest) -> str:
         """
@@ -51,8 +59,11 @@ class RequestUtils:
         return result
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _to_camel_case(snake_str: str) -> str:
-        """Convert snake_case to camelCase."""
+        """Convert snake_case to camelCase (memoized - the key set is small and fixed)."""
+        if '_' not in snake_str:
+            return snake_str
         components = snake_str.split('_')
         return components[0] + ''.join(x.title() for x in components[1:])
 
@@ -122,7 +133,7 @@ class RequestUtils:
         return headers
 
     @staticmethod
-    def process_request_body(url: str, request: TAUCRequest) -> Optional[str]:
+    def process_request_body(url: str, request: TAUCRequest) -> Optional[Union[bytes, StreamingBody]]:
         """
         Serialize request body based on content type.
 
@@ -130,12 +141,19 @@ class RequestUtils:
         Matches Java SDK logic: fields without @TAUCRequestPath, @TAUCRequestQuery, @TAUCRequestHeader
         become part of the request body.
 
+        JSON bodies are encoded once in canonical compact form. The returned bytes
+        are used unchanged for both the Content-MD5 signature and the HTTP body.
+
+        When the only body field is a list marked with metadata={'stream': True}
+        and holds at least STREAM_MIN_ITEMS items, a StreamingBody is returned
+        instead, which encodes the items lazily (see StreamingBody).
+
         Args:
             url: Request URL (to identify path variables)
             request: Request object
 
         Returns:
-            Serialized request body (JSON string), or None if no body
+            Serialized request body (UTF-8 bytes or StreamingBody), or None if no body
         """
         content_type = request.get_content_type()
 
@@ -144,6 +162,7 @@ class RequestUtils:
                 return None
 
             body_dict = {}
+            stream_fields = set()
             has_explicit_body = False
 
             # First check if there's an explicit body field
@@ -152,7 +171,7 @@ class RequestUtils:
                     # Explicit body field - use only this
                     value = getattr(request, field.name, None)
                     if value is not None:
-                        return json.dumps(value, default=RequestUtils._json_serializer)
+                        return RequestUtils._encode_json(value)
                     has_explicit_body = True
 
             # No explicit body, build from non-path/query fields
@@ -179,11 +198,22 @@ class RequestUtils:
                 # Include in body if it's a complex type or explicitly not a simple query param
                 if not isinstance(value, (type(None), type)) and not callable(value):
                     body_dict[field.name] = value
+                    if field.metadata.get('stream'):
+                        stream_fields.add(field.name)
+
+            if len(body_dict) == 1 and stream_fields:
+                name, value = next(iter(body_dict.items()))
+                if isinstance(value, list) and len(value) >= RequestUtils.STREAM_MIN_ITEMS:
+                    return StreamingBody(
+                        RequestUtils._to_camel_case(name),
+                        value,
+                        RequestUtils._encode_item
+                    )
 
             if body_dict:
                 # Convert snake_case keys to camelCase before JSON serialization
                 camel_case_body = RequestUtils._to_camel_case_dict(body_dict)
-                return json.dumps(camel_case_body, default=RequestUtils._json_serializer)
+                return RequestUtils._encode_json(camel_case_body)
 
             return None
 
@@ -214,46 +244,108 @@ class RequestUtils:
                     # Convert to string (form data is always strings)
                     form_dict[field.name] = str(value)
 
-            return urlencode(form_dict) if form_dict else None
+            return urlencode(form_dict).encode('utf-8') if form_dict else None
 
         return None
 
+    @staticmethod
+    def _encode_json(value: Any) -> bytes:
+        """Encode value as canonical compact JSON bytes."""
+        return json.dumps(
+            value,
+            default=RequestUtils._json_serializer,
+            separators=RequestUtils.JSON_SEPARATORS
+        ).encode('utf-8')
+
+    @staticmethod
+    def _encode_item(item: Any) -> bytes:
+        """Encode one list item as it would appear inside a non-streamed body."""
+        if isinstance(item, (dict, list)) or (is_dataclass(item) and not isinstance(item, type)):
+            item = RequestUtils._convert_tree(item)
+        return RequestUtils._encode_json(item)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _dataclass_keys(cls: type) -> Tuple[Tuple[str, str], ...]:
+        """Get (field name, camelCase key) pairs for a dataclass type (memoized per class)."""
+        return tuple((f.name, RequestUtils._to_camel_case(f.name)) for f in fields(cls))
+
     @staticmethod
     def _to_camel_case_dict(snake_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert dictionary with snake_case keys to camelCase keys, filtering out None values."""
-        camel_dict = {}
-        for key, value in snake_dict.items():
-            # Skip None values - Java SDK doesn't send null fields
-            if value is None:
+        """
+        Convert dictionary with snake_case keys to camelCase keys, filtering out None values.
+
+        Nested dicts, lists and dataclasses are converted with an explicit stack
+        rather than recursion, so deep or very wide bodies (thousands of
+        networks with mesh units and tags) convert in a single linear pass.
+        Dataclass fields are read directly, without building a snake_case dict.
+
+        Nested dicts that are empty after filtering are dropped; dataclasses are
+        always kept (serialized as {} when all fields are None).
+        """
+        return RequestUtils._convert_tree(snake_dict)
+
+    @staticmethod
+    def _convert_tree(root: Any) -> Union[Dict[str, Any], List[Any]]:
+        """Convert a dict, list or dataclass tree to JSON-ready camelCase data (see _to_camel_case_dict)."""
+        converted = [] if isinstance(root, list) else {}
+        stack: List[Tuple[Any, Any]] = [(root, converted)]
+        # (parent, key, child) for dict values that must be dropped if left empty
+        droppable: List[Tuple[Dict[str, Any], str, Dict[str, Any]]] = []
+
+        while stack:
+            source, target = stack.pop()
+
+            if isinstance(source, list):
+                append = target.append
+                for item in source:
+                    if isinstance(item, (dict, list)) or (is_dataclass(item) and not isinstance(item, type)):
+                        child = [] if isinstance(item, list) else {}
+                        stack.append((item, child))
+                        append(child)
+                    else:
+                        append(item)
                 continue
 
-            # Convert key to camelCase
-            camel_key = RequestUtils._to_camel_case(key)
-
-            # Recursively convert nested dictionaries
-            if isinstance(value, dict):
-                converted = RequestUtils._to_camel_case_dict(value)
-                # Only add if non-empty after filtering
-                if converted:
-                    camel_dict[camel_key] = converted
-            elif isinstance(value, list):
-                camel_dict[camel_key] = [
-                    RequestUtils._to_camel_case_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
+            if isinstance(source, dict):
+                items = ((RequestUtils._to_camel_case(k), v) for k, v in source.items())
             else:
-                camel_dict[camel_key] = value
+                items = ((camel_key, getattr(source, name))
+                         for name, camel_key in RequestUtils._dataclass_keys(type(source)))
+
+            for camel_key, value in items:
+                # Skip None values - Java SDK doesn't send null fields
+                if value is None:
+                    continue
+
+                if isinstance(value, dict):
+                    child = {}
+                    droppable.append((target, camel_key, child))
+                elif isinstance(value, list):
+                    child = []
+                elif is_dataclass(value) and not isinstance(value, type):
+                    child = {}
+                else:
+                    target[camel_key] = value
+                    continue
+
+                stack.append((value, child))
+                target[camel_key] = child
+
+        # Children are recorded after their parents, so walking backwards
+        # empties the innermost dicts first
+        for parent, key, child in reversed(droppable):
+            if not child:
+                del parent[key]
 
-        return camel_dict
+        return converted
 
     @staticmethod
     def _json_serializer(obj: Any) -> Any:
         """Custom JSON serializer for complex objects - converts snake_case to camelCase."""
         if is_dataclass(obj):
-            # Convert dataclass to dict with snake_case keys
-            snake_dict = {field.name: getattr(obj, field.name) for field in fields(obj)}
-            # Convert to camelCase keys to match Java SDK
-            return RequestUtils._to_camel_case_dict(snake_dict)
+            # Convert dataclass fields straight to camelCase keys to match Java SDK
+            return RequestUtils._convert_tree(obj)
         elif hasattr(obj, '__dict__'):
             # Convert object dict to camelCase
             return RequestUtils._to_camel_case_dict(obj.__dict__)
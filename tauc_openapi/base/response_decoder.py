@@ -0,0 +1,156 @@
+"""Schema-driven decoders for TAUC API result dataclasses."""
+
+import sys
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_type_hints
+from .request_utils import RequestUtils
+
+# Compiled decoders (result dataclass -> decode function)
+_decoders: Dict[type, Callable[[dict], Any]] = {}
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated enum-like strings share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _classify(hint: Any) -> Tuple[str, Optional[type]]:
+    """
+    Classify a field type hint for decoding.
+
+    Returns:
+        ("dataclass", cls), ("list", item_cls) for lists of dataclasses,
+        or ("value", None) for everything else (copied as-is)
+    """
+    # typing.get_origin/get_args are 3.8+; read the attributes directly for 3.7
+    if getattr(hint, '__origin__', None) is Union:
+        args = [arg for arg in hint.__args__ if arg is not type(None)]
+        if len(args) == 1:
+            hint = args[0]
+
+    if isinstance(hint, type) and is_dataclass(hint):
+        return "dataclass", hint
+
+    if getattr(hint, '__origin__', None) in (list, List):
+        args = getattr(hint, '__args__', ())
+        if args and isinstance(args[0], type) and is_dataclass(args[0]):
+            return "list", args[0]
+
+    return "value", None
+
+
+def compile_decoder(cls: type) -> Callable[[dict], Any]:
+    """
+    Generate a specialized decode function for a result dataclass.
+
+    The field-mapping spec is the dataclass itself:
+    - JSON key is the camelCase form of the field name, unless the field
+      metadata sets 'json_key' (a key, or a tuple of keys tried in order)
+    - Optional[SomeDataclass] fields are decoded recursively (falsy -> None)
+    - Optional[List[SomeDataclass]] fields decode each item; a missing or
+      empty list becomes None, or [] when metadata sets 'empty_list'
+    - fields whose metadata sets 'intern' have string values interned
+      (low-cardinality values such as status, role and model names)
+    - all other fields are copied from the JSON value unchanged
+
+    Args:
+        cls: Result dataclass
+
+    Returns:
+        Function taking a decoded JSON dict and returning a cls instance
+    """
+    hints = get_type_hints(cls)
+    params = getattr(cls, '__dataclass_params__', None)
+    # Instances are built with __new__ + attribute stores, which skips the
+    # keyword-argument call into __init__; classes that need __init__ side
+    # effects fall back to calling the constructor
+    direct = (
+        not hasattr(cls, '__post_init__')
+        and not (params is not None and params.frozen)
+        and all(f.init for f in fields(cls))
+    )
+    namespace: Dict[str, Any] = {"cls": cls, "new": object.__new__, "intern": _intern}
+    body = ["def decode(data):", "    get = data.get"]
+    assignments = []
+
+    for index, field in enumerate(fields(cls)):
+        if not field.init:
+            continue
+
+        keys = field.metadata.get('json_key') or RequestUtils._to_camel_case(field.name)
+        if isinstance(keys, str):
+            keys = (keys,)
+        lookup = " or ".join(f"get({key!r})" for key in keys)
+
+        kind, nested = _classify(hints.get(field.name))
+        if kind == "value":
+            if field.metadata.get('intern'):
+                lookup = f"intern({lookup})"
+            assignments.append((field.name, lookup))
+            continue
+
+        namespace[f"decode_{index}"] = get_decoder(nested)
+        body.append(f"    value_{index} = {lookup}")
+        if kind == "dataclass":
+            assignments.append((field.name, f"decode_{index}(value_{index}) if value_{index} else None"))
+        else:
+            empty = "[]" if field.metadata.get('empty_list') else "None"
+            assignments.append((
+                field.name,
+                f"[decode_{index}(item) for item in value_{index}] if value_{index} else {empty}"
+            ))
+
+    if direct:
+        body.append("    obj = new(cls)")
+        body.extend(f"    obj.{name} = {expr}" for name, expr in assignments)
+        body.append("    return obj")
+    else:
+        body.append(f"    return cls({', '.join(f'{name}={expr}' for name, expr in assignments)})")
+
+    exec(compile("\n".join(body), f"<decoder {cls.__qualname__}>", "exec"), namespace)
+    return namespace["decode"]
+
+
+def get_decoder(cls: type) -> Callable[[dict], Any]:
+    """
+    Get the decoder for a result dataclass, compiling it on first use.
+
+    Args:
+        cls: Result dataclass
+
+    Returns:
+        Decode function
+    """
+    decoder = _decoders.get(cls)
+    if decoder is None:
+        decoder = _decoders.setdefault(cls, compile_decoder(cls))
+    return decoder
+
+
+def decode(cls: type, data: dict) -> Any:
+    """
+    Decode one JSON object into a result dataclass.
+
+    Args:
+        cls: Result dataclass
+        data: Decoded JSON object
+
+    Returns:
+        cls instance
+    """
+    return get_decoder(cls)(data)
+
+
+def decode_list(cls: type, items: list) -> list:
+    """
+    Decode a list of JSON objects into result dataclasses.
+
+    Args:
+        cls: Result dataclass
+        items: Decoded JSON objects
+
+    Returns:
+        List of cls instances
+    """
+    decoder = get_decoder(cls)
+    return [decoder(item) for item in items]
@@ -0,0 +1,105 @@
+"""Streaming JSON request body for very large batch requests."""
+
+import hashlib
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+
+class StreamingBody:
+    """
+    Re-iterable request body of the form {"<key>":[item,item,...]}.
+
+    Items are encoded one at a time and yielded in chunks of about
+    ``chunk_size`` bytes, so the full JSON document is never held in memory.
+    The first call to ``md5_digest()`` or ``len()`` makes one encoding pass
+    that computes the Content-MD5 and byte length incrementally; iterating
+    the body (as the HTTP transport does) makes a second pass that produces
+    exactly the same bytes. Peak memory is bounded by one item plus one
+    chunk, at the cost of encoding the items twice.
+
+    Because ``len()`` is defined, requests sends it with a Content-Length
+    header rather than chunked transfer encoding.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        key: str,
+        items: Sequence[Any],
+        encode_item: Callable[[Any], bytes],
+        chunk_size: int = CHUNK_SIZE
+    ):
+        """
+        Initialize streaming body.
+
+        Args:
+            key: Top-level JSON key (already camelCase)
+            items: Items of the list, encoded lazily
+            encode_item: Function encoding one item as compact JSON bytes
+            chunk_size: Approximate size of yielded chunks in bytes
+        """
+        self.key = key
+        self.items = items
+        self.encode_item = encode_item
+        self.chunk_size = chunk_size
+        self._md5: Optional[bytes] = None
+        self._length: Optional[int] = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the encoded body in chunks."""
+        buffer = [b'{"' + self.key.encode('utf-8') + b'":[']
+        size = len(buffer[0])
+        first = True
+
+        for item in self.items:
+            encoded = self.encode_item(item)
+            if not first:
+                buffer.append(b",")
+                size += 1
+            first = False
+            buffer.append(encoded)
+            size += len(encoded)
+
+            if size >= self.chunk_size:
+                yield b"".join(buffer)
+                buffer = []
+                size = 0
+
+        buffer.append(b"]}")
+        yield b"".join(buffer)
+
+    def _measure(self) -> None:
+        """Compute MD5 and length in one encoding pass, discarding the chunks."""
+        md5 = hashlib.md5()
+        length = 0
+        for chunk in self:
+            md5.update(chunk)
+            length += len(chunk)
+        self._md5 = md5.digest()
+        self._length = length
+
+    def md5_digest(self) -> bytes:
+        """
+        Get the MD5 digest of the full body.
+
+        Returns:
+            Raw MD5 digest bytes
+        """
+        if self._md5 is None:
+            self._measure()
+        return self._md5
+
+    def __len__(self) -> int:
+        """Get the body length in bytes."""
+        if self._length is None:
+            self._measure()
+        return self._length
+
+    def to_bytes(self) -> bytes:
+        """
+        Materialize the whole body (for debugging and tests).
+
+        Returns:
+            Full body bytes
+        """
+        return b"".join(self)
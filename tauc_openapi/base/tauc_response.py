@@ -2,6 +2,8 @@
 
 from typing import Dict, Optional, Any, TypeVar, Generic
 import json
+from .exceptions import TAUCApiException
+from .response_decoder import decode
 
 T = TypeVar('T')
 
@@ -19,8 +21,19 @@ class TAUCResponse(Generic[T]):
         http_message: HTTP status message
         headers: Response headers
         result: Response data (type varies by endpoint)
+
+    Subclasses whose result is a JSON object only need to set ``result_class``
+    to the result dataclass; the default ``_parse_result`` decodes it with a
+    generated decoder (see response_decoder).
+
+    ``result`` is decoded lazily on first access, so callers that only need
+    a columnar view of list results (see ColumnarResponseMixin) never build
+    per-row objects.
     """
 
+    # Result dataclass decoded by the default _parse_result (None = raw result)
+    result_class: Optional[type] = None
+
     def __init__(self, http_response=None):
         """
         Initialize TAUC response.
@@ -34,6 +47,8 @@ class TAUCResponse(Generic[T]):
         self.http_message: Optional[str] = None
         self.headers: Dict[str, str] = {}
         self.result: Optional[T] = None
+        self._result_data: Any = None  # Raw "result" field awaiting decoding
+        self._result_pending = False
         self._raw_json: Optional[str] = None  # Store raw JSON response
 
         if http_response is not None:
@@ -59,18 +74,43 @@ class TAUCResponse(Generic[T]):
                 self.error_code = data.get("errorCode")
                 self.msg = data.get("msg")
 
-                # Parse result field if present
+                # Keep result field for lazy parsing
                 if "result" in data:
-                    self.result = self._parse_result(data["result"])
+                    self._result_data = data["result"]
+                    self._result_pending = True
             except json.JSONDecodeError:
                 # Response is not JSON
                 pass
 
+    @property
+    def result(self) -> Optional[T]:
+        """
+        Parsed result (decoded from the raw result field on first access).
+
+        Raises:
+            TAUCApiException: If the result field cannot be decoded
+        """
+        if self._result_pending:
+            try:
+                self._result = self._parse_result(self._result_data)
+            except Exception as e:
+                raise TAUCApiException(f"Failed to decode response result: {e}", cause=e)
+            self._result_pending = False
+            self._result_data = None
+        return self._result
+
+    @result.setter
+    def result(self, value: Optional[T]) -> None:
+        self._result = value
+        self._result_pending = False
+        self._result_data = None
+
     def _parse_result(self, result_data: Any) -> T:
         """
         Parse the result field from response data.
 
-        Subclasses should override this to provide custom parsing.
+        Decodes JSON objects into ``result_class`` when set. Subclasses should
+        override this to provide custom parsing.
 
         Args:
             result_data: Raw result data from response
@@ -78,6 +118,8 @@ class TAUCResponse(Generic[T]):
         Returns:
             Parsed result object
         """
+        if self.result_class is not None and isinstance(result_data, dict):
+            return decode(self.result_class, result_data)
         return result_data
 
     def is_success(self) -> bool:
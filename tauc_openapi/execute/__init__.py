@@ -1,5 +1,8 @@
 """API client and execution utilities."""
 
 from .api_client import ApiClient
+from .paginator import Paginator
+from .rate_limiter import RateLimiter
+from .signer import Signer
 
-__all__ = ["ApiClient"]
+__all__ = ["ApiClient", "Paginator", "RateLimiter", "Signer"]
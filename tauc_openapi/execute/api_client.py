@@ -1,6 +1,8 @@
 """Main API client for TAUC OpenAPI."""
 
-from typing import Type, TypeVar, Optional
+import time
+import weakref
+from typing import Dict, Type, TypeVar, Optional
 from ..base.client_type import ClientType
 from ..base.tauc_request import TAUCRequest, HttpMethod
 from ..base.tauc_response import TAUCResponse
@@ -8,6 +10,9 @@ from ..base.exceptions import TAUCApiException
 from ..base.request_utils import RequestUtils
 from ..http.http_client import HttpClient
 from .auth_manager import AuthManager, AccessTokenManager
+from .clock_skew import ClockSkewEstimator
+from .paginator import DEFAULT_MAX_WORKERS, Paginator
+from .signer import RequestBody
 
 T = TypeVar('T', bound=TAUCResponse)
 
@@ -53,6 +58,14 @@ class ApiClient:
         # Initialize HTTP client
         self.http_client = HttpClient(client_cert_path, client_key_path)
 
+        # Server clock offset, applied to signature timestamps
+        self.clock_skew = ClockSkewEstimator.for_domain(self.domain_name)
+
+    @property
+    def account_key(self) -> str:
+        """Identifies the TAUC account this client is for (domain and client ID or access key)."""
+        return f"{self.domain_name}|{self.client_id or self.access_key}"
+
     @classmethod
     def build_aksk_client(
         cls,
@@ -130,6 +143,10 @@ class ApiClient:
         """
         Make an API call.
 
+        For OAuth 2.0 clients built with a client ID, the managed token (see
+        get_access_token) is used, so calls keep working across token
+        refreshes; access_token is only used for clients without one.
+
         Args:
             request: Request object
             response_class: Response class to instantiate
@@ -141,12 +158,111 @@ class ApiClient:
         Raises:
             TAUCApiException: If API call fails
         """
+        if self.client_type == ClientType.OAUTH_TWO and self.client_id and self.secret:
+            access_token = self.get_access_token()
         return self._api_call_action(request, response_class, access_token, auth=True)
 
+    def paginate(
+        self,
+        request: TAUCRequest,
+        response_class: Type[T],
+        page_size: Optional[int] = None,
+        access_token: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Paginator[T]:
+        """
+        Iterate over all items of a paginated list endpoint.
+
+        Pages are fetched lazily as iteration proceeds, using the largest
+        page size the endpoint accepts; once the total is known, the
+        remaining pages are fetched concurrently and yielded in order, with
+        duplicate ids removed (see Paginator).
+
+        Args:
+            request: List request with page/pageSize fields
+            response_class: Response class whose result has total/page/page_size/data
+            page_size: Fixed page size (default: largest accepted)
+            access_token: OAuth access token (see api_call)
+            max_workers: Concurrent page requests (1 = one page at a time)
+
+        Returns:
+            Paginator yielding result items (its pages() yields responses)
+        """
+        return Paginator(self, request, response_class, page_size, access_token, max_workers)
+
+    def get_access_token(self, force_refresh: bool = False, stale_token: Optional[str] = None) -> str:
+        """
+        Get a valid OAuth 2.0 access token.
+
+        Returns the cached token unless it is missing, (about to be) expired,
+        rejected by the server (stale_token), or force_refresh is set, in
+        which case a new one is requested. Token requests are single-flight:
+        threads that need a new token at the same time share one request
+        and its outcome.
+
+        Args:
+            force_refresh: Always request a new token
+            stale_token: Token the server rejected; a different cached token
+                (refreshed meanwhile) is returned as-is
+
+        Returns:
+            Access token
+
+        Raises:
+            TAUCApiException: If the client is not OAuth 2.0 or the token request fails
+        """
+        if self.client_type != ClientType.OAUTH_TWO or not self.client_id:
+            raise TAUCApiException("Access tokens are only available for OAuth 2.0 clients")
+
+        if not force_refresh:
+            access_token = self._get_cached_token()
+            if access_token and access_token != stale_token:
+                return access_token
+
+        def fetch() -> str:
+            # Another process may have stored a new token meanwhile
+            if not force_refresh:
+                access_token = self._get_cached_token(reload=True)
+                if access_token and access_token != stale_token:
+                    return access_token
+
+            from ..models.access_token.get_access_token import GetAccessTokenRequest, GetAccessTokenResponse
+
+            response = self.access_token_call(GetAccessTokenRequest(), GetAccessTokenResponse)
+            if not response.is_success() or not response.result or not response.result.access_token:
+                raise TAUCApiException(
+                    f"Failed to get access token: {response.msg} (Code: {response.error_code})"
+                )
+            return response.result.access_token
+
+        return AccessTokenManager.request_token(self.client_id, fetch, self.secret)
+
+    def _get_cached_token(self, reload: bool = False) -> Optional[str]:
+        """
+        Get this client's cached token, from memory or the token store.
+
+        A token first seen in the store (fetched by another process) gets a
+        background refresh scheduled like a token fetched here.
+
+        Args:
+            reload: Re-read the store even if a token is cached in memory
+
+        Returns:
+            Cached access token, or None
+        """
+        in_memory = AccessTokenManager.get_cached_token(self.client_id, self.secret, use_store=False)
+        access_token = AccessTokenManager.get_cached_token(self.client_id, self.secret, reload=reload)
+        if access_token and access_token != in_memory:
+            self._schedule_token_refresh()
+        return access_token
+
     def access_token_call(self, request: TAUCRequest, response_class: Type[T]) -> T:
         """
         Make an access token request (no authentication required).
 
+        A returned token is cached with its lifetime and refreshed in the
+        background before it expires.
+
         Args:
             request: Access token request object
             response_class: Response class to instantiate
@@ -165,7 +281,46 @@ class ApiClient:
                 if not request.grant_type:
                     request.grant_type = "client_credentials"
 
-        return self._api_call_action(request, response_class, access_token=None, auth=False)
+        response = self._api_call_action(request, response_class, access_token=None, auth=False)
+
+        result = response.result if response.is_success() else None
+        if self.client_id and getattr(result, 'access_token', None):
+            AccessTokenManager.cache_token(
+                self.client_id, result.access_token, getattr(result, 'expires_in', None), self.secret
+            )
+            self._schedule_token_refresh()
+
+        return response
+
+    def _schedule_token_refresh(self, delay: Optional[float] = None) -> None:
+        """
+        Schedule a background refresh of this client's token.
+
+        The timer only holds a weak reference, so refreshing stops once the
+        client is garbage collected.
+
+        Args:
+            delay: Seconds until the refresh (default: shortly before expiry)
+        """
+        refresh = weakref.WeakMethod(self._refresh_token_in_background)
+
+        def run() -> None:
+            method = refresh()
+            if method is not None:
+                method()
+
+        AccessTokenManager.schedule_refresh(self.client_id, run, delay, self.secret)
+
+    def _refresh_token_in_background(self) -> None:
+        """Refresh the token (runs on the refresh timer thread)."""
+        current = AccessTokenManager.get_cached_token(self.client_id, self.secret, use_store=False)
+        try:
+            # A token already refreshed by another process is adopted as-is
+            self.get_access_token(stale_token=current)
+        except TAUCApiException:
+            # Keep retrying while the current token is still usable
+            if AccessTokenManager.get_cached_token(self.client_id, self.secret, use_store=False):
+                self._schedule_token_refresh(AccessTokenManager.REFRESH_RETRY_DELAY)
 
     def _api_call_action(
         self,
@@ -205,49 +360,33 @@ class ApiClient:
             request_url_for_auth = RequestUtils.process_path_variables(request_url_path, request)
 
             # Build request body FIRST (needed for auth signature)
-            request_body_str = None
+            # Encoded once; the signer and the transport share these bytes
+            request_body = None
             if request.get_method() in [HttpMethod.POST, HttpMethod.PUT, HttpMethod.PATCH, HttpMethod.DELETE]:
-                request_body_str = RequestUtils.process_request_body(request_url_path, request)
-
-            # Build headers
-            headers = RequestUtils.process_headers(request)
-
-            # Attach authentication headers (pass URL and body for signature)
-            if auth:
-                AuthManager.attach_auth_header(
-                    self.client_type,
-                    headers,
-                    request_url_for_auth,
-                    request_body_str,
-                    self.access_key,
-                    self.secret,
-                    access_token
-                )
+                request_body = RequestUtils.process_request_body(request_url_path, request)
 
             # Build query parameters
             params = None
             if request.get_method() in [HttpMethod.GET, HttpMethod.POST]:
                 params = RequestUtils.process_query_params(request_url_path, request)
 
-            # Make HTTP request
-            # If we have a request body string, send it as data
-            # Otherwise let requests library handle JSON serialization
-            http_response = self.http_client.request(
-                method=request.get_method().value,
-                url=full_url,
-                headers=headers,
-                params=params,
-                json_data=None,  # We handle serialization ourselves
-                data=request_body_str
+            response = self._send(
+                request, response_class, full_url, request_url_for_auth, request_body, params, access_token, auth
             )
 
-            # Parse response
-            response = response_class(http_response)
-
             # Handle expired token
             if response.error_code == AuthManager.ERROR_CODE_INVALID_TOKEN:
                 if self.client_id:
-                    AccessTokenManager.remove_expired_token(self.client_id)
+                    AccessTokenManager.remove_expired_token(self.client_id, access_token, self.secret)
+
+                # Re-authenticate and replay once, re-signed with a new nonce
+                # and timestamp (the body bytes are reused unchanged)
+                if auth and self.client_type == ClientType.OAUTH_TWO and self.client_id and self.secret:
+                    access_token = self.get_access_token(stale_token=access_token)
+                    response = self._send(
+                        request, response_class, full_url, request_url_for_auth, request_body, params,
+                        access_token, auth
+                    )
 
             return response
 
@@ -256,6 +395,70 @@ class ApiClient:
                 raise
             raise TAUCApiException(f"API call failed: {e}", cause=e)
 
+    def _send(
+        self,
+        request: TAUCRequest,
+        response_class: Type[T],
+        full_url: str,
+        request_url_for_auth: str,
+        request_body: RequestBody,
+        params: Optional[Dict[str, str]],
+        access_token: Optional[str],
+        auth: bool
+    ) -> T:
+        """
+        Sign and send a prepared request.
+
+        Args:
+            request: Request object
+            response_class: Response class to instantiate
+            full_url: Full request URL
+            request_url_for_auth: Request URL path used in the signature
+            request_body: Serialized request body (bytes, StreamingBody or None)
+            params: Query parameters
+            access_token: OAuth access token (if applicable)
+            auth: Whether to attach authentication headers
+
+        Returns:
+            Response object
+        """
+        # Build headers
+        headers = RequestUtils.process_headers(request)
+
+        # Attach authentication headers (pass URL and body for signature)
+        timestamp = self.clock_skew.timestamp()
+        if auth:
+            AuthManager.attach_auth_header(
+                self.client_type,
+                headers,
+                request_url_for_auth,
+                request_body,
+                self.access_key,
+                self.secret,
+                access_token,
+                timestamp
+            )
+
+        # Make HTTP request
+        # The signed body bytes are sent unchanged as data
+        sent_at = time.time()
+        http_response = self.http_client.request(
+            method=request.get_method().value,
+            url=full_url,
+            headers=headers,
+            params=params,
+            json_data=None,  # We handle serialization ourselves
+            data=request_body
+        )
+        date_header = http_response.headers.get("Date")
+        self.clock_skew.observe(date_header, sent_at, time.time())
+
+        # Parse response
+        response = response_class(http_response)
+        if auth and not response.is_success():
+            self.clock_skew.check_rejection(date_header, timestamp)
+        return response
+
     def _build_json_body(self, request: TAUCRequest) -> Optional[dict]:
         """
         Build JSON body from request object.
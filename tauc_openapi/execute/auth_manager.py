@@ -1,13 +1,15 @@
 """Authentication management for TAUC API - CORRECTED to match Java SDK."""
 
+import contextlib
 import hashlib
-import hmac
-import base64
+import threading
 import time
-import uuid
-import json
-from typing import Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, ContextManager, Dict, Optional, Tuple, Union
 from ..base.client_type import ClientType
+from .signer import Signer, RequestBody
+from .token_store import FileTokenStore
 
 
 class AuthManager:
@@ -17,15 +19,52 @@ class AuthManager:
     X_AUTH_HEADER = "X-Authorization"
     AUTH_HEADER = "Authorization"
 
+    # Signers kept for reuse (least recently used are dropped beyond this)
+    MAX_SIGNERS = 64
+
+    # Signers with precomputed HMAC state ((secret digest, access_key) -> Signer)
+    _signers: "OrderedDict[Tuple[bytes, Optional[str]], Signer]" = OrderedDict()
+    _signers_lock = threading.Lock()
+
+    @classmethod
+    def get_signer(cls, secret: str, access_key: Optional[str] = None) -> Signer:
+        """
+        Get the shared signer for a secret, creating it on first use.
+
+        Signers are keyed by a SHA-256 digest of the secret (the secret
+        itself is not kept as a key), and at most MAX_SIGNERS are kept.
+
+        Args:
+            secret: Secret key for signing
+            access_key: Access key (None for OAuth 2.0)
+
+        Returns:
+            Signer bound to the secret
+        """
+        key = (hashlib.sha256(secret.encode("utf-8")).digest(), access_key)
+        with cls._signers_lock:
+            signer = cls._signers.get(key)
+            if signer is not None:
+                cls._signers.move_to_end(key)
+                return signer
+        signer = Signer(secret, access_key)
+        with cls._signers_lock:
+            signer = cls._signers.setdefault(key, signer)
+            cls._signers.move_to_end(key)
+            while len(cls._signers) > cls.MAX_SIGNERS:
+                cls._signers.popitem(last=False)
+        return signer
+
     @staticmethod
     def attach_auth_header(
         client_type: ClientType,
         headers: Dict[str, str],
         request_url: str,
-        request_body: Optional[str],
+        request_body: RequestBody,
         access_key: Optional[str] = None,
         secret: Optional[str] = None,
-        access_token: Optional[str] = None
+        access_token: Optional[str] = None,
+        timestamp: Optional[int] = None
     ) -> None:
         """
         Attach authentication headers to request.
@@ -34,15 +73,16 @@ class AuthManager:
             client_type: Type of authentication (ACCESS_KEY or OAUTH_TWO)
             headers: Headers dictionary to modify
             request_url: Full request URL path (without domain)
-            request_body: Serialized request body (JSON string or None)
+            request_body: Serialized request body bytes (as sent on the wire) or None
             access_key: Access key for AK/SK authentication
             secret: Secret key for authentication
             access_token: Access token for OAuth 2.0 authentication
+            timestamp: Signature timestamp (default: current local time)
         """
         if client_type == ClientType.ACCESS_KEY:
             if not access_key or not secret:
                 raise ValueError("Access key and secret are required for AK/SK authentication")
-            x_auth = AuthManager._get_x_auth(access_key, secret, request_url, request_body)
+            x_auth = AuthManager._get_x_auth(access_key, secret, request_url, request_body, timestamp)
             headers[AuthManager.X_AUTH_HEADER] = x_auth
 
         elif client_type == ClientType.OAUTH_TWO:
@@ -53,7 +93,7 @@ class AuthManager:
 
             headers[AuthManager.AUTH_HEADER] = f"Bearer {access_token}"
             # For OAuth, X-Auth doesn't include AccessKey
-            x_auth = AuthManager._get_x_auth(None, secret, request_url, request_body)
+            x_auth = AuthManager._get_x_auth(None, secret, request_url, request_body, timestamp)
             headers[AuthManager.X_AUTH_HEADER] = x_auth
 
     @staticmethod
@@ -61,45 +101,32 @@ class AuthManager:
         access_key: Optional[str],
         secret: str,
         request_url: str,
-        request_body: Optional[str]
+        request_body: RequestBody,
+        timestamp: Optional[int] = None
     ) -> str:
         """
         Generate X-Authorization header value.
 
-        Format: Nonce={uuid},AccessKey={key},Signature={signature},Timestamp={timestamp}
+        Format: Nonce={nonce},AccessKey={key},Signature={signature},Timestamp={timestamp}
         (AccessKey omitted for OAuth 2.0)
 
         Args:
             access_key: Access key (None for OAuth 2.0)
             secret: Secret key for signing
             request_url: Request URL path
-            request_body: Request body as JSON string
+            request_body: Request body bytes
+            timestamp: Signature timestamp (default: current local time)
 
         Returns:
             X-Authorization header value
         """
-        timestamp = int(time.time())
-        nonce = str(uuid.uuid4())
-
-        # Generate signature
-        signature = AuthManager._generate_signature(
-            secret, request_url, request_body, nonce, timestamp
-        )
-
-        # Build X-Authorization header
-        parts = [f"Nonce={nonce}"]
-        if access_key:
-            parts.append(f"AccessKey={access_key}")
-        parts.append(f"Signature={signature}")
-        parts.append(f"Timestamp={timestamp}")
-
-        return ",".join(parts)
+        return AuthManager.get_signer(secret, access_key).x_auth(request_url, request_body, timestamp)
 
     @staticmethod
     def _generate_signature(
         secret: str,
         request_url: str,
-        request_body: Optional[str],
+        request_body: RequestBody,
         nonce: str,
         timestamp: int
     ) -> str:
@@ -109,6 +136,7 @@ class AuthManager:
         Signature is generated from:
         1. If body exists and is not empty or "{}":
            - ContentMD5 = Base64(MD5(body)) + "\n"
+           (body is already canonical compact JSON, so it is hashed as-is)
         2. Timestamp + "\n"
         3. Nonce + "\n"
         4. RequestURL
@@ -118,86 +146,318 @@ class AuthManager:
         Args:
             secret: Secret key for signing
             request_url: Request URL path
-            request_body: Request body (JSON string or None)
+            request_body: Request body bytes or StreamingBody (or None)
             nonce: Random nonce
             timestamp: Unix timestamp
 
         Returns:
             Hex-encoded signature
         """
-        parts = []
+        return AuthManager.get_signer(secret).sign(request_url, request_body, nonce, timestamp)
 
-        # Add Content-MD5 if body exists and is not empty
-        if request_body and request_body.strip() and request_body.strip() != "{}":
-            # Normalize JSON (remove whitespace)
-            try:
-                normalized_body = json.dumps(json.loads(request_body), separators=(',', ':'))
-            except (json.JSONDecodeError, ValueError):
-                normalized_body = request_body
 
-            # Compute MD5 and base64 encode
-            md5_hash = hashlib.md5(normalized_body.encode('utf-8')).digest()
-            content_md5 = base64.b64encode(md5_hash).decode('utf-8')
-            parts.append(content_md5)
+@dataclass
+class CachedToken:
+    """Access token with its expiry time."""
+    access_token: str
+    # Unix time after which the token is no longer handed out (slightly
+    # before its real expiry); None if the lifetime is unknown
+    expires_at: Optional[float] = None
 
-        # Add timestamp, nonce, and URL
-        parts.append(str(timestamp))
-        parts.append(nonce)
-        parts.append(request_url)
+    def is_valid(self, now: Optional[float] = None) -> bool:
+        """
+        Check whether the token is still usable.
 
-        # Join with newlines
-        string_to_sign = "\n".join(parts)
+        Args:
+            now: Current Unix time (default: time.time())
+
+        Returns:
+            True if the token has no known expiry or has not expired yet
+        """
+        return self.expires_at is None or self.expires_at > (time.time() if now is None else now)
 
-        # Sign with HMAC-SHA256
-        signature_bytes = hmac.new(
-            secret.encode('utf-8'),
-            string_to_sign.encode('utf-8'),
-            hashlib.sha256
-        ).digest()
 
-        # Convert to hex string
-        signature_hex = signature_bytes.hex()
+class _TokenRequest:
+    """A token request in flight, whose outcome is shared by all waiters."""
 
-        return signature_hex
+    def __init__(self):
+        self.done = threading.Event()
+        self.access_token: Optional[str] = None
+        self.error: Optional[BaseException] = None
 
 
 class AccessTokenManager:
-    """Manages OAuth 2.0 access tokens."""
+    """
+    Manages OAuth 2.0 access tokens.
+
+    Tokens are cached with their expiry (from ``expires_in``) and treated
+    as expired up to EXPIRY_MARGIN seconds early. A background timer per client
+    refreshes each token before it expires, so long-running jobs never see
+    an expired-token failure.
+
+    Optionally (configure_store), tokens are also kept in an encrypted
+    on-disk store shared by all processes using the same directory, so new
+    processes and sessions reuse valid tokens without a token request.
+
+    Tokens are held per client ID and secret, so a client built with the
+    right client ID but a wrong secret never receives another client's
+    token: it has to make its own token request, which the server rejects.
+
+    All methods are thread-safe. Token requests are single-flight per
+    client (request_token): concurrent callers share one request and its
+    outcome, token or error.
+    """
+
+    # Seconds before expiry at which a cached token is no longer handed out
+    # (at most a tenth of the lifetime)
+    EXPIRY_MARGIN = 30
+    # Refresh this many seconds before expiry (at most a fifth of the lifetime)
+    REFRESH_LEAD = 300
+    # Delay before retrying a failed background refresh
+    REFRESH_RETRY_DELAY = 15
+
+    # In-memory token cache (client key -> token)
+    _token_cache: Dict[Tuple[str, bytes], CachedToken] = {}
+    # Pending background refreshes (client key -> timer)
+    _refresh_timers: Dict[Tuple[str, bytes], threading.Timer] = {}
+    # Token requests in flight (client key -> request)
+    _inflight: Dict[Tuple[str, bytes], _TokenRequest] = {}
+    # Guards the dicts above
+    _lock = threading.RLock()
+    # Shared on-disk token store (None = in-memory only)
+    _store: Optional[FileTokenStore] = None
+
+    @staticmethod
+    def _key(client_id: str, secret: Optional[str]) -> Tuple[str, bytes]:
+        """Get the in-memory key of a client: its ID and a digest of its secret."""
+        return client_id, hashlib.sha256((secret or "").encode("utf-8")).digest()
+
+    @classmethod
+    def configure_store(cls, directory: Optional[str]) -> None:
+        """
+        Enable (or, with None, disable) the shared on-disk token store.
+
+        If the directory cannot be created, tokens are kept in memory only.
+
+        Args:
+            directory: Directory holding the encrypted token files
+        """
+        if not directory:
+            cls._store = None
+        elif cls._store is None or cls._store.directory != directory:
+            try:
+                cls._store = FileTokenStore(directory)
+            except OSError:
+                cls._store = None
+
+    @classmethod
+    def store_lock(cls, client_id: str) -> ContextManager:
+        """
+        Get a cross-process lock for requesting the client's token.
+
+        Args:
+            client_id: OAuth client ID
+
+        Returns:
+            Context manager holding the store's file lock (no-op without a store)
+        """
+        if cls._store is None:
+            return contextlib.nullcontext()
+        return cls._store.lock(client_id)
+
+    @staticmethod
+    def parse_expires_in(expires_in: Union[str, int, float, None]) -> Optional[float]:
+        """
+        Parse an ``expires_in`` value (seconds, sent as a string or number).
 
-    # In-memory token cache (client_id -> token)
-    _token_cache: Dict[str, str] = {}
+        Returns:
+            Lifetime in seconds, or None if missing or invalid
+        """
+        try:
+            lifetime = float(expires_in)
+        except (TypeError, ValueError):
+            return None
+        return lifetime if lifetime > 0 else None
 
     @classmethod
-    def cache_token(cls, client_id: str, access_token: str) -> None:
+    def cache_token(
+        cls,
+        client_id: str,
+        access_token: str,
+        expires_in: Union[str, int, float, None] = None,
+        secret: Optional[str] = None
+    ) -> None:
         """
         Cache access token for client.
 
         Args:
             client_id: OAuth client ID
             access_token: Access token to cache
+            expires_in: Token lifetime in seconds (as returned by the token call)
+            secret: OAuth client secret (part of the cache key); if given and
+                a store is configured, the token is also written to the store
         """
-        cls._token_cache[client_id] = access_token
+        lifetime = cls.parse_expires_in(expires_in)
+        expires_at = None
+        if lifetime is not None:
+            expires_at = time.time() + lifetime - min(cls.EXPIRY_MARGIN, lifetime / 10)
+        with cls._lock:
+            cls._token_cache[cls._key(client_id, secret)] = CachedToken(access_token, expires_at)
+
+        if cls._store is not None and secret:
+            try:
+                cls._store.save(client_id, secret, access_token, expires_at)
+            except OSError:
+                pass  # The in-memory cache still works
 
     @classmethod
-    def get_cached_token(cls, client_id: str) -> Optional[str]:
+    def get_cached_token(
+        cls,
+        client_id: str,
+        secret: Optional[str] = None,
+        reload: bool = False,
+        use_store: bool = True
+    ) -> Optional[str]:
         """
         Get cached access token for client.
 
         Args:
             client_id: OAuth client ID
+            secret: OAuth client secret (part of the cache key); if given and
+                a store is configured, a token missing from memory is read
+                from the store
+            reload: Read the store even if a token is cached in memory (it
+                may have been refreshed by another process)
+            use_store: Read the store at all (False = memory only)
 
         Returns:
-            Cached access token, or None if not cached
+            Cached access token, or None if not cached or (about to be) expired
         """
-        return cls._token_cache.get(client_id)
+        key = cls._key(client_id, secret)
+        cached = cls._token_cache.get(key)
+        valid = cached is not None and cached.is_valid()
+
+        if use_store and cls._store is not None and secret and (reload or not valid):
+            stored = cls._store.load(client_id, secret)
+            if stored is not None:
+                loaded = CachedToken(*stored)
+                if loaded.is_valid():
+                    with cls._lock:
+                        cls._token_cache[key] = cached = loaded
+                    valid = True
+
+        return cached.access_token if valid else None
 
     @classmethod
-    def remove_expired_token(cls, client_id: str) -> None:
+    def remove_expired_token(
+        cls,
+        client_id: str,
+        access_token: Optional[str] = None,
+        secret: Optional[str] = None
+    ) -> None:
         """
         Remove expired token from cache.
 
         Args:
             client_id: OAuth client ID
+            access_token: Only remove the cached token if it is this one (so a
+                token refreshed meanwhile by another thread is kept)
+            secret: OAuth client secret (part of the cache key)
+        """
+        key = cls._key(client_id, secret)
+        with cls._lock:
+            cached = cls._token_cache.get(key)
+            if cached is not None and (access_token is None or cached.access_token == access_token):
+                del cls._token_cache[key]
+
+    @classmethod
+    def request_token(cls, client_id: str, fetch: Callable[[], str], secret: Optional[str] = None) -> str:
+        """
+        Run a token request for a client, single-flight.
+
+        The first caller runs fetch (holding the store's cross-process lock,
+        or none if the lock file cannot be opened); callers arriving while
+        it is in flight wait and receive the same token, or the same
+        exception if it failed.
+
+        Args:
+            client_id: OAuth client ID
+            fetch: Requests (and caches) a new token and returns it
+            secret: OAuth client secret (part of the single-flight key)
+
+        Returns:
+            Access token
+        """
+        key = cls._key(client_id, secret)
+        with cls._lock:
+            request = cls._inflight.get(key)
+            leader = request is None
+            if leader:
+                request = cls._inflight[key] = _TokenRequest()
+
+        if not leader:
+            request.done.wait()
+            if request.error is not None:
+                raise request.error
+            return request.access_token
+
+        try:
+            with cls.store_lock(client_id):
+                request.access_token = fetch()
+            return request.access_token
+        except BaseException as e:
+            request.error = e
+            raise
+        finally:
+            with cls._lock:
+                del cls._inflight[key]
+            request.done.set()
+
+    @classmethod
+    def schedule_refresh(
+        cls,
+        client_id: str,
+        refresh: Callable[[], None],
+        delay: Optional[float] = None,
+        secret: Optional[str] = None
+    ) -> None:
+        """
+        Schedule a background refresh of the client's token.
+
+        Replaces any refresh already scheduled for the client. Nothing is
+        scheduled if the cached token has no known expiry.
+
+        Args:
+            client_id: OAuth client ID
+            refresh: Called on a daemon thread to fetch and cache a new token
+            delay: Seconds until the refresh (default: REFRESH_LEAD before expiry)
+            secret: OAuth client secret (part of the cache key)
+        """
+        key = cls._key(client_id, secret)
+        with cls._lock:
+            if delay is None:
+                cached = cls._token_cache.get(key)
+                if cached is None or cached.expires_at is None:
+                    return
+                remaining = cached.expires_at - time.time()
+                delay = max(0.0, remaining - min(cls.REFRESH_LEAD, remaining / 5))
+
+            cls.cancel_refresh(client_id, secret)
+            timer = threading.Timer(delay, refresh)
+            timer.daemon = True
+            cls._refresh_timers[key] = timer
+            timer.start()
+
+    @classmethod
+    def cancel_refresh(cls, client_id: str, secret: Optional[str] = None) -> None:
+        """
+        Cancel the client's scheduled background refresh, if any.
+
+        Args:
+            client_id: OAuth client ID
+            secret: OAuth client secret (part of the cache key)
         """
-        if client_id in cls._token_cache:
-            del cls._token_cache[client_id]
+        with cls._lock:
+            timer = cls._refresh_timers.pop(cls._key(client_id, secret), None)
+        if timer is not None:
+            timer.cancel()
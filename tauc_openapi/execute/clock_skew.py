@@ -0,0 +1,151 @@
+"""Server clock-skew estimation for request signature timestamps."""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class ClockSkewEstimator:
+    """
+    Estimates the offset between the server clock and the local clock.
+
+    Each response's ``Date`` header gives a sample: the server time (taken
+    as the middle of the header's one-second resolution) minus the local
+    midpoint of the round trip. Samples are smoothed with an exponentially
+    weighted moving average; samples from slow round trips are ignored, and
+    a sample far from the estimate resets it (the local clock was stepped).
+
+    timestamp() returns the local time corrected by the estimate, for use
+    as the signature timestamp. The correction is only applied once the
+    estimated skew is at least MIN_CORRECTION seconds, so hosts with an
+    accurate clock sign exactly as before.
+
+    One estimator is shared per API domain (for_domain).
+    """
+
+    # Weight of a new sample in the moving average
+    ALPHA = 0.2
+    # Ignore samples whose round trip took longer than this (seconds)
+    MAX_ROUND_TRIP = 5.0
+    # A sample this far from the estimate replaces it (seconds)
+    RESET_THRESHOLD = 30.0
+    # Smallest estimated skew that is applied to timestamps (seconds)
+    MIN_CORRECTION = 1.0
+    # A failed request whose signature timestamp was this far from the
+    # server clock is counted as a skew rejection (seconds)
+    REJECTION_TOLERANCE = 30.0
+
+    # Shared estimators (domain -> estimator)
+    _estimators: Dict[str, 'ClockSkewEstimator'] = {}
+    _estimators_lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize the estimator (no skew until the first sample)."""
+        self._lock = threading.Lock()
+        self._offset: Optional[float] = None
+        self.samples = 0
+        self.skew_rejections = 0
+
+    @classmethod
+    def for_domain(cls, domain_name: str) -> 'ClockSkewEstimator':
+        """
+        Get the shared estimator for an API domain, creating it on first use.
+
+        Args:
+            domain_name: API domain (e.g., "https://use1-tauc-openapi.tplinkcloud.com")
+
+        Returns:
+            Clock-skew estimator
+        """
+        with cls._estimators_lock:
+            estimator = cls._estimators.get(domain_name)
+            if estimator is None:
+                estimator = cls._estimators[domain_name] = cls()
+            return estimator
+
+    @property
+    def offset(self) -> float:
+        """Estimated server clock minus local clock, in seconds."""
+        return self._offset or 0.0
+
+    @staticmethod
+    def parse_date(date_header: Optional[str]) -> Optional[float]:
+        """
+        Parse an HTTP Date header.
+
+        Returns:
+            Unix time, or None if missing or invalid
+        """
+        if not date_header:
+            return None
+        try:
+            return parsedate_to_datetime(date_header).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return None
+
+    def observe(self, date_header: Optional[str], sent_at: float, received_at: float) -> None:
+        """
+        Update the estimate from a response.
+
+        Args:
+            date_header: Response Date header
+            sent_at: Local time.time() when the request was sent
+            received_at: Local time.time() when the response arrived
+        """
+        server_time = self.parse_date(date_header)
+        if server_time is None or received_at - sent_at > self.MAX_ROUND_TRIP:
+            return
+
+        sample = server_time + 0.5 - (sent_at + received_at) / 2
+        with self._lock:
+            if self._offset is None or abs(sample - self._offset) > self.RESET_THRESHOLD:
+                self._offset = sample
+            else:
+                self._offset += self.ALPHA * (sample - self._offset)
+            self.samples += 1
+
+    def timestamp(self) -> int:
+        """
+        Get the signature timestamp (server-corrected Unix time).
+
+        Returns:
+            Unix timestamp in seconds
+        """
+        now = time.time()
+        offset = self.offset
+        if abs(offset) >= self.MIN_CORRECTION:
+            now += offset
+        return int(now)
+
+    def check_rejection(self, date_header: Optional[str], signed_timestamp: int) -> bool:
+        """
+        Count a failed request as a skew rejection if its timestamp was off.
+
+        Args:
+            date_header: Date header of the failed response
+            signed_timestamp: Timestamp the request was signed with
+
+        Returns:
+            True if the rejection is attributed to clock skew
+        """
+        server_time = self.parse_date(date_header)
+        if server_time is None or abs(server_time - signed_timestamp) < self.REJECTION_TOLERANCE:
+            return False
+        with self._lock:
+            self.skew_rejections += 1
+        return True
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Get the estimator's metrics.
+
+        Returns:
+            Dict with the estimated offset (seconds), sample count, and
+            number of rejections attributed to clock skew
+        """
+        return {
+            "offset": round(self.offset, 3),
+            "samples": self.samples,
+            "skew_rejections": self.skew_rejections,
+        }
@@ -0,0 +1,79 @@
+"""Bounded concurrent execution of many API calls."""
+
+import itertools
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar('K')
+R = TypeVar('R')
+
+
+def run_bounded(
+    fn: Callable[[K], R],
+    keys: Iterable[K],
+    max_workers: int,
+    follow_up: Optional[Callable[[K, R], Optional[Callable[[], R]]]] = None,
+    stop: Optional[threading.Event] = None
+) -> Iterator[Tuple[K, R]]:
+    """
+    Run fn over keys on a thread pool, yielding (key, result) as each completes.
+
+    Keys are read lazily: at most twice max_workers calls are queued at a
+    time, and the next key is submitted only when a result is yielded, so
+    large inputs are streamed. Results are yielded in completion order.
+
+    ``follow_up(key, result)`` can return a second call to make for the same
+    key (e.g. a detail lookup once an ID is known); it is submitted in the
+    key's slot, ahead of further keys, and its result is yielded (and
+    followed up) in place of the first one.
+
+    Once ``stop`` is set, no further calls are submitted, calls not yet
+    started are cancelled and the iteration ends as soon as a running call
+    returns (pass the event to the calls too, e.g. to
+    RateLimiter.acquire, so they return promptly). Calls not yet started
+    are also cancelled if the consumer stops iterating early.
+
+    Args:
+        fn: Called with each key on a worker thread
+        keys: Keys to process
+        max_workers: Worker threads
+        follow_up: Returns a further call for a key's result, or None if done
+        stop: Event ending the run early
+
+    Yields:
+        (key, final result)
+    """
+    keys = iter(keys)
+    max_workers = max(1, max_workers)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = {}
+
+    def stopped() -> bool:
+        return stop is not None and stop.is_set()
+
+    def submit_next() -> None:
+        if stopped():
+            return
+        for key in itertools.islice(keys, 1):
+            pending[executor.submit(fn, key)] = key
+
+    try:
+        for _ in range(max_workers * 2):
+            submit_next()
+
+        while pending and not stopped():
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = pending.pop(future)
+                result = future.result()
+                call = follow_up(key, result) if follow_up is not None else None
+                if call is not None:
+                    pending[executor.submit(call)] = key
+                    continue
+                submit_next()
+                yield key, result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
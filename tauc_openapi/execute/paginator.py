@@ -0,0 +1,249 @@
+"""Follow-all-pages iteration for paginated list endpoints."""
+
+import copy
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generic, Iterator, Optional, Tuple, Type, TypeVar
+from ..base.exceptions import TAUCApiException
+from ..base.tauc_request import TAUCRequest
+from ..base.tauc_response import TAUCResponse
+
+T = TypeVar('T', bound=TAUCResponse)
+
+# Page sizes tried, largest first, until the endpoint accepts one
+PAGE_SIZES = (1000, 500, 200, 100)
+
+# Error codes meaning the page size was rejected (parameter validation)
+PAGE_SIZE_REJECTED_CODES = frozenset({-70325, -70346})
+
+# Error codes meaning "nothing matches" rather than a failure
+EMPTY_RESULT_CODES = frozenset({-70301})
+
+# Concurrent page requests once the total is known
+DEFAULT_MAX_WORKERS = 8
+
+
+class Paginator(Generic[T]):
+    """
+    Iterates over every item of a paginated list endpoint.
+
+    Works with requests that have ``page``/``pageSize`` fields and responses
+    whose result has ``total``, ``page``, ``page_size`` and ``data`` (e.g.
+    GetNetworkNameListV2Result, NATLockedInventoryResult).
+
+    Pages are requested as iteration reaches them, so items are streamed
+    without loading the whole list. The page size is the
+    largest one the endpoint accepts: sizes from PAGE_SIZES are tried in
+    turn, and if the server returns fewer items than requested while more
+    remain (it capped the page size), the returned count is used from then
+    on. The accepted size is remembered per endpoint.
+
+    Once the first page gives ``total``, the remaining pages are requested
+    concurrently (at most max_workers in flight, a bounded window ahead of
+    the consumer) and yielded in page order. Items are de-duplicated by
+    ``dedupe_key`` (network ``id`` by default), since items moving between
+    pages during the crawl can show up twice; items without that attribute
+    are never dropped.
+
+    Usage::
+
+        for network in client.paginate(GetNetworkNameListV2Request(networkStatus="ONLINE"),
+                                       GetNetworkNameListV2Response):
+            print(network.id, network.network_name)
+    """
+
+    # Largest accepted page size per endpoint URL
+    _accepted_sizes: Dict[str, int] = {}
+
+    def __init__(
+        self,
+        client,
+        request: TAUCRequest,
+        response_class: Type[T],
+        page_size: Optional[int] = None,
+        access_token: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        dedupe_key: Optional[str] = "id"
+    ):
+        """
+        Initialize paginator.
+
+        Args:
+            client: ApiClient making the calls
+            request: List request (its page and pageSize are set per page)
+            response_class: Response class to instantiate
+            page_size: Fixed page size (default: largest accepted)
+            access_token: OAuth access token (see ApiClient.api_call)
+            max_workers: Concurrent page requests (1 = one page at a time)
+            dedupe_key: Item attribute identifying duplicates (None = keep all)
+        """
+        self.client = client
+        self.request = request
+        self.response_class = response_class
+        self.page_size = page_size
+        self.access_token = access_token
+        self.max_workers = max(1, max_workers)
+        self.dedupe_key = dedupe_key
+        self.total: Optional[int] = None  # Known after the first page
+        self.first_response: Optional[T] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over all items, fetching pages as needed."""
+        key = self.dedupe_key
+        seen = set()
+
+        for response in self.pages():
+            for item in response.result.data or ():
+                if key is not None:
+                    value = getattr(item, key, None)
+                    if value is not None:
+                        if value in seen:
+                            continue
+                        seen.add(value)
+                yield item
+
+    def _fetch(self, page: int, page_size: int) -> T:
+        """Request one page."""
+        request = copy.copy(self.request)
+        request.page = str(page)
+        request.pageSize = str(page_size)
+        return self.client.api_call(request, self.response_class, self.access_token)
+
+    def _check(self, response: T, page: int) -> bool:
+        """
+        Check a page response.
+
+        Returns:
+            False if the endpoint reported an empty result
+
+        Raises:
+            TAUCApiException: If the page request failed
+        """
+        if response.is_success():
+            return response.result is not None
+        if response.error_code in EMPTY_RESULT_CODES:
+            return False
+        raise TAUCApiException(
+            f"Failed to fetch page {page} of {self.request.get_url()}: "
+            f"{response.msg} (Code: {response.error_code})"
+        )
+
+    def first_page(self) -> Tuple[Optional[T], int]:
+        """
+        Fetch the first page, finding the largest accepted page size.
+
+        Returns:
+            (first page response, or None if the result is empty; page size)
+
+        Raises:
+            TAUCApiException: If the request failed
+        """
+        url = self.request.get_url()
+        if self.page_size is not None:
+            sizes = (self.page_size,)
+        elif url in self._accepted_sizes:
+            sizes = (self._accepted_sizes[url],)
+        else:
+            sizes = PAGE_SIZES
+
+        for index, size in enumerate(sizes):
+            response = self._fetch(0, size)
+            if response.error_code in PAGE_SIZE_REJECTED_CODES and index + 1 < len(sizes):
+                continue
+
+            self.first_response = response
+            if not self._check(response, 0):
+                self.total = 0
+                return None, size
+
+            result = response.result
+            count = len(result.data or ())
+            self.total = result.total
+            if self.total is not None and count < min(size, self.total):
+                # The server capped the page size; page with what it returns
+                size = count
+            if self.page_size is None and size:
+                self._accepted_sizes[url] = size
+            return response, size
+
+        raise TAUCApiException(f"No page size accepted by {url}")
+
+    def _has_more(self, response: T, page: int, size: int) -> bool:
+        """Check whether pages follow the given (non-empty) page."""
+        result = response.result
+        if len(result.data or ()) < size:
+            return False
+        total = result.total if result.total is not None else self.total
+        return total is None or (page + 1) * size < total
+
+    def _fetch_parallel(self, first: int, last: int, size: int) -> Iterator[Tuple[int, T]]:
+        """
+        Fetch a range of pages concurrently, yielding them in page order.
+
+        At most max_workers requests run at once, and at most twice that
+        many pages are fetched ahead of the consumer. Pages not yet started
+        are cancelled when the consumer stops early.
+
+        Args:
+            first: First page number
+            last: Last page number (inclusive)
+            size: Page size
+
+        Yields:
+            (page number, response)
+        """
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, last - first + 1))
+        page_numbers = iter(range(first, last + 1))
+        pending = deque()
+        try:
+            for page in itertools.islice(page_numbers, self.max_workers * 2):
+                pending.append((page, executor.submit(self._fetch, page, size)))
+
+            while pending:
+                page, future = pending.popleft()
+                response = future.result()
+                for next_page in itertools.islice(page_numbers, 1):
+                    pending.append((next_page, executor.submit(self._fetch, next_page, size)))
+                yield page, response
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def pages(self) -> Iterator[T]:
+        """
+        Iterate over page responses in order.
+
+        Raises:
+            TAUCApiException: If a page request failed
+        """
+        response, size = self.first_page()
+        if response is None:
+            return
+
+        yield response
+        if not size or not self._has_more(response, 0, size):
+            return
+
+        page = 1
+        if self.max_workers > 1 and self.total:
+            last_page = (self.total - 1) // size
+            if last_page > page:
+                for page, response in self._fetch_parallel(page, last_page, size):
+                    if not self._check(response, page) or not response.result.data:
+                        return
+                    yield response
+                    if not self._has_more(response, page, size):
+                        return
+                # The list grew past the first page's total
+                page = last_page + 1
+
+        while True:
+            response = self._fetch(page, size)
+            if not self._check(response, page) or not response.result.data:
+                return
+            yield response
+            if not self._has_more(response, page, size):
+                return
+            page += 1
@@ -0,0 +1,57 @@
+"""Token-bucket rate limiting for API calls shared between threads."""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Token bucket allowing ``rate`` calls per second with bursts of ``burst``.
+
+    acquire() blocks until a call may be made. Thread-safe, so one limiter
+    can pace every worker of a concurrent crawl.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Calls per second (must be positive)
+            burst: Calls allowed back to back before pacing starts
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cancel: Optional[threading.Event] = None) -> float:
+        """
+        Wait until a call may be made, and take its token.
+
+        Args:
+            cancel: Event ending the wait early; the token is then given
+                    back and the call must not be made
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (the balance may go negative) so that
+            # waiting threads are spaced out instead of waking together
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            if cancel is None:
+                time.sleep(wait)
+            elif cancel.wait(wait):
+                with self._lock:
+                    self._tokens += 1
+        return wait
@@ -0,0 +1,180 @@
+"""Encrypted on-disk OAuth token store shared between processes."""
+
+import base64
+import contextlib
+import hashlib
+import hmac
+import json
+import os
+import threading
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_MAGIC = b"TAUC-TOKEN-1"
+_NONCE_SIZE = 16
+_TAG_SIZE = 32
+_KDF_ITERATIONS = 100_000
+
+
+def _keystream_xor(key: bytes, nonce: bytes, data: bytes) -> bytes:
+    """XOR data with an HMAC-SHA256 counter-mode keystream."""
+    stream = bytearray()
+    counter = 0
+    while len(stream) < len(data):
+        stream += hmac.new(key, nonce + counter.to_bytes(8, "big"), hashlib.sha256).digest()
+        counter += 1
+    return bytes(a ^ b for a, b in zip(data, stream))
+
+
+class FileTokenStore:
+    """
+    Stores OAuth tokens in a directory, one encrypted file per client ID.
+
+    Lets several dashboard processes (and restarts) share tokens instead of
+    each requesting its own. Files are encrypted and authenticated with keys
+    derived from the client secret (PBKDF2-HMAC-SHA256), using only the
+    standard library: an HMAC-SHA256 counter-mode keystream for encryption
+    and HMAC-SHA256 over the ciphertext (encrypt-then-MAC). A file written
+    with a different secret, or tampered with, reads as missing.
+
+    Writes are atomic (temporary file + rename). lock() takes an exclusive
+    file lock per client ID so that only one process requests a new token
+    at a time; the others then read it from the store.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the token store.
+
+        Args:
+            directory: Directory holding the token files (created if missing)
+        """
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        self._keys: Dict[Tuple[str, str], Tuple[bytes, bytes]] = {}
+        self._keys_lock = threading.Lock()
+
+    def _path(self, client_id: str, suffix: str) -> str:
+        """Get the path of a client's token or lock file."""
+        name = hashlib.sha256(client_id.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, name + suffix)
+
+    def _derive_keys(self, client_id: str, secret: str) -> Tuple[bytes, bytes]:
+        """Derive (encryption key, MAC key) for a client, cached per process."""
+        with self._keys_lock:
+            keys = self._keys.get((client_id, secret))
+            if keys is None:
+                material = hashlib.pbkdf2_hmac(
+                    "sha256", secret.encode("utf-8"), b"tauc-token-store:" + client_id.encode("utf-8"),
+                    _KDF_ITERATIONS, dklen=64
+                )
+                keys = self._keys[(client_id, secret)] = (material[:32], material[32:])
+            return keys
+
+    @contextlib.contextmanager
+    def lock(self, client_id: str) -> Iterator[None]:
+        """
+        Hold an exclusive, cross-process lock for a client's token.
+
+        If the lock file cannot be opened or locked (read-only or full
+        directory, no lock support), nothing is held: the store only saves
+        token requests, so processes then just may request a token each.
+
+        Args:
+            client_id: OAuth client ID
+        """
+        try:
+            fd = os.open(self._path(client_id, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError:
+            yield
+            return
+        try:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            except OSError:
+                locked = False
+            else:
+                locked = True
+            try:
+                yield
+            finally:
+                if locked:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_UN)
+                    else:
+                        os.lseek(fd, 0, os.SEEK_SET)
+                        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def load(self, client_id: str, secret: str) -> Optional[Tuple[str, Optional[float]]]:
+        """
+        Read a client's token.
+
+        Args:
+            client_id: OAuth client ID
+            secret: OAuth client secret
+
+        Returns:
+            (access token, expires_at), or None if missing, unreadable, or not
+            written with this secret
+        """
+        try:
+            with open(self._path(client_id, ".token"), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        header = len(_MAGIC) + _NONCE_SIZE + _TAG_SIZE
+        if len(data) < header or not data.startswith(_MAGIC):
+            return None
+        nonce = data[len(_MAGIC):len(_MAGIC) + _NONCE_SIZE]
+        tag = data[len(_MAGIC) + _NONCE_SIZE:header]
+        ciphertext = data[header:]
+
+        enc_key, mac_key = self._derive_keys(client_id, secret)
+        expected = hmac.new(mac_key, _MAGIC + nonce + ciphertext, hashlib.sha256).digest()
+        if not hmac.compare_digest(tag, expected):
+            return None
+
+        try:
+            payload = json.loads(_keystream_xor(enc_key, nonce, ciphertext))
+            return payload["access_token"], payload.get("expires_at")
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, client_id: str, secret: str, access_token: str, expires_at: Optional[float]) -> None:
+        """
+        Write a client's token (atomically replacing any previous one).
+
+        Args:
+            client_id: OAuth client ID
+            secret: OAuth client secret
+            access_token: Access token
+            expires_at: Unix time after which the token is not used
+        """
+        enc_key, mac_key = self._derive_keys(client_id, secret)
+        plaintext = json.dumps({"access_token": access_token, "expires_at": expires_at}).encode("utf-8")
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = _keystream_xor(enc_key, nonce, plaintext)
+        tag = hmac.new(mac_key, _MAGIC + nonce + ciphertext, hashlib.sha256).digest()
+
+        path = self._path(client_id, ".token")
+        tmp_path = f"{path}.{os.getpid()}.{base64.urlsafe_b64encode(os.urandom(6)).decode()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_MAGIC + nonce + tag + ciphertext)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
@@ -4,8 +4,13 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.poolmanager import PoolManager
 import ssl
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 from ..base.exceptions import TAUCApiException
+from ..base.streaming_body import StreamingBody
+
+# Pooled connections kept per host; sized for concurrent page and status
+# fetches (see Paginator) so parallel requests reuse their TLS connections
+POOL_MAXSIZE = 32
 
 
 class SSLAdapter(HTTPAdapter):
@@ -57,7 +62,7 @@ class HttpClient:
         self.verify_ssl = verify_ssl
 
         # Mount SSL adapter for HTTPS requests
-        ssl_adapter = SSLAdapter(client_cert_path, client_key_path)
+        ssl_adapter = SSLAdapter(client_cert_path, client_key_path, pool_maxsize=POOL_MAXSIZE)
         self.session.mount('https://', ssl_adapter)
 
     def request(
@@ -67,7 +72,7 @@ class HttpClient:
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, str]] = None,
         json_data: Optional[dict] = None,
-        data: Optional[str] = None
+        data: Optional[Union[bytes, StreamingBody]] = None
     ) -> requests.Response:
         """
         Make HTTP request.
@@ -78,7 +83,7 @@ class HttpClient:
             headers: Request headers
             params: Query parameters
             json_data: JSON data for request body
-            data: Raw string data for request body
+            data: Raw request body bytes, or a StreamingBody sent chunk by chunk
 
         Returns:
             requests.Response object
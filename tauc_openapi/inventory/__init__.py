@@ -0,0 +1,26 @@
+"""Local inventory mirror, index, details crawler, status sweeps, snapshots, device cache and bulk device lookup (loaded lazily on first access)."""
+
+from ..base.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    "BulkDeviceResolver": ".bulk_lookup",
+    "CrawlResult": ".crawler",
+    "DetailsCrawler": ".crawler",
+    "DeviceCache": ".device_cache",
+    "DeviceLookup": ".device_cache",
+    "InventoryIndex": ".index",
+    "InventoryMirror": ".mirror",
+    "StatusSync": ".mirror",
+    "RecordChange": ".snapshot",
+    "SnapshotInfo": ".snapshot",
+    "SnapshotStore": ".snapshot",
+    "StatusChange": ".status_sweep",
+    "StatusSweeper": ".status_sweep",
+    "SweepResult": ".status_sweep",
+    "NETWORK_STATUSES": ".mirror",
+    "REPORTED_STATUSES": ".status_sweep",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+__all__ = ["BulkDeviceResolver", "CrawlResult", "DetailsCrawler", "DeviceCache", "DeviceLookup", "InventoryIndex", "InventoryMirror", "RecordChange", "SnapshotInfo", "SnapshotStore", "StatusSync", "StatusChange", "StatusSweeper", "SweepResult", "NETWORK_STATUSES", "REPORTED_STATUSES"]
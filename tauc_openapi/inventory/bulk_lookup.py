@@ -0,0 +1,133 @@
+"""Concurrent, rate-limited resolution of many devices by SN and MAC."""
+
+import functools
+import threading
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+from ..execute.concurrency import run_bounded
+from ..execute.rate_limiter import RateLimiter
+from .device_cache import DeviceCache, DeviceLookup
+from .mirror import normalize_mac
+
+# Concurrent API calls
+DEFAULT_MAX_WORKERS = 8
+
+# API calls per second across all workers
+DEFAULT_RATE = 20.0
+
+
+class BulkDeviceResolver:
+    """
+    Resolves many SN/MAC pairs to device IDs and device information.
+
+    The two API steps are pipelined: each pair's GetDeviceInfo call is
+    submitted as soon as its GetDeviceId call returns, while GetDeviceId
+    calls for the following pairs are still running, so both steps share
+    the worker pool instead of running one after the other. Every API call
+    waits for the rate limiter first; answers come from (and go into) the
+    account's DeviceCache, so repeated pairs and devices cost no calls.
+
+    Pairs are read from the input iterable as workers free up (at most
+    twice max_workers pairs in flight), so large uploads are streamed.
+
+    Usage::
+
+        resolver = BulkDeviceResolver(client, access_token=token)
+        for lookup in resolver.resolve_many(pairs):
+            print(lookup.sn, lookup.device_id)
+    """
+
+    def __init__(
+        self,
+        client,
+        cache: Optional[DeviceCache] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate: Optional[float] = DEFAULT_RATE,
+        access_token: Optional[str] = None,
+        with_info: bool = True
+    ):
+        """
+        Initialize resolver.
+
+        Args:
+            client: ApiClient making the calls
+            cache: Device cache (default: the account's shared cache)
+            max_workers: Concurrent API calls
+            rate: API calls per second across all workers (None = unlimited)
+            access_token: OAuth access token (see ApiClient.api_call)
+            with_info: Also get the device information (GetDeviceInfo)
+        """
+        self.client = client
+        self.cache = cache if cache is not None else DeviceCache.for_account(client)
+        self.max_workers = max(1, max_workers)
+        self.limiter = RateLimiter(rate, burst=self.max_workers) if rate else None
+        self.access_token = access_token
+        self.with_info = with_info
+        self.api_calls = 0
+        self._calls_lock = threading.Lock()
+
+    def _count_call(self, cached: bool) -> None:
+        """Count an API call made for a lookup step."""
+        if not cached:
+            with self._calls_lock:
+                self.api_calls += 1
+
+    @staticmethod
+    def _failed(response_class, error: Exception):
+        """Response standing in for a call that raised (no error code, message set)."""
+        response = response_class()
+        response.msg = str(error)
+        return response
+
+    def _resolve_id(self, pair: Tuple[str, str]) -> DeviceLookup:
+        """
+        Pipeline step 1: GetDeviceId.
+
+        The result is decoded here, on the worker thread, so a response that
+        fails to decode is reported for this pair like a failed call.
+        """
+        from ..models import GetDeviceIdResponse
+
+        sn, mac = pair
+        try:
+            lookup = self.cache.resolve_id(self.client, sn, mac, self.access_token, self.limiter)
+            lookup.device_id  # Decode now
+        except Exception as e:
+            lookup = DeviceLookup(sn=sn, mac=normalize_mac(mac) or "", id_response=self._failed(GetDeviceIdResponse, e))
+        self._count_call(lookup.id_cached)
+        return lookup
+
+    def _resolve_info(self, lookup: DeviceLookup) -> DeviceLookup:
+        """Pipeline step 2: GetDeviceInfo (decoded on the worker thread, as in step 1)."""
+        from ..models import GetDeviceInfoResponse
+
+        try:
+            self.cache.resolve_info(self.client, lookup, self.access_token, self.limiter)
+            lookup.device_info  # Decode now
+        except Exception as e:
+            lookup.info_response = self._failed(GetDeviceInfoResponse, e)
+        self._count_call(lookup.info_cached)
+        return lookup
+
+    def _follow_up(self, pair: Tuple[str, str], lookup: DeviceLookup) -> Optional[Callable[[], DeviceLookup]]:
+        """Get step 2 for a lookup whose step 1 found a device ID (None if done)."""
+        if self.with_info and lookup.device_id and lookup.info_response is None:
+            return functools.partial(self._resolve_info, lookup)
+        return None
+
+    def resolve_many(self, pairs: Iterable[Tuple[str, str]]) -> Iterator[DeviceLookup]:
+        """
+        Resolve SN/MAC pairs, yielding each lookup as soon as it completes.
+
+        Lookups are yielded in completion order, not input order. A failed
+        call is reported in the lookup's responses (error code and message;
+        no error code if the request itself failed) rather than raised, so
+        one bad device does not stop the run.
+
+        Args:
+            pairs: (serial number, MAC address) pairs; MACs in any format
+
+        Yields:
+            DeviceLookup per pair (with device information if with_info and found)
+        """
+        for _, lookup in run_bounded(self._resolve_id, pairs, self.max_workers, self._follow_up):
+            yield lookup
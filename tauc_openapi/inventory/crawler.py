@@ -0,0 +1,195 @@
+"""Fleet-wide, resumable crawl of network details into an InventoryMirror."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from ..execute.concurrency import run_bounded
+from ..execute.rate_limiter import RateLimiter
+from .mirror import InventoryMirror, StatusSync
+
+# Concurrent GetNetworkDetails / GetDeviceInfo requests
+DEFAULT_MAX_WORKERS = 8
+
+# API calls per second across all workers
+DEFAULT_RATE = 10.0
+
+
+@dataclass
+class CrawlResult:
+    """
+    Outcome of a details crawl.
+
+    Attributes:
+        crawl_id: Crawl ID in the mirror
+        resumed: True if an unfinished crawl was resumed
+        total: Networks whose details were due
+        fetched: Networks whose details were fetched
+        changed: Networks whose stored details changed
+        devices: Devices whose information was fetched
+        failed: Network ID -> error message, for failed GetNetworkDetails requests
+        failed_devices: Device ID -> error message, for failed GetDeviceInfo requests
+        listings: Per-status StatusSync of the listing refresh
+        finished: True if every due network was attempted (the crawl will not resume)
+        elapsed: Seconds taken
+    """
+    crawl_id: int
+    resumed: bool = False
+    total: int = 0
+    fetched: int = 0
+    changed: int = 0
+    devices: int = 0
+    failed: Dict[int, str] = field(default_factory=dict)
+    failed_devices: Dict[str, str] = field(default_factory=dict)
+    listings: List[StatusSync] = field(default_factory=list)
+    finished: bool = False
+    elapsed: float = 0.0
+
+
+class DetailsCrawler:
+    """
+    Fetches GetNetworkDetails for every network into an InventoryMirror.
+
+    A crawl first refreshes the network listings (InventoryMirror.sync), so
+    it walks every network ID the list endpoints return, then fetches the
+    details of networks whose stored details are older than the crawl
+    (or than ``max_age``) concurrently, with every request paced by one
+    shared RateLimiter. Each network's mesh units and tags are written as
+    soon as they arrive, so an interrupted crawl loses nothing: the next
+    crawl resumes it and fetches only the networks it had not reached.
+
+    A crawl finishes once every due network has been attempted. Failed
+    requests are reported in the result rather than keeping the crawl
+    open, so one network that keeps failing does not pin later crawls to
+    an old cutoff; it is due again in the next crawl, as its details are
+    still missing or old.
+
+    With ``with_device_info``, GetDeviceInfo is then called once for each
+    device ID without stored information, recording device models and
+    firmware so networks can be found by model. Devices whose request
+    failed still have no information, so the next crawl retries them.
+
+    Usage::
+
+        crawler = DetailsCrawler(mirror, access_token=token)
+        result = crawler.crawl()
+        mirror.find_by_model("X50")
+    """
+
+    def __init__(
+        self,
+        mirror: InventoryMirror,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate: Optional[float] = DEFAULT_RATE,
+        access_token: Optional[str] = None,
+        with_device_info: bool = True
+    ):
+        """
+        Initialize crawler.
+
+        Args:
+            mirror: Inventory mirror receiving the details (its client makes the calls)
+            max_workers: Concurrent API requests
+            rate: API calls per second across all workers (None = unlimited)
+            access_token: OAuth access token (see ApiClient.api_call)
+            with_device_info: Also fetch device models and firmware (GetDeviceInfo)
+        """
+        self.mirror = mirror
+        self.max_workers = max(1, max_workers)
+        self.limiter = RateLimiter(rate, burst=self.max_workers) if rate else None
+        self.access_token = access_token
+        self.with_device_info = with_device_info
+
+    def _call(self, request, response_class):
+        """Make a rate-limited API call."""
+        if self.limiter is not None:
+            self.limiter.acquire()
+        return self.mirror.client.api_call(request, response_class, self.access_token)
+
+    def _fetch_details(self, network_id: int):
+        """Fetch one network's details, returning (network or None, error)."""
+        from ..models import GetNetworkDetailsRequest, GetNetworkDetailsResponse
+
+        try:
+            response = self._call(GetNetworkDetailsRequest(str(network_id)), GetNetworkDetailsResponse)
+        except Exception as e:
+            return None, str(e)
+        if not response.is_success() or not response.result or not response.result.network:
+            return None, f"{response.msg} (Code: {response.error_code})"
+        return response.result.network, None
+
+    def _fetch_device_info(self, device_id: str):
+        """Fetch one device's information, returning (DeviceInfo list or None, error)."""
+        from ..models import GetDeviceInfoRequest, GetDeviceInfoResponse
+
+        try:
+            response = self._call(GetDeviceInfoRequest(device_id=device_id), GetDeviceInfoResponse)
+        except Exception as e:
+            return None, str(e)
+        if not response.is_success():
+            return None, f"{response.msg} (Code: {response.error_code})"
+        return response.result or [], None
+
+    def _run(self, fn: Callable, keys: Iterable) -> Iterator[Tuple[object, Tuple]]:
+        """Run fn over keys concurrently, yielding (key, result) as each completes."""
+        return run_bounded(fn, keys, self.max_workers)
+
+    def crawl(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        max_age: Optional[float] = None,
+        list_max_age: Optional[float] = None,
+        resume: bool = True,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> CrawlResult:
+        """
+        Refresh the listings, then fetch the details of every network that is due.
+
+        Args:
+            statuses: Network statuses to crawl (default: all)
+            max_age: Keep details fetched less than this many seconds ago
+                     (default: refetch all)
+            list_max_age: Reuse listings refreshed less than this many seconds
+                          ago (see InventoryMirror.sync)
+            resume: Resume the last crawl if it was interrupted
+            progress: Called with (networks done, networks due) after each network
+
+        Returns:
+            CrawlResult
+        """
+        started = time.perf_counter()
+        statuses = list(statuses) if statuses is not None else None
+        listings = self.mirror.sync(statuses, list_max_age, access_token=self.access_token)
+
+        crawl_id, cutoff, resumed = self.mirror.begin_crawl(max_age, resume)
+        result = CrawlResult(crawl_id=crawl_id, resumed=resumed, listings=listings)
+        network_ids = self.mirror.networks_with_details_before(cutoff, statuses)
+        result.total = len(network_ids)
+
+        done = 0
+        for network_id, (network, error) in self._run(self._fetch_details, network_ids):
+            done += 1
+            if network is None:
+                result.failed[network_id] = error
+            else:
+                try:
+                    result.changed += self.mirror.store_details(network_id, network)
+                    result.fetched += 1
+                except Exception as e:
+                    result.failed[network_id] = f"Failed to store details: {e}"
+            if progress is not None:
+                progress(done, result.total)
+
+        self.mirror.finish_crawl(crawl_id)
+        result.finished = True
+
+        if self.with_device_info:
+            fetched_at = time.time()
+            for device_id, (infos, error) in self._run(self._fetch_device_info, self.mirror.devices_without_info()):
+                if infos is None:
+                    result.failed_devices[device_id] = error
+                else:
+                    result.devices += 1
+                    self.mirror.store_device_infos(infos, fetched_at)
+
+        result.elapsed = time.perf_counter() - started
+        return result
@@ -0,0 +1,342 @@
+"""LRU cache for device ID resolution and device information."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from ..base.tauc_response import TAUCResponse
+from .mirror import normalize_mac
+
+# GetDeviceId error codes meaning "no such device" (cached briefly); other
+# errors (authentication, rate limits, outages) are never cached
+NEGATIVE_RESULT_CODES = frozenset({-70346, -40310})
+
+_MISSING = object()
+
+
+class _LRUCache:
+    """Thread-safe bounded LRU mapping with optional per-entry expiry."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Get a value (marking it recently used), or _MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used beyond max_size."""
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a value if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class DeviceLookup:
+    """
+    Outcome of resolving a device by SN and MAC.
+
+    Attributes:
+        sn: Serial number
+        mac: MAC address (normalized)
+        id_response: GetDeviceId response (from the cache if id_cached)
+        info_response: GetDeviceInfo response, or None if not requested or
+                       no device ID was found
+        id_cached: True if the device ID came from the cache
+        info_cached: True if the device information came from the cache
+    """
+    sn: str
+    mac: str
+    id_response: TAUCResponse
+    info_response: Optional[TAUCResponse] = None
+    id_cached: bool = False
+    info_cached: bool = False
+
+    @property
+    def device_id(self) -> Optional[str]:
+        """Resolved device ID, or None."""
+        response = self.id_response
+        if response.is_success() and response.result:
+            return response.result.device_id
+        return None
+
+    @property
+    def device_info(self) -> List[Any]:
+        """DeviceInfo list from GetDeviceInfo (empty if unavailable)."""
+        response = self.info_response
+        if response is not None and response.is_success() and response.result:
+            return response.result
+        return []
+
+
+class DeviceCache:
+    """
+    Caches the two-step device resolution: (SN, MAC) -> device ID -> device info.
+
+    Device IDs never change for a given SN/MAC pair, so they are kept until
+    evicted (least recently used first, at most ``max_size`` pairs).
+    "No such device" answers are kept for ``negative_ttl`` seconds, so
+    repeated typos do not hit the API but newly registered devices are
+    found soon after. Device information (firmware, topology role) changes,
+    so it is kept for ``info_ttl`` seconds.
+
+    The cached values are the API responses themselves, so callers can show
+    the same details (and raw JSON) for cached and fresh lookups.
+
+    One cache is shared per TAUC account (for_account). Thread-safe.
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+    NEGATIVE_TTL = 60.0
+    INFO_TTL = 300.0
+
+    # Shared caches (account -> cache)
+    _caches: Dict[str, 'DeviceCache'] = {}
+    _caches_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        negative_ttl: float = NEGATIVE_TTL,
+        info_ttl: float = INFO_TTL
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum SN/MAC pairs (and device infos) kept
+            negative_ttl: Seconds "no such device" answers are kept
+            info_ttl: Seconds device information is kept
+        """
+        self.negative_ttl = negative_ttl
+        self.info_ttl = info_ttl
+        self._ids = _LRUCache(max_size)
+        self._infos = _LRUCache(max_size)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_account(cls, client) -> 'DeviceCache':
+        """
+        Get the shared cache for an API client's account, creating it on first use.
+
+        Args:
+            client: ApiClient
+
+        Returns:
+            Device cache
+        """
+        account = client.account_key
+        with cls._caches_lock:
+            cache = cls._caches.get(account)
+            if cache is None:
+                cache = cls._caches[account] = cls()
+            return cache
+
+    @staticmethod
+    def _key(sn: str, mac: str) -> Tuple[str, str]:
+        """Cache key for an SN/MAC pair."""
+        return sn.strip(), normalize_mac(mac) or ""
+
+    def get_device_id(self, sn: str, mac: str) -> Optional[TAUCResponse]:
+        """
+        Get a cached GetDeviceId response.
+
+        Returns:
+            Response (successful, or a recent "no such device"), or None if not cached
+        """
+        response = self._ids.get(self._key(sn, mac))
+        return None if response is _MISSING else response
+
+    def put_device_id(self, sn: str, mac: str, response: TAUCResponse) -> None:
+        """
+        Cache a GetDeviceId response if it is cacheable.
+
+        Successful responses with a device ID are kept until evicted; "no
+        such device" errors for negative_ttl seconds; others are not cached.
+        """
+        key = self._key(sn, mac)
+        if response.is_success() and response.result and response.result.device_id:
+            self._ids.put(key, response)
+        elif response.error_code in NEGATIVE_RESULT_CODES:
+            self._ids.put(key, response, self.negative_ttl)
+
+    def get_device_info(self, device_id: str) -> Optional[TAUCResponse]:
+        """
+        Get a cached GetDeviceInfo response.
+
+        Returns:
+            Response, or None if not cached or expired
+        """
+        response = self._infos.get(device_id)
+        return None if response is _MISSING else response
+
+    def put_device_info(self, device_id: str, response: TAUCResponse) -> None:
+        """Cache a successful GetDeviceInfo response for info_ttl seconds."""
+        if response.is_success() and response.result:
+            self._infos.put(device_id, response, self.info_ttl)
+
+    def invalidate(self, sn: Optional[str] = None, mac: Optional[str] = None,
+                   device_id: Optional[str] = None) -> None:
+        """
+        Drop cached entries (e.g. after a device was removed or re-registered).
+
+        Args:
+            sn: Serial number (with mac: drop that pair's device ID)
+            mac: MAC address
+            device_id: Drop that device's information
+        """
+        if sn is not None and mac is not None:
+            self._ids.pop(self._key(sn, mac))
+        if device_id is not None:
+            self._infos.pop(device_id)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._ids.clear()
+        self._infos.clear()
+
+    def resolve_id(
+        self,
+        client,
+        sn: str,
+        mac: str,
+        access_token: Optional[str] = None,
+        limiter=None
+    ) -> DeviceLookup:
+        """
+        Resolve a device's ID, calling GetDeviceId only on a cache miss.
+
+        Args:
+            client: ApiClient making the call
+            sn: Serial number
+            mac: MAC address (any format; sent normalized)
+            access_token: OAuth access token (see ApiClient.api_call)
+            limiter: RateLimiter paced before the API call (optional)
+
+        Returns:
+            DeviceLookup without device information
+        """
+        from ..models import GetDeviceIdRequest, GetDeviceIdResponse
+
+        mac = normalize_mac(mac) or ""
+        lookup = DeviceLookup(sn=sn, mac=mac, id_response=self.get_device_id(sn, mac))
+        if lookup.id_response is not None:
+            lookup.id_cached = True
+            self.hits += 1
+        else:
+            self.misses += 1
+            if limiter is not None:
+                limiter.acquire()
+            lookup.id_response = client.api_call(
+                GetDeviceIdRequest(sn=sn, mac=mac), GetDeviceIdResponse, access_token
+            )
+            self.put_device_id(sn, mac, lookup.id_response)
+        return lookup
+
+    def resolve_info(
+        self,
+        client,
+        lookup: DeviceLookup,
+        access_token: Optional[str] = None,
+        limiter=None
+    ) -> DeviceLookup:
+        """
+        Add the device information to a lookup with a device ID, calling
+        GetDeviceInfo only on a cache miss.
+
+        Args:
+            client: ApiClient making the call
+            lookup: Lookup from resolve_id (unchanged if it has no device ID)
+            access_token: OAuth access token (see ApiClient.api_call)
+            limiter: RateLimiter paced before the API call (optional)
+
+        Returns:
+            The same lookup
+        """
+        from ..models import GetDeviceInfoRequest, GetDeviceInfoResponse
+
+        device_id = lookup.device_id
+        if not device_id:
+            return lookup
+        lookup.info_response = self.get_device_info(device_id)
+        if lookup.info_response is not None:
+            lookup.info_cached = True
+            self.hits += 1
+        else:
+            self.misses += 1
+            if limiter is not None:
+                limiter.acquire()
+            lookup.info_response = client.api_call(
+                GetDeviceInfoRequest(device_id=device_id), GetDeviceInfoResponse, access_token
+            )
+            self.put_device_info(device_id, lookup.info_response)
+        return lookup
+
+    def resolve(
+        self,
+        client,
+        sn: str,
+        mac: str,
+        access_token: Optional[str] = None,
+        with_info: bool = True
+    ) -> DeviceLookup:
+        """
+        Resolve a device's ID (and information), calling the API only on cache misses.
+
+        Args:
+            client: ApiClient making the calls
+            sn: Serial number
+            mac: MAC address (any format; sent normalized)
+            access_token: OAuth access token (see ApiClient.api_call)
+            with_info: Also get the device information (GetDeviceInfo)
+
+        Returns:
+            DeviceLookup with both responses
+        """
+        lookup = self.resolve_id(client, sn, mac, access_token)
+        if with_info:
+            self.resolve_info(client, lookup, access_token)
+        return lookup
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Get the cache's metrics.
+
+        Returns:
+            Dict with cached pairs, cached device infos, hits and misses
+        """
+        return {
+            "device_ids": len(self._ids),
+            "device_infos": len(self._infos),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
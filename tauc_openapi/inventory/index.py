@@ -0,0 +1,231 @@
+"""In-memory inventory index for O(1) name, SN and MAC lookups."""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+from .mirror import normalize_mac
+
+
+class InventoryIndex:
+    """
+    Hash-map index of networks by lowercase name, SN and normalized MAC.
+
+    Filled from list calls (load(), e.g. with InventoryMirror.get_networks()
+    and get_mesh_units()) and kept in step by the mutation methods when the
+    dashboard adds, deletes or re-locks networks, so lookups are dict reads
+    with no network round trip and no scan.
+
+    ``version`` is incremented on every change, so callers can tell whether
+    results they derived from the index are still current. The index is
+    ``expired`` once ``ttl`` seconds have passed since the last load; it
+    still answers lookups, and callers decide when to reload it.
+
+    Thread-safe; lookups return copies.
+    """
+
+    DEFAULT_TTL = 300.0
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        """
+        Initialize an empty (expired) index.
+
+        Args:
+            ttl: Seconds after a load before the index counts as expired
+        """
+        self.ttl = ttl
+        self.version = 0
+        self.loaded_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self._networks: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, Set[int]] = {}
+        self._by_sn: Dict[str, int] = {}
+        self._by_mac: Dict[str, int] = {}
+        self._units: Dict[int, List[Any]] = {}  # network id -> [(sn, mac)]
+
+    @property
+    def expired(self) -> bool:
+        """True if never loaded or loaded more than ttl seconds ago."""
+        return self.loaded_at is None or time.time() - self.loaded_at >= self.ttl
+
+    def __len__(self) -> int:
+        return len(self._networks)
+
+    # Loading
+
+    def load(
+        self,
+        networks: Iterable[Dict[str, Any]],
+        mesh_units: Optional[Iterable[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Replace the index contents.
+
+        Args:
+            networks: Networks as {id, name, status} dicts
+            mesh_units: Mesh units as {network_id, sn, mac} dicts (default: keep none)
+        """
+        with self._lock:
+            self._networks.clear()
+            self._by_name.clear()
+            self._by_sn.clear()
+            self._by_mac.clear()
+            self._units.clear()
+            for network in networks:
+                self._put(network["id"], network.get("name"), network.get("status"))
+            for unit in mesh_units or ():
+                self._put_unit(unit["network_id"], unit.get("sn"), unit.get("mac"))
+            self.loaded_at = time.time()
+            self.version += 1
+
+    def invalidate(self) -> None:
+        """Mark the index expired (contents are kept until the next load)."""
+        with self._lock:
+            self.loaded_at = None
+            self.version += 1
+
+    def _put(self, network_id: int, name: Optional[str], status: Optional[str]) -> None:
+        """Insert or replace a network (lock held)."""
+        old = self._networks.get(network_id)
+        if old is not None and old["name"] != name:
+            self._unlink_name(network_id, old["name"])
+        self._networks[network_id] = {"id": network_id, "name": name, "status": status}
+        if name:
+            self._by_name.setdefault(name.lower(), set()).add(network_id)
+
+    def _unlink_name(self, network_id: int, name: Optional[str]) -> None:
+        """Remove a network from the name map (lock held)."""
+        if not name:
+            return
+        ids = self._by_name.get(name.lower())
+        if ids is not None:
+            ids.discard(network_id)
+            if not ids:
+                del self._by_name[name.lower()]
+
+    def _put_unit(self, network_id: int, sn: Optional[str], mac: Optional[str]) -> None:
+        """Index a mesh unit of a network (lock held)."""
+        mac = normalize_mac(mac)
+        if sn:
+            self._by_sn[sn] = network_id
+        if mac:
+            self._by_mac[mac] = network_id
+        self._units.setdefault(network_id, []).append((sn, mac))
+
+    def _drop_units(self, network_id: int) -> None:
+        """Remove a network's mesh units (lock held)."""
+        for sn, mac in self._units.pop(network_id, ()):
+            if sn and self._by_sn.get(sn) == network_id:
+                del self._by_sn[sn]
+            if mac and self._by_mac.get(mac) == network_id:
+                del self._by_mac[mac]
+
+    # Mutations
+
+    def add_network(self, network_id: int, name: Optional[str], status: Optional[str] = None) -> None:
+        """
+        Add or update a network (e.g. after adding it, or a by-name lookup).
+
+        Args:
+            network_id: Network ID
+            name: Network name
+            status: Network status (None if unknown)
+        """
+        with self._lock:
+            self._put(int(network_id), name, status)
+            self.version += 1
+
+    def set_mesh_units(self, network_id: int, mesh_units: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace a network's mesh units (e.g. from GetNetworkDetails).
+
+        Args:
+            network_id: Network ID
+            mesh_units: Mesh units as {sn, mac} dicts
+        """
+        with self._lock:
+            network_id = int(network_id)
+            self._drop_units(network_id)
+            for unit in mesh_units:
+                self._put_unit(network_id, unit.get("sn"), unit.get("mac"))
+            self.version += 1
+
+    def set_status(self, network_id: int, status: Optional[str]) -> None:
+        """
+        Set a network's status (e.g. after NAT-locking it).
+
+        Args:
+            network_id: Network ID
+            status: New status (None if unknown)
+        """
+        with self._lock:
+            network = self._networks.get(int(network_id))
+            if network is not None:
+                network["status"] = status
+                self.version += 1
+
+    def remove_network(self, network_id: int) -> None:
+        """
+        Remove a network and its mesh units (e.g. after deleting it).
+
+        Args:
+            network_id: Network ID
+        """
+        with self._lock:
+            network = self._networks.pop(int(network_id), None)
+            if network is not None:
+                self._unlink_name(network["id"], network["name"])
+                self._drop_units(network["id"])
+                self.version += 1
+
+    # Lookups
+
+    def get(self, network_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a network by ID.
+
+        Returns:
+            {id, name, status}, or None if not indexed
+        """
+        with self._lock:
+            network = self._networks.get(int(network_id))
+            return dict(network) if network is not None else None
+
+    def find_by_name(self, name: str, case_sensitive: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find networks by name.
+
+        Args:
+            name: Network name
+            case_sensitive: Whether to match case-sensitively
+
+        Returns:
+            List of {id, name, status}, ordered by ID
+        """
+        with self._lock:
+            ids = self._by_name.get(name.lower()) if name else None
+            matches = [dict(self._networks[i]) for i in sorted(ids or ())]
+        if case_sensitive:
+            matches = [network for network in matches if network["name"] == name]
+        return matches
+
+    def find_by_sn(self, sn: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the network containing a mesh unit by serial number.
+
+        Returns:
+            {id, name, status}, or None if not indexed
+        """
+        with self._lock:
+            network_id = self._by_sn.get(sn)
+            return self.get(network_id) if network_id is not None else None
+
+    def find_by_mac(self, mac: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the network containing a mesh unit by MAC address (any format).
+
+        Returns:
+            {id, name, status}, or None if not indexed
+        """
+        with self._lock:
+            network_id = self._by_mac.get(normalize_mac(mac))
+            return self.get(network_id) if network_id is not None else None
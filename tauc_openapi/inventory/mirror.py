@@ -0,0 +1,788 @@
+"""Local SQLite mirror of the network inventory."""
+
+import contextlib
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from ..base.tauc_response import TAUCResponse
+from ..execute.paginator import DEFAULT_MAX_WORKERS
+
+# All values of GetNetworkNameListV2's networkStatus parameter
+NETWORK_STATUSES = ("ONLINE", "OFFLINE", "ABNORMAL", "INVENTORY", "NAT-LOCKED", "SUSPEND")
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS networks (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    name_key TEXT,
+    status TEXT,
+    listed_at REAL NOT NULL,
+    details_hash TEXT,
+    details_at REAL
+);
+CREATE INDEX IF NOT EXISTS networks_name_key ON networks (name_key);
+CREATE INDEX IF NOT EXISTS networks_status ON networks (status);
+
+CREATE TABLE IF NOT EXISTS mesh_units (
+    network_id INTEGER NOT NULL REFERENCES networks (id) ON DELETE CASCADE,
+    sn TEXT,
+    mac TEXT,
+    device_id TEXT,
+    topo_role TEXT
+);
+CREATE INDEX IF NOT EXISTS mesh_units_network ON mesh_units (network_id);
+CREATE INDEX IF NOT EXISTS mesh_units_sn ON mesh_units (sn);
+CREATE INDEX IF NOT EXISTS mesh_units_mac ON mesh_units (mac);
+CREATE INDEX IF NOT EXISTS mesh_units_device_id ON mesh_units (device_id);
+CREATE INDEX IF NOT EXISTS mesh_units_topo_role ON mesh_units (topo_role);
+
+CREATE TABLE IF NOT EXISTS tags (
+    network_id INTEGER NOT NULL REFERENCES networks (id) ON DELETE CASCADE,
+    name TEXT,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS tags_network ON tags (network_id);
+CREATE INDEX IF NOT EXISTS tags_name_value ON tags (name, value);
+
+CREATE TABLE IF NOT EXISTS devices (
+    device_id TEXT PRIMARY KEY,
+    model TEXT,
+    model_key TEXT,
+    category TEXT,
+    fw_version TEXT,
+    fetched_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS devices_model_key ON devices (model_key);
+
+CREATE TABLE IF NOT EXISTS crawls (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    cutoff REAL NOT NULL,
+    finished_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    status TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    total INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL
+);
+"""
+
+_MAC_SEPARATORS = re.compile(r"[^0-9A-Fa-f]")
+
+
+def normalize_mac(mac: Optional[str]) -> Optional[str]:
+    """Normalize a MAC address to uppercase hex without separators."""
+    if not mac:
+        return None
+    return _MAC_SEPARATORS.sub("", mac).upper()
+
+
+def _name_key(name: Optional[str]) -> Optional[str]:
+    """Key for case-insensitive name lookups."""
+    return name.lower() if name else None
+
+
+@dataclass
+class StatusSync:
+    """
+    Outcome of refreshing one network status in an InventoryMirror.
+
+    Attributes:
+        status: Network status
+        count: Networks listed with this status
+        added: Networks new to the mirror
+        updated: Networks renamed or moved from another status
+        removed: Networks no longer listed with this status
+        unchanged: True if the listing matched the mirror (nothing written)
+        cached: True if the status was fresh enough to skip the API
+        error: Error message if the listing failed (mirror left as it was)
+        response: First page response (None if cached or failed early)
+    """
+    status: str
+    count: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: bool = False
+    cached: bool = False
+    error: Optional[str] = None
+    response: Optional[TAUCResponse] = None
+
+
+class InventoryMirror:
+    """
+    Keeps a local SQLite copy of the network inventory.
+
+    Stores networks (id, name, status), their mesh units (sn, mac,
+    device_id, topo_role) and tags, indexed for lookups by name, SN, MAC,
+    device ID, status and tag. Pages query the mirror instead of listing
+    every network through the API, and call sync() only to refresh it.
+
+    Sync is incremental:
+
+    - Statuses refreshed less than ``max_age`` seconds ago are not fetched.
+    - The other statuses are listed concurrently (all pages, see
+      ApiClient.paginate). A listing whose fingerprint (hash of its ids and
+      names) matches the stored one writes nothing.
+    - Otherwise only the differences are written: new networks, renamed
+      networks, networks that moved between statuses. Networks missing from
+      their status are kept (with no status) until a full sync of all
+      statuses shows they are gone everywhere; then they are deleted.
+
+    Mesh units and tags come from GetNetworkDetails, which is per network:
+    sync_details() fetches them for networks that are new or renamed since
+    their details were stored, and DetailsCrawler refreshes the whole
+    fleet. MAC addresses are stored normalized (uppercase, no separators).
+    Device models and firmware (GetDeviceInfo) are stored once per device
+    ID, so the fleet can be queried by model, topology role and tag.
+
+    The mirror is safe to share between threads. A database file can also
+    be shared between processes (WAL mode; writes take an immediate lock).
+    Use one file per TAUC account.
+    """
+
+    def __init__(self, client, path: str = ":memory:"):
+        """
+        Initialize the mirror, creating the schema if needed.
+
+        Args:
+            client: ApiClient used to refresh the mirror
+            path: SQLite database file (default: in-memory, this process only)
+        """
+        self.client = client
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+
+        with self._transaction() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                # Created by another version: it is only a cache, so start over
+                for table in ("tags", "mesh_units", "devices", "crawls", "sync_state", "networks"):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction (rolled back on error)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a read query, returning rows as dicts."""
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    # Sync
+
+    def sync(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        max_age: Optional[float] = None,
+        page_size: Optional[int] = None,
+        access_token: Optional[str] = None
+    ) -> List[StatusSync]:
+        """
+        Refresh the networks of some or all statuses from the API.
+
+        Args:
+            statuses: Statuses to refresh (default: NETWORK_STATUSES)
+            max_age: Skip statuses refreshed less than this many seconds ago
+                     (default: refresh all)
+            page_size: Fixed page size (default: largest accepted)
+            access_token: OAuth access token (see ApiClient.api_call)
+
+        Returns:
+            One StatusSync per status, in the given order
+        """
+        from ..models import GetNetworkNameListV2Request, GetNetworkNameListV2Response
+
+        statuses = list(statuses or NETWORK_STATUSES)
+        results = {status: StatusSync(status) for status in statuses}
+
+        if max_age is not None:
+            now = time.time()
+            for state in self._sync_state(statuses):
+                if now - state["synced_at"] < max_age:
+                    result = results[state["status"]]
+                    result.cached = True
+                    result.count = state["total"]
+        to_fetch = [status for status in statuses if not results[status].cached]
+
+        # Share the page workers between statuses to keep the connection count bounded
+        page_workers = max(2, DEFAULT_MAX_WORKERS // max(1, len(to_fetch)))
+
+        def fetch(status: str) -> Tuple[StatusSync, Optional[List[Tuple[int, Optional[str]]]]]:
+            result = results[status]
+            paginator = self.client.paginate(
+                GetNetworkNameListV2Request(networkStatus=status),
+                GetNetworkNameListV2Response,
+                page_size,
+                access_token,
+                max_workers=page_workers
+            )
+            try:
+                rows = [(network.id, network.network_name) for network in paginator if network.id]
+            except Exception as e:
+                result.error = str(e)
+                rows = None
+            result.response = paginator.first_response
+            return result, rows
+
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=len(to_fetch)) as executor:
+                fetched = list(executor.map(fetch, to_fetch))
+
+            synced_at = time.time()
+            for result, rows in fetched:
+                if rows is not None:
+                    self._apply_listing(result, rows, synced_at)
+
+            listed = {result.status for result, rows in fetched if rows is not None}
+            if listed.issuperset(NETWORK_STATUSES):
+                # Every status was just listed: networks missing from all are gone
+                with self._transaction() as conn:
+                    conn.execute("DELETE FROM networks WHERE status IS NULL")
+
+        return [results[status] for status in statuses]
+
+    def _sync_state(self, statuses: Sequence[str]) -> List[Dict[str, Any]]:
+        """Get the stored sync state of some statuses."""
+        placeholders = ",".join("?" * len(statuses))
+        return self._query(
+            f"SELECT status, synced_at, total, fingerprint FROM sync_state WHERE status IN ({placeholders})",
+            statuses
+        )
+
+    @staticmethod
+    def _fingerprint(rows: List[Tuple[int, Optional[str]]]) -> str:
+        """Hash a status listing (ids and names, in id order)."""
+        digest = hashlib.sha256()
+        for network_id, name in sorted(rows, key=lambda row: row[0]):
+            digest.update(f"{network_id}\t{name or ''}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _apply_listing(self, result: StatusSync, rows: List[Tuple[int, Optional[str]]], synced_at: float) -> None:
+        """Write the differences between a status listing and the mirror."""
+        status = result.status
+        listing = dict(rows)
+        fingerprint = self._fingerprint(list(listing.items()))
+        result.count = len(listing)
+
+        with self._transaction() as conn:
+            stored = conn.execute("SELECT fingerprint FROM sync_state WHERE status = ?", (status,)).fetchone()
+            if stored is not None and stored["fingerprint"] == fingerprint:
+                result.unchanged = True
+            else:
+                existing: Dict[int, Tuple[Optional[str], Optional[str]]] = {
+                    row["id"]: (row["name"], row["status"])
+                    for row in conn.execute("SELECT id, name, status FROM networks WHERE status = ?", (status,))
+                }
+                ids = [network_id for network_id in listing if network_id not in existing]
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    for row in conn.execute(
+                        f"SELECT id, name, status FROM networks WHERE id IN ({placeholders})", chunk
+                    ):
+                        existing[row["id"]] = (row["name"], row["status"])
+
+                inserts, renames, moves = [], [], []
+                moved_from = set()
+                for network_id, name in listing.items():
+                    if network_id not in existing:
+                        inserts.append((network_id, name, _name_key(name), status, synced_at))
+                        continue
+                    old_name, old_status = existing[network_id]
+                    if old_name != name:
+                        renames.append((name, _name_key(name), network_id))
+                    if old_status != status:
+                        moves.append((status, network_id))
+                        if old_status is not None:
+                            moved_from.add(old_status)
+                    if old_name != name or old_status != status:
+                        result.updated += 1
+
+                missing = [
+                    (network_id,) for network_id, (_, old_status) in existing.items()
+                    if old_status == status and network_id not in listing
+                ]
+
+                conn.executemany(
+                    "INSERT INTO networks (id, name, name_key, status, listed_at) VALUES (?, ?, ?, ?, ?)",
+                    inserts
+                )
+                # Renamed networks need their details fetched again
+                conn.executemany(
+                    "UPDATE networks SET name = ?, name_key = ?, details_hash = NULL WHERE id = ?", renames
+                )
+                conn.executemany("UPDATE networks SET status = ? WHERE id = ?", moves)
+                conn.executemany("UPDATE networks SET status = NULL WHERE id = ?", missing)
+                # The listings those networks moved from no longer match the mirror
+                conn.executemany(
+                    "UPDATE sync_state SET fingerprint = '' WHERE status = ?",
+                    [(old_status,) for old_status in moved_from]
+                )
+                result.added = len(inserts)
+                result.removed = len(missing)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (status, synced_at, total, fingerprint) VALUES (?, ?, ?, ?)",
+                (status, synced_at, len(listing), fingerprint)
+            )
+
+    def sync_details(
+        self,
+        network_ids: Optional[Iterable[int]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        access_token: Optional[str] = None
+    ) -> int:
+        """
+        Fetch mesh units and tags for networks whose details are missing.
+
+        Args:
+            network_ids: Networks to refresh (default: all networks that are
+                         new or renamed since their details were stored)
+            max_workers: Concurrent GetNetworkDetails requests
+            access_token: OAuth access token (see ApiClient.api_call)
+
+        Returns:
+            Number of networks whose stored details changed
+
+        Raises:
+            TAUCApiException: If a details request failed (details fetched
+                              before the failure are kept)
+        """
+        from ..base.exceptions import TAUCApiException
+        from ..models import GetNetworkDetailsRequest, GetNetworkDetailsResponse
+
+        if network_ids is None:
+            network_ids = [row["id"] for row in self._query(
+                "SELECT id FROM networks WHERE details_hash IS NULL AND status IS NOT NULL"
+            )]
+        network_ids = list(network_ids)
+        if not network_ids:
+            return 0
+
+        def fetch(network_id: int):
+            response = self.client.api_call(
+                GetNetworkDetailsRequest(str(network_id)), GetNetworkDetailsResponse, access_token
+            )
+            if not response.is_success() or not response.result or not response.result.network:
+                raise TAUCApiException(
+                    f"Failed to fetch details of network {network_id}: {response.msg} (Code: {response.error_code})"
+                )
+            return response.result.network
+
+        changed = 0
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(network_ids)))) as executor:
+            for network_id, network in zip(network_ids, executor.map(fetch, network_ids)):
+                changed += self.store_details(network_id, network)
+        return changed
+
+    def store_details(self, network_id: int, network, fetched_at: Optional[float] = None) -> bool:
+        """
+        Store a network's mesh units and tags (e.g. from GetNetworkDetails).
+
+        The details are stored under the requested network ID, not the ID
+        in the response (which may be missing); a missing name keeps the
+        listed one.
+
+        Args:
+            network_id: ID of the network whose details were requested
+            network: Network from NetworkDetailsResult
+            fetched_at: When the details were fetched (default: now)
+
+        Returns:
+            True if the stored details changed
+        """
+        mesh_units = [
+            (unit.sn, normalize_mac(unit.mac), unit.device_id, unit.topo_role)
+            for unit in network.mesh_unit_list or ()
+        ]
+        tags = [(tag.name, tag.value) for tag in network.tags or ()]
+        details_hash = hashlib.sha256(repr((network.network_name, mesh_units, tags)).encode("utf-8")).hexdigest()
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        network_id = int(network_id)
+        name = network.network_name
+
+        with self._transaction() as conn:
+            row = conn.execute("SELECT details_hash FROM networks WHERE id = ?", (network_id,)).fetchone()
+            if row is not None and row["details_hash"] == details_hash:
+                conn.execute("UPDATE networks SET details_at = ? WHERE id = ?", (fetched_at, network_id))
+                return False
+
+            if row is None:
+                conn.execute(
+                    "INSERT INTO networks (id, name, name_key, listed_at) VALUES (?, ?, ?, ?)",
+                    (network_id, name, _name_key(name), fetched_at)
+                )
+            conn.execute(
+                "UPDATE networks SET name = COALESCE(?, name), name_key = COALESCE(?, name_key), "
+                "details_hash = ?, details_at = ? WHERE id = ?",
+                (name, _name_key(name), details_hash, fetched_at, network_id)
+            )
+            conn.execute("DELETE FROM mesh_units WHERE network_id = ?", (network_id,))
+            conn.execute("DELETE FROM tags WHERE network_id = ?", (network_id,))
+            conn.executemany(
+                "INSERT INTO mesh_units (network_id, sn, mac, device_id, topo_role) VALUES (?, ?, ?, ?, ?)",
+                [(network_id,) + unit for unit in mesh_units]
+            )
+            conn.executemany(
+                "INSERT INTO tags (network_id, name, value) VALUES (?, ?, ?)",
+                [(network_id,) + tag for tag in tags]
+            )
+            return True
+
+    def store_device_infos(self, infos: Iterable[Any], fetched_at: Optional[float] = None) -> None:
+        """
+        Store device models and firmware versions (e.g. from GetDeviceInfo).
+
+        Args:
+            infos: DeviceInfo objects
+            fetched_at: When they were fetched (default: now)
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO devices (device_id, model, model_key, category, fw_version, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (info.device_id, info.device_model, _name_key(info.device_model),
+                     info.device_category, info.fw_version, fetched_at)
+                    for info in infos if info.device_id
+                ]
+            )
+
+    def devices_without_info(self) -> List[str]:
+        """
+        Get the device IDs of mirrored mesh units with no stored device information.
+
+        Returns:
+            Device IDs
+        """
+        return [row["device_id"] for row in self._query(
+            "SELECT DISTINCT m.device_id FROM mesh_units m "
+            "LEFT JOIN devices d ON d.device_id = m.device_id "
+            "WHERE m.device_id IS NOT NULL AND d.device_id IS NULL"
+        )]
+
+    def begin_crawl(self, max_age: Optional[float] = None, resume: bool = True) -> Tuple[int, float, bool]:
+        """
+        Start a details crawl, or resume the last one if it was interrupted.
+
+        A crawl refreshes the details of networks whose details were fetched
+        before its cutoff. Details stored by an interrupted crawl are newer
+        than its cutoff, so resuming it skips them.
+
+        Args:
+            max_age: Keep details fetched less than this many seconds before
+                     the crawl started (default: refresh all)
+            resume: Resume the last unfinished crawl if there is one
+
+        Returns:
+            (crawl ID, cutoff time, True if resumed)
+        """
+        with self._transaction() as conn:
+            if resume:
+                row = conn.execute(
+                    "SELECT id, cutoff FROM crawls WHERE finished_at IS NULL ORDER BY id DESC LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    return row["id"], row["cutoff"], True
+            conn.execute("UPDATE crawls SET finished_at = ? WHERE finished_at IS NULL", (time.time(),))
+            started_at = time.time()
+            cutoff = started_at - (max_age or 0)
+            crawl_id = conn.execute(
+                "INSERT INTO crawls (started_at, cutoff) VALUES (?, ?)", (started_at, cutoff)
+            ).lastrowid
+            return crawl_id, cutoff, False
+
+    def finish_crawl(self, crawl_id: int) -> None:
+        """
+        Mark a details crawl finished (it will not be resumed).
+
+        Args:
+            crawl_id: ID from begin_crawl
+        """
+        with self._transaction() as conn:
+            conn.execute("UPDATE crawls SET finished_at = ? WHERE id = ?", (time.time(), crawl_id))
+
+    def networks_with_details_before(
+        self,
+        cutoff: float,
+        statuses: Optional[Iterable[str]] = None
+    ) -> List[int]:
+        """
+        Get listed networks whose details are missing or were fetched before a time.
+
+        Args:
+            cutoff: Unix time
+            statuses: Statuses to include (default: all listed networks)
+
+        Returns:
+            Network IDs, in ID order
+        """
+        sql = "SELECT id FROM networks WHERE (details_at IS NULL OR details_at < ?)"
+        params: List[Any] = [cutoff]
+        if statuses is None:
+            sql += " AND status IS NOT NULL"
+        else:
+            statuses = list(statuses)
+            sql += f" AND status IN ({','.join('?' * len(statuses))})"
+            params.extend(statuses)
+        return [row["id"] for row in self._query(sql + " ORDER BY id", params)]
+
+    def remove_networks(self, network_ids: Iterable[int]) -> None:
+        """
+        Remove networks (with their mesh units and tags), e.g. after deleting them.
+
+        Args:
+            network_ids: Network IDs
+        """
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM networks WHERE id = ?", [(int(i),) for i in network_ids])
+            # Listings that contained them no longer match the mirror
+            conn.execute("UPDATE sync_state SET fingerprint = ''")
+
+    # Queries
+
+    def get_networks(self, statuses: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Get networks, optionally only those with some statuses.
+
+        Args:
+            statuses: Statuses to include (default: all listed networks)
+
+        Returns:
+            List of {id, name, status}, ordered by ID
+        """
+        if statuses is None:
+            return self._query("SELECT id, name, status FROM networks WHERE status IS NOT NULL ORDER BY id")
+        statuses = list(statuses)
+        placeholders = ",".join("?" * len(statuses))
+        return self._query(
+            f"SELECT id, name, status FROM networks WHERE status IN ({placeholders}) ORDER BY id", statuses
+        )
+
+    def find_by_name(self, name: str, case_sensitive: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find networks by name.
+
+        Args:
+            name: Network name
+            case_sensitive: Whether to match case-sensitively
+
+        Returns:
+            List of {id, name, status}
+        """
+        rows = self._query(
+            "SELECT id, name, status FROM networks WHERE name_key = ? AND status IS NOT NULL ORDER BY id",
+            (_name_key(name),)
+        )
+        if case_sensitive:
+            rows = [row for row in rows if row["name"] == name]
+        return rows
+
+    def find_mesh_units(
+        self,
+        sn: Optional[str] = None,
+        mac: Optional[str] = None,
+        device_id: Optional[str] = None,
+        model: Optional[str] = None,
+        topo_role: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find mesh units by SN, MAC (any format), device ID, model or topology role.
+
+        Args:
+            sn: Serial number
+            mac: MAC address
+            device_id: Device ID
+            model: Device model (case-insensitive; needs stored device information)
+            topo_role: Topology role (MASTER, SLAVE, INACTIVE)
+
+        Returns:
+            List of {network_id, network_name, sn, mac, device_id, topo_role,
+            model, fw_version}
+        """
+        conditions, params = [], []
+        for column, value in (
+            ("m.sn", sn), ("m.mac", normalize_mac(mac)), ("m.device_id", device_id),
+            ("d.model_key", _name_key(model)), ("m.topo_role", topo_role)
+        ):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if not conditions:
+            return []
+        return self._query(
+            "SELECT m.network_id, n.name AS network_name, m.sn, m.mac, m.device_id, m.topo_role, "
+            "d.model, d.fw_version "
+            "FROM mesh_units m JOIN networks n ON n.id = m.network_id "
+            "LEFT JOIN devices d ON d.device_id = m.device_id "
+            f"WHERE {' AND '.join(conditions)} ORDER BY m.network_id",
+            params
+        )
+
+    def find_by_model(self, model: str) -> List[Dict[str, Any]]:
+        """
+        Find networks containing a device model (case-insensitive).
+
+        Args:
+            model: Device model
+
+        Returns:
+            List of {id, name, status}
+        """
+        return self._query(
+            "SELECT DISTINCT n.id, n.name, n.status FROM devices d "
+            "JOIN mesh_units m ON m.device_id = d.device_id JOIN networks n ON n.id = m.network_id "
+            "WHERE d.model_key = ? AND n.status IS NOT NULL ORDER BY n.id",
+            (_name_key(model),)
+        )
+
+    def topo_role_counts(self) -> Dict[str, int]:
+        """
+        Count the mesh units of listed networks per topology role.
+
+        Returns:
+            Dict of topology role -> number of mesh units
+        """
+        return {
+            row["topo_role"]: row["count"] for row in self._query(
+                "SELECT m.topo_role, COUNT(*) AS count FROM mesh_units m "
+                "JOIN networks n ON n.id = m.network_id WHERE n.status IS NOT NULL GROUP BY m.topo_role"
+            )
+        }
+
+    def model_counts(self) -> Dict[str, int]:
+        """
+        Count the mesh units of listed networks per device model.
+
+        Returns:
+            Dict of model -> number of mesh units (None for units with no stored model)
+        """
+        return {
+            row["model"]: row["count"] for row in self._query(
+                "SELECT d.model, COUNT(*) AS count FROM mesh_units m "
+                "JOIN networks n ON n.id = m.network_id LEFT JOIN devices d ON d.device_id = m.device_id "
+                "WHERE n.status IS NOT NULL GROUP BY d.model ORDER BY count DESC"
+            )
+        }
+
+    def tag_counts(self) -> List[Dict[str, Any]]:
+        """
+        Count listed networks per tag.
+
+        Returns:
+            List of {name, value, networks}, most common first
+        """
+        return self._query(
+            "SELECT t.name, t.value, COUNT(DISTINCT t.network_id) AS networks FROM tags t "
+            "JOIN networks n ON n.id = t.network_id WHERE n.status IS NOT NULL "
+            "GROUP BY t.name, t.value ORDER BY networks DESC, t.name, t.value"
+        )
+
+    def find_by_tag(self, name: str, value: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find networks with a tag.
+
+        Args:
+            name: Tag name
+            value: Tag value (default: any)
+
+        Returns:
+            List of {id, name, status}
+        """
+        sql = "SELECT DISTINCT n.id, n.name, n.status FROM tags t JOIN networks n ON n.id = t.network_id WHERE t.name = ?"
+        params = [name]
+        if value is not None:
+            sql += " AND t.value = ?"
+            params.append(value)
+        return self._query(sql + " ORDER BY n.id", params)
+
+    def get_mesh_units(self) -> List[Dict[str, Any]]:
+        """
+        Get the mesh units of all listed networks.
+
+        Returns:
+            List of {network_id, sn, mac, device_id, topo_role}
+        """
+        return self._query(
+            "SELECT m.network_id, m.sn, m.mac, m.device_id, m.topo_role "
+            "FROM mesh_units m JOIN networks n ON n.id = m.network_id WHERE n.status IS NOT NULL"
+        )
+
+    def get_network(self, network_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a network with its mesh units and tags.
+
+        Args:
+            network_id: Network ID
+
+        Returns:
+            {id, name, status, mesh_units: [...], tags: [...]}, or None if not mirrored
+        """
+        rows = self._query("SELECT id, name, status, details_at FROM networks WHERE id = ?", (network_id,))
+        if not rows:
+            return None
+        network = rows[0]
+        network["mesh_units"] = self._query(
+            "SELECT sn, mac, device_id, topo_role FROM mesh_units WHERE network_id = ?", (network_id,)
+        )
+        network["tags"] = self._query("SELECT name, value FROM tags WHERE network_id = ?", (network_id,))
+        return network
+
+    def status_counts(self) -> Dict[str, int]:
+        """
+        Count mirrored networks per status.
+
+        Returns:
+            Dict of status -> number of networks
+        """
+        return {
+            row["status"]: row["count"] for row in self._query(
+                "SELECT status, COUNT(*) AS count FROM networks WHERE status IS NOT NULL GROUP BY status"
+            )
+        }
+
+    def synced_at(self, status: str) -> Optional[float]:
+        """
+        Get when a status was last refreshed.
+
+        Args:
+            status: Network status
+
+        Returns:
+            Unix time, or None if never
+        """
+        rows = self._sync_state([status])
+        return rows[0]["synced_at"] if rows else None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,437 @@
+"""Inventory snapshots with per-record content hashes, and streaming diffs between them."""
+
+import contextlib
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from ..execute.paginator import DEFAULT_MAX_WORKERS
+from .mirror import NETWORK_STATUSES, normalize_mac
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    taken_at REAL NOT NULL,
+    label TEXT,
+    networks INTEGER NOT NULL DEFAULT 0,
+    mesh_units INTEGER NOT NULL DEFAULT 0,
+    complete INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS snapshot_networks (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    network_id INTEGER NOT NULL,
+    name TEXT,
+    status TEXT,
+    hash INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, network_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS snapshot_mesh_units (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots (id) ON DELETE CASCADE,
+    sn TEXT NOT NULL,
+    mac TEXT,
+    network_id INTEGER,
+    network_name TEXT,
+    hash INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, sn)
+) WITHOUT ROWID;
+"""
+
+# Record kinds: table, key column, content columns (hashed, in order)
+_KINDS = {
+    "network": ("snapshot_networks", "network_id", ("name", "status")),
+    "mesh_unit": ("snapshot_mesh_units", "sn", ("mac", "network_id", "network_name")),
+}
+
+
+def record_hash(values: Sequence[Any]) -> int:
+    """
+    Hash a record's content to a signed 64-bit integer (SQLite INTEGER).
+
+    Args:
+        values: Content field values, in a fixed order
+
+    Returns:
+        Content hash
+    """
+    digest = hashlib.blake2b("\x1f".join("" if v is None else str(v) for v in values).encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "big", signed=True)
+
+
+@dataclass
+class SnapshotInfo:
+    """
+    A stored inventory snapshot.
+
+    Attributes:
+        id: Snapshot ID
+        taken_at: Unix time the snapshot was taken
+        label: Optional label
+        networks: Network records
+        mesh_units: Mesh unit records
+        complete: True if every listing succeeded (a diff against an
+                  incomplete snapshot reports its missing records as removed)
+    """
+    id: int
+    taken_at: float
+    label: Optional[str] = None
+    networks: int = 0
+    mesh_units: int = 0
+    complete: bool = False
+
+
+@dataclass
+class RecordChange:
+    """
+    A record that differs between two snapshots.
+
+    Attributes:
+        kind: "network" (keyed by network ID) or "mesh_unit" (keyed by SN)
+        key: Network ID or serial number
+        change: "added", "removed" or "changed"
+        fields: Changed content fields (for "changed"), e.g. ("status",)
+                for a status flip, ("name",) for a rename, ("network_id",
+                "network_name") for a mesh unit that moved
+        old: Record in the older snapshot (None if added)
+        new: Record in the newer snapshot (None if removed)
+    """
+    kind: str
+    key: Any
+    change: str
+    fields: Tuple[str, ...] = ()
+    old: Optional[Dict[str, Any]] = None
+    new: Optional[Dict[str, Any]] = None
+
+    @property
+    def category(self) -> str:
+        """
+        Summary category: networks_added, networks_removed, renamed,
+        status_changed, units_added, units_removed, units_moved or units_changed.
+        """
+        if self.kind == "network":
+            if self.change != "changed":
+                return f"networks_{self.change}"
+            return "status_changed" if "status" in self.fields else "renamed"
+        if self.change != "changed":
+            return f"units_{self.change}"
+        return "units_moved" if "network_id" in self.fields or "network_name" in self.fields else "units_changed"
+
+
+class SnapshotStore:
+    """
+    Stores point-in-time snapshots of the inventory and diffs them.
+
+    A snapshot holds one record per network (ID, name, status; from
+    GetNetworkNameListV2 for every status) and one per mesh unit (SN, MAC
+    and network; from GetAllInventory), each with a 64-bit content hash.
+    Mesh units are linked to a network ID through the network name when the
+    name is unique, so renaming a network does not move its mesh units.
+
+    Records are stored in primary-key order (SQLite WITHOUT ROWID tables),
+    so diff() reads both snapshots in key order and merges them in one
+    pass: time is linear in the number of records, memory is constant,
+    unchanged records are skipped by comparing hashes, and changes are
+    streamed as they are found.
+
+    Snapshots are history rather than a cache, so use a database file of
+    its own (one per TAUC account) rather than the inventory mirror's.
+    Thread-safe.
+    """
+
+    def __init__(self, client, path: str = ":memory:"):
+        """
+        Initialize the store, creating the schema if needed.
+
+        Args:
+            client: ApiClient used to take snapshots
+            path: SQLite database file (default: in-memory, this process only)
+        """
+        self.client = client
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+
+        with self._transaction() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _SCHEMA_VERSION):
+                raise sqlite3.DatabaseError(f"Snapshot database {path} has unsupported schema version {version}")
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction (rolled back on error)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # Taking snapshots
+
+    def _list_networks(self, status: str, page_size: Optional[int], access_token: Optional[str]) -> List[Tuple]:
+        """List one status's networks as (id, name, status) rows."""
+        from ..models import GetNetworkNameListV2Request, GetNetworkNameListV2Response
+
+        paginator = self.client.paginate(
+            GetNetworkNameListV2Request(networkStatus=status), GetNetworkNameListV2Response,
+            page_size, access_token, max_workers=max(2, DEFAULT_MAX_WORKERS // len(NETWORK_STATUSES))
+        )
+        rows = []
+        for response in paginator.pages():
+            columns = response.columns()
+            rows.extend(
+                (network_id, name, status)
+                for network_id, name in zip(columns["id"], columns["network_name"]) if network_id
+            )
+        return rows
+
+    def _list_mesh_units(self, page_size: Optional[int], access_token: Optional[str]) -> List[Tuple]:
+        """List all inventory mesh units as (sn, mac, network name) rows."""
+        from ..models import GetAllInventoryRequest, GetAllInventoryResponse
+
+        paginator = self.client.paginate(
+            GetAllInventoryRequest(), GetAllInventoryResponse, page_size, access_token
+        )
+        rows = []
+        for response in paginator.pages():
+            columns = response.columns()
+            rows.extend(zip(columns["sn"], columns["mac"], columns["network_name"]))
+        return rows
+
+    def take(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        with_mesh_units: bool = True,
+        label: Optional[str] = None,
+        page_size: Optional[int] = None,
+        access_token: Optional[str] = None
+    ) -> SnapshotInfo:
+        """
+        Take a snapshot of the inventory.
+
+        The network listings (one per status) and the inventory listing are
+        fetched concurrently.
+
+        Args:
+            statuses: Network statuses to include (default: NETWORK_STATUSES)
+            with_mesh_units: Also record mesh units (GetAllInventory)
+            label: Optional label
+            page_size: Fixed page size (default: largest accepted)
+            access_token: OAuth access token (see ApiClient.api_call)
+
+        Returns:
+            SnapshotInfo (complete is False if a listing failed; the records
+            of the listings that succeeded are stored)
+        """
+        statuses = list(statuses or NETWORK_STATUSES)
+        complete = True
+        networks: Dict[int, Tuple] = {}
+        units: List[Tuple] = []
+
+        with ThreadPoolExecutor(max_workers=len(statuses) + 1) as executor:
+            network_futures = [
+                executor.submit(self._list_networks, status, page_size, access_token) for status in statuses
+            ]
+            unit_future = executor.submit(self._list_mesh_units, page_size, access_token) if with_mesh_units else None
+            for future in network_futures:
+                try:
+                    for row in future.result():
+                        networks[row[0]] = row  # Later statuses win
+                except Exception:
+                    complete = False
+            if unit_future is not None:
+                try:
+                    units = unit_future.result()
+                except Exception:
+                    complete = False
+
+        # Link mesh units to networks by unique name
+        ids_by_name: Dict[str, Optional[int]] = {}
+        for network_id, name, _ in networks.values():
+            if name:
+                ids_by_name[name] = None if name in ids_by_name else network_id
+
+        taken_at = time.time()
+        with self._transaction() as conn:
+            snapshot_id = conn.execute(
+                "INSERT INTO snapshots (taken_at, label, complete) VALUES (?, ?, ?)",
+                (taken_at, label, int(complete))
+            ).lastrowid
+            conn.executemany(
+                "INSERT INTO snapshot_networks (snapshot_id, network_id, name, status, hash) VALUES (?, ?, ?, ?, ?)",
+                ((snapshot_id, network_id, name, status, record_hash((name, status)))
+                 for network_id, name, status in networks.values())
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO snapshot_mesh_units "
+                "(snapshot_id, sn, mac, network_id, network_name, hash) VALUES (?, ?, ?, ?, ?, ?)",
+                self._unit_rows(snapshot_id, units, ids_by_name)
+            )
+            unit_count = conn.execute(
+                "SELECT COUNT(*) FROM snapshot_mesh_units WHERE snapshot_id = ?", (snapshot_id,)
+            ).fetchone()[0]
+            conn.execute(
+                "UPDATE snapshots SET networks = ?, mesh_units = ? WHERE id = ?",
+                (len(networks), unit_count, snapshot_id)
+            )
+        return SnapshotInfo(snapshot_id, taken_at, label, len(networks), unit_count, complete)
+
+    @staticmethod
+    def _unit_rows(snapshot_id: int, units: List[Tuple], ids_by_name: Dict[str, Optional[int]]) -> Iterator[Tuple]:
+        """Build mesh unit rows (units without an SN are keyed by MAC)."""
+        for sn, mac, network_name in units:
+            mac = normalize_mac(mac)
+            key = sn or mac
+            if not key:
+                continue
+            network_id = ids_by_name.get(network_name) if network_name else None
+            # Units of a known network are identified by its ID, not its (changeable) name
+            content = (mac, network_id) if network_id is not None else (mac, None, network_name)
+            yield snapshot_id, key, mac, network_id, network_name, record_hash(content)
+
+    # Snapshots
+
+    def list_snapshots(self) -> List[SnapshotInfo]:
+        """
+        Get all snapshots, newest first.
+
+        Returns:
+            List of SnapshotInfo
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, taken_at, label, networks, mesh_units, complete FROM snapshots ORDER BY id DESC"
+            ).fetchall()
+        return [SnapshotInfo(r["id"], r["taken_at"], r["label"], r["networks"], r["mesh_units"], bool(r["complete"]))
+                for r in rows]
+
+    def latest(self, before: Optional[float] = None) -> Optional[SnapshotInfo]:
+        """
+        Get the newest snapshot, optionally the newest taken before a time.
+
+        Args:
+            before: Unix time (e.g. time.time() - 86400 for "a day ago")
+
+        Returns:
+            SnapshotInfo, or None if there is none
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, taken_at, label, networks, mesh_units, complete FROM snapshots "
+                "WHERE taken_at < ? ORDER BY taken_at DESC LIMIT 1",
+                (float("inf") if before is None else before,)
+            ).fetchone()
+        if row is None:
+            return None
+        return SnapshotInfo(row["id"], row["taken_at"], row["label"], row["networks"], row["mesh_units"],
+                            bool(row["complete"]))
+
+    def delete(self, snapshot_ids: Iterable[int]) -> None:
+        """
+        Delete snapshots and their records.
+
+        Args:
+            snapshot_ids: Snapshot IDs
+        """
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM snapshots WHERE id = ?", [(int(i),) for i in snapshot_ids])
+
+    def prune(self, keep: int) -> int:
+        """
+        Delete all but the newest ``keep`` snapshots.
+
+        Returns:
+            Number of snapshots deleted
+        """
+        old = [info.id for info in self.list_snapshots()[keep:]]
+        self.delete(old)
+        return len(old)
+
+    # Diffing
+
+    def _records(self, kind: str, snapshot_id: int) -> Iterator[sqlite3.Row]:
+        """Iterate a snapshot's records of a kind in key order."""
+        table, key, columns = _KINDS[kind]
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT {key} AS key, {', '.join(columns)}, hash FROM {table} WHERE snapshot_id = ? ORDER BY {key}",
+                (snapshot_id,)
+            )
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            yield from rows
+
+    def diff(self, old_id: int, new_id: int, kinds: Iterable[str] = ("network", "mesh_unit")) -> Iterator[RecordChange]:
+        """
+        Stream the records that differ between two snapshots.
+
+        Both snapshots are read in key order and merged in one pass; records
+        whose content hashes match are skipped without comparing fields.
+
+        Args:
+            old_id: Older snapshot ID
+            new_id: Newer snapshot ID
+            kinds: Record kinds to compare ("network", "mesh_unit")
+
+        Yields:
+            RecordChange per differing record, networks first, in key order
+        """
+        missing = object()
+        for kind in kinds:
+            columns = _KINDS[kind][2]
+
+            def record(row) -> Dict[str, Any]:
+                return {"key": row["key"], **{column: row[column] for column in columns}}
+
+            old_rows, new_rows = self._records(kind, old_id), self._records(kind, new_id)
+            old, new = next(old_rows, missing), next(new_rows, missing)
+            while old is not missing or new is not missing:
+                if new is missing or (old is not missing and old["key"] < new["key"]):
+                    yield RecordChange(kind, old["key"], "removed", old=record(old))
+                    old = next(old_rows, missing)
+                elif old is missing or new["key"] < old["key"]:
+                    yield RecordChange(kind, new["key"], "added", new=record(new))
+                    new = next(new_rows, missing)
+                else:
+                    if old["hash"] != new["hash"]:
+                        changed = tuple(column for column in columns if old[column] != new[column])
+                        if kind == "mesh_unit" and old["network_id"] is not None and "network_id" not in changed:
+                            # Same network, renamed: the unit did not move
+                            changed = tuple(column for column in changed if column != "network_name")
+                        yield RecordChange(kind, old["key"], "changed", changed, record(old), record(new))
+                    old, new = next(old_rows, missing), next(new_rows, missing)
+
+    def diff_summary(self, old_id: int, new_id: int) -> Dict[str, int]:
+        """
+        Count the changes between two snapshots by category (see RecordChange.category).
+
+        Returns:
+            Dict of category -> count (categories with no changes are omitted)
+        """
+        return dict(Counter(change.category for change in self.diff(old_id, new_id)))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,357 @@
+"""Concurrent fleet status sweeps that report only status changes."""
+
+import bisect
+import functools
+import threading
+import time
+from array import array
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from ..execute.concurrency import run_bounded
+from ..execute.rate_limiter import RateLimiter
+
+# Concurrent GetNetworkStatus requests
+DEFAULT_MAX_WORKERS = 16
+
+# API calls per second across all workers
+DEFAULT_RATE = 20.0
+
+# Status changes kept for recent_changes()
+RECENT_CHANGES = 1000
+
+# Statuses GetNetworkStatus reports (listing-only statuses such as INVENTORY
+# or NAT-LOCKED are never returned, so they cannot seed a sweep)
+REPORTED_STATUSES = ("ONLINE", "OFFLINE", "ABNORMAL")
+
+
+@dataclass
+class StatusChange:
+    """
+    A network's status changing between sweeps.
+
+    Attributes:
+        network_id: Network ID
+        old_status: Last known status
+        new_status: Status found by the sweep
+        at: Unix time the new status was seen
+    """
+    network_id: int
+    old_status: str
+    new_status: str
+    at: float
+
+
+@dataclass
+class SweepResult:
+    """
+    Outcome of one status sweep.
+
+    Attributes:
+        checked: Networks whose status was fetched
+        changes: Status changes found (networks seen for the first time are
+                 not changes)
+        failed: Network ID -> error message, for failed requests (their
+                last known status is kept)
+        stopped: True if the sweep was stopped before every network was checked
+        elapsed: Seconds taken
+    """
+    checked: int = 0
+    changes: List[StatusChange] = field(default_factory=list)
+    failed: Dict[int, str] = field(default_factory=dict)
+    stopped: bool = False
+    elapsed: float = 0.0
+
+
+class StatusSweeper:
+    """
+    Polls GetNetworkStatus for many networks and reports what changed.
+
+    The last known status of every tracked network is held in two parallel
+    arrays: network IDs (sorted, 8 bytes each) and status codes (1 byte
+    each, indexing a small table of status strings), so tracking hundreds
+    of thousands of networks takes a few MB and no per-network objects.
+    Statuses can be seeded (e.g. from the inventory listing) so the first
+    sweep already reports differences.
+
+    A sweep fetches the statuses of all tracked networks, or a subset,
+    concurrently, with every request paced by one shared RateLimiter, and
+    reports only the networks whose status differs from the last known one
+    (ONLINE -> OFFLINE, ...). The latest changes are also kept for
+    recent_changes(). start() runs sweeps on a schedule in a background
+    thread.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate: Optional[float] = DEFAULT_RATE,
+        access_token: Optional[str] = None
+    ):
+        """
+        Initialize a sweeper tracking no networks.
+
+        Args:
+            client: ApiClient making the calls
+            max_workers: Concurrent API requests
+            rate: API calls per second across all workers (None = unlimited)
+            access_token: OAuth access token (see ApiClient.api_call)
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.limiter = RateLimiter(rate, burst=self.max_workers) if rate else None
+        self.access_token = access_token
+        self.last_sweep: Optional[SweepResult] = None
+        self.last_sweep_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self._ids = array('q')
+        self._codes = array('B')
+        self._statuses: List[Optional[str]] = [None]  # code -> status (0 = unknown)
+        self._status_codes: Dict[str, int] = {}
+        self._recent: "deque[StatusChange]" = deque(maxlen=RECENT_CHANGES)
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _code(self, status: Optional[str]) -> int:
+        """Get the code of a status, adding it to the table (lock held)."""
+        if status is None:
+            return 0
+        code = self._status_codes.get(status)
+        if code is None:
+            code = len(self._statuses)
+            if code > 255:
+                raise ValueError("More than 255 distinct network statuses")
+            self._statuses.append(status)
+            self._status_codes[status] = code
+        return code
+
+    def _position(self, network_id: int) -> Optional[int]:
+        """Get a tracked network's position in the arrays (lock held)."""
+        position = bisect.bisect_left(self._ids, network_id)
+        if position < len(self._ids) and self._ids[position] == network_id:
+            return position
+        return None
+
+    # Tracked networks
+
+    def track(self, statuses: Dict[int, Optional[str]]) -> None:
+        """
+        Set the tracked networks, with their known statuses.
+
+        Networks already tracked keep their last known status unless one is
+        given; networks not in ``statuses`` are no longer tracked.
+
+        Args:
+            statuses: Network ID -> known status (None if unknown), e.g. the
+                      listing statuses from InventoryMirror.get_networks()
+                      that are in REPORTED_STATUSES
+        """
+        with self._lock:
+            ids = array('q', sorted(int(network_id) for network_id in statuses))
+            codes = array('B', bytes(len(ids)))
+            for position, network_id in enumerate(ids):
+                status = statuses.get(network_id)
+                if status is None:
+                    old = self._position(network_id)
+                    codes[position] = self._codes[old] if old is not None else 0
+                else:
+                    codes[position] = self._code(status)
+            self._ids, self._codes = ids, codes
+
+    def status_of(self, network_id: int) -> Optional[str]:
+        """
+        Get a network's last known status.
+
+        Returns:
+            Status, or None if unknown or not tracked
+        """
+        with self._lock:
+            position = self._position(int(network_id))
+            return self._statuses[self._codes[position]] if position is not None else None
+
+    def counts(self) -> Dict[Optional[str], int]:
+        """
+        Count tracked networks per last known status.
+
+        Returns:
+            Dict of status (None = unknown) -> number of networks
+        """
+        with self._lock:
+            return {self._statuses[code]: count for code, count in Counter(self._codes).items()}
+
+    def networks_with_status(self, status: str) -> List[int]:
+        """
+        Get the tracked networks whose last known status is ``status``.
+
+        Returns:
+            Network IDs, in ID order
+        """
+        with self._lock:
+            code = self._status_codes.get(status)
+            if code is None:
+                return []
+            return [network_id for network_id, c in zip(self._ids, self._codes) if c == code]
+
+    def recent_changes(self) -> List[StatusChange]:
+        """
+        Get the latest status changes, newest first (at most RECENT_CHANGES).
+        """
+        with self._lock:
+            return list(reversed(self._recent))
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """
+        Change the API calls per second, also for a sweep in progress.
+
+        The current limiter is kept if its rate is unchanged, so repeated
+        calls do not refill its bucket.
+
+        Args:
+            rate: API calls per second across all workers (None = unlimited)
+        """
+        with self._lock:
+            if rate and self.limiter is not None and self.limiter.rate == rate:
+                return
+            self.limiter = RateLimiter(rate, burst=self.max_workers) if rate else None
+
+    # Sweeping
+
+    def _fetch(self, network_id: int, stop: Optional[threading.Event] = None) -> Optional[Tuple]:
+        """Fetch one network's status, returning (status or None, error), or None if stopped."""
+        from ..models import GetNetworkStatusRequest, GetNetworkStatusResponse
+
+        with self._lock:
+            limiter = self.limiter
+        if limiter is not None:
+            limiter.acquire(stop)
+        if stop is not None and stop.is_set():
+            return None
+        try:
+            response = self.client.api_call(
+                GetNetworkStatusRequest(str(network_id)), GetNetworkStatusResponse, self.access_token
+            )
+        except Exception as e:
+            return None, str(e)
+        if not response.is_success() or not response.result or not response.result.status:
+            return None, f"{response.msg} (Code: {response.error_code})"
+        return response.result.status, None
+
+    def sweep(
+        self,
+        network_ids: Optional[Iterable[int]] = None,
+        on_change: Optional[Callable[[StatusChange], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> SweepResult:
+        """
+        Fetch the statuses of tracked networks and record what changed.
+
+        At most twice max_workers requests are queued at a time. Once
+        ``stop`` is set, queued requests are cancelled and the sweep returns
+        as soon as a running request does; the statuses fetched so far are
+        kept.
+
+        Args:
+            network_ids: Networks to check (default: all tracked); untracked
+                         IDs are ignored
+            on_change: Called with each change as it is found
+            stop: Event stopping the sweep early
+
+        Returns:
+            SweepResult
+        """
+        started = time.perf_counter()
+        with self._lock:
+            if network_ids is None:
+                ids = list(self._ids)
+            else:
+                ids = [int(i) for i in network_ids if self._position(int(i)) is not None]
+
+        result = SweepResult()
+        fetch = functools.partial(self._fetch, stop=stop)
+        for network_id, fetched in run_bounded(fetch, ids, min(self.max_workers, len(ids)), stop=stop):
+            if fetched is None:  # Stopped before the request
+                continue
+            status, error = fetched
+            if status is None:
+                result.failed[network_id] = error
+                continue
+            result.checked += 1
+            change = self._record(network_id, status)
+            if change is not None:
+                result.changes.append(change)
+                if on_change is not None:
+                    on_change(change)
+
+        result.stopped = stop is not None and stop.is_set() and result.checked + len(result.failed) < len(ids)
+        result.elapsed = time.perf_counter() - started
+        self.last_sweep, self.last_sweep_at = result, time.time()
+        return result
+
+    def _record(self, network_id: int, status: str) -> Optional[StatusChange]:
+        """Store a fetched status, returning the change if it differs from the last known one."""
+        with self._lock:
+            position = self._position(network_id)
+            if position is None:  # No longer tracked
+                return None
+            code = self._code(status)
+            old_code = self._codes[position]
+            if old_code == code:
+                return None
+            self._codes[position] = code
+            if old_code == 0:  # First sighting
+                return None
+            change = StatusChange(network_id, self._statuses[old_code], status, time.time())
+            self._recent.append(change)
+            return change
+
+    # Scheduling
+
+    @property
+    def running(self) -> bool:
+        """True while scheduled sweeps are running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self,
+        interval: float,
+        network_ids: Optional[Iterable[int]] = None,
+        on_change: Optional[Callable[[StatusChange], None]] = None
+    ) -> None:
+        """
+        Sweep every ``interval`` seconds in a background thread (restarting it if running).
+
+        Args:
+            interval: Seconds between the starts of consecutive sweeps
+            network_ids: Networks to check (default: all tracked at each sweep)
+            on_change: Called with each change as it is found
+        """
+        self.stop()
+        network_ids = list(network_ids) if network_ids is not None else None
+        self._stop = stop = threading.Event()
+
+        def run():
+            while not stop.is_set():
+                started = time.monotonic()
+                self.sweep(network_ids, on_change, stop)
+                stop.wait(max(0.0, interval - (time.monotonic() - started)))
+
+        self._thread = threading.Thread(target=run, name="tauc-status-sweep", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop scheduled sweeps.
+
+        A sweep in progress is stopped too: its queued requests are
+        cancelled, so this returns once the requests already running do.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -1,39 +1,70 @@
-"""Model classes for TAUC API requests and responses."""
+"""
+Model classes for TAUC API requests and responses.
 
-# Access Token
-from .access_token.get_access_token import GetAccessTokenRequest, GetAccessTokenResponse
+Names are loaded lazily (PEP 562): ``import tauc_openapi.models`` imports
+no model modules, and each model module is imported on first access to one
+of its names. ``from tauc_openapi.models import X`` works as before.
+"""
 
-# Device Information
-from .device_information.get_device_id import GetDeviceIdRequest, GetDeviceIdResponse
-from .device_information.get_device_info import GetDeviceInfoRequest, GetDeviceInfoResponse
+from ..base.lazy_loader import lazy_exports
 
-# Inventory Management
-from .inventory_management.get_all_inventory import GetAllInventoryRequest, GetAllInventoryResponse
-from .inventory_management.get_nat_locked_inventory import GetNATLockedInventoryRequest, GetNATLockedInventoryResponse
-
-# Network System Management
-from .network_system_management.nat_lock import NATLockMeshControllerRequest, NATLockMeshControllerResponse
-from .network_system_management.nat_unlock import NATUnlockMeshControllerRequest, NATUnlockMeshControllerResponse
-from .network_system_management.get_network_status import GetNetworkStatusRequest, GetNetworkStatusResponse
-from .network_system_management.get_network_details import GetNetworkDetailsRequest, GetNetworkDetailsResponse
-from .network_system_management.get_network_name_list_v2 import GetNetworkNameListV2Request, GetNetworkNameListV2Response
-from .network_system_management.delete_network import DeleteNetworkRequest, DeleteNetworkResponse
+_EXPORTS = {
+    # Access Token
+    "GetAccessTokenRequest": ".access_token.get_access_token",
+    "GetAccessTokenResponse": ".access_token.get_access_token",
+    # Device Information
+    "GetDeviceIdRequest": ".device_information.get_device_id",
+    "GetDeviceIdResponse": ".device_information.get_device_id",
+    "GetDeviceInfoRequest": ".device_information.get_device_info",
+    "GetDeviceInfoResponse": ".device_information.get_device_info",
+    # Inventory Management
+    "GetAllInventoryRequest": ".inventory_management.get_all_inventory",
+    "GetAllInventoryResponse": ".inventory_management.get_all_inventory",
+    "GetNATLockedInventoryRequest": ".inventory_management.get_nat_locked_inventory",
+    "GetNATLockedInventoryResponse": ".inventory_management.get_nat_locked_inventory",
+    # Network System Management
+    "NATLockMeshControllerRequest": ".network_system_management.nat_lock",
+    "NATLockMeshControllerResponse": ".network_system_management.nat_lock",
+    "NATUnlockMeshControllerRequest": ".network_system_management.nat_unlock",
+    "NATUnlockMeshControllerResponse": ".network_system_management.nat_unlock",
+    "GetNetworkStatusRequest": ".network_system_management.get_network_status",
+    "GetNetworkStatusResponse": ".network_system_management.get_network_status",
+    "GetNetworkDetailsRequest": ".network_system_management.get_network_details",
+    "GetNetworkDetailsResponse": ".network_system_management.get_network_details",
+    "GetNetworkNameListV2Request": ".network_system_management.get_network_name_list_v2",
+    "GetNetworkNameListV2Response": ".network_system_management.get_network_name_list_v2",
+    "DeleteNetworkRequest": ".network_system_management.delete_network",
+    "DeleteNetworkResponse": ".network_system_management.delete_network",
+    # Service Activation Services
+    "AddNetworkRequest": ".service_activation_services.add_network",
+    "AddNetworkResponse": ".service_activation_services.add_network",
+    "BatchAddingNetworksRequest": ".service_activation_services.batch_add_networks",
+    "BatchAddingNetworksResponse": ".service_activation_services.batch_add_networks",
+    "GetBatchAddingResultRequest": ".service_activation_services.get_batch_adding_result",
+    "GetBatchAddingResultResponse": ".service_activation_services.get_batch_adding_result",
+    "DeleteNetworkListRequest": ".service_activation_services.delete_network_list",
+    "DeleteNetworkListResponse": ".service_activation_services.delete_network_list",
+    # Device Asset Management
+    "AddAssetRequest": ".device_asset_management.add_asset",
+    "AddAssetResponse": ".device_asset_management.add_asset",
+    "BatchAddingAssetsRequest": ".device_asset_management.batch_add_assets",
+    "BatchAddingAssetsResponse": ".device_asset_management.batch_add_assets",
+    "GetBatchTaskResultRequest": ".device_asset_management.get_batch_task_result",
+    "GetBatchTaskResultResponse": ".device_asset_management.get_batch_task_result",
+    "DeleteAssetRequest": ".device_asset_management.delete_asset",
+    "DeleteAssetResponse": ".device_asset_management.delete_asset",
+}
 
-# Service Activation Services
-from .service_activation_services import (
-    AddNetworkRequest, AddNetworkResponse,
-    BatchAddingNetworksRequest, BatchAddingNetworksResponse,
-    GetBatchAddingResultRequest, GetBatchAddingResultResponse,
-    DeleteNetworkListRequest, DeleteNetworkListResponse
+_SUBPACKAGES = (
+    "access_token",
+    "device_asset_management",
+    "device_information",
+    "inventory_management",
+    "network_system_management",
+    "service_activation_services",
 )
 
-# Device Asset Management
-from .device_asset_management import (
-    AddAssetRequest, AddAssetResponse,
-    BatchAddingAssetsRequest, BatchAddingAssetsResponse,
-    GetBatchTaskResultRequest, GetBatchTaskResultResponse,
-    DeleteAssetRequest, DeleteAssetResponse
-)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, _SUBPACKAGES)
 
 __all__ = [
     # Access Token
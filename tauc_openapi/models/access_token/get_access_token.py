@@ -1,6 +1,6 @@
 """Get access token request and response models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
@@ -30,22 +30,13 @@ class GetAccessTokenRequest(TAUCRequest):
 
 @dataclass
 class AccessTokenResult:
-    """Access token result data."""
-    access_token: Optional[str] = None
-    expires_in: Optional[str] = None
-    token_type: Optional[str] = None
+    """Access token result data (accepts both snake_case and camelCase keys)."""
+    access_token: Optional[str] = field(default=None, metadata={'json_key': ("access_token", "accessToken")})
+    expires_in: Optional[str] = field(default=None, metadata={'json_key': ("expires_in", "expiresIn")})
+    token_type: Optional[str] = field(default=None, metadata={'json_key': ("token_type", "tokenType")})
 
 
 class GetAccessTokenResponse(TAUCResponse[AccessTokenResult]):
     """Response containing access token."""
 
-    def _parse_result(self, result_data: dict) -> AccessTokenResult:
-        """Parse access token result."""
-        if isinstance(result_data, dict):
-            return AccessTokenResult(
-                # Try both snake_case and camelCase
-                access_token=result_data.get("access_token") or result_data.get("accessToken"),
-                expires_in=result_data.get("expires_in") or result_data.get("expiresIn"),
-                token_type=result_data.get("token_type") or result_data.get("tokenType")
-            )
-        return result_data
+    result_class = AccessTokenResult
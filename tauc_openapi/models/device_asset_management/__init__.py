@@ -1,27 +1,32 @@
-"""Device asset management models."""
-
-from .add_asset import (
-    AddAssetRequest,
-    AddAssetResponse,
-    AddAssetResult,
-    FailedAsset
-)
-from .batch_add_assets import (
-    BatchAddingAssetsRequest,
-    BatchAddingAssetsResponse,
-    BatchAddingAssetsResult,
-    Asset
-)
-from .get_batch_task_result import (
-    GetBatchTaskResultRequest,
-    GetBatchTaskResultResponse,
-    GetBatchTaskResultData
-)
-from .delete_asset import (
-    DeleteAssetRequest,
-    DeleteAssetResponse,
-    DeleteAssetResult
-)
+"""Device asset management models (loaded lazily on first access)."""
+
+from ...base.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    # Add Asset
+    "AddAssetRequest": ".add_asset",
+    "AddAssetResponse": ".add_asset",
+    "AddAssetResult": ".add_asset",
+    "FailedAsset": ".add_asset",
+
+    # Batch Add Assets
+    "BatchAddingAssetsRequest": ".batch_add_assets",
+    "BatchAddingAssetsResponse": ".batch_add_assets",
+    "BatchAddingAssetsResult": ".batch_add_assets",
+    "Asset": ".batch_add_assets",
+
+    # Get Batch Task Result
+    "GetBatchTaskResultRequest": ".get_batch_task_result",
+    "GetBatchTaskResultResponse": ".get_batch_task_result",
+    "GetBatchTaskResultData": ".get_batch_task_result",
+
+    # Delete Asset
+    "DeleteAssetRequest": ".delete_asset",
+    "DeleteAssetResponse": ".delete_asset",
+    "DeleteAssetResult": ".delete_asset",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Add Asset
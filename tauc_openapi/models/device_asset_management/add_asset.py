@@ -5,6 +5,7 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode
 
 
 @dataclass
@@ -47,21 +48,9 @@ class AddAssetResult:
 class AddAssetResponse(TAUCResponse[AddAssetResult]):
     """Response for add asset operation."""
 
-    def _parse_result(self, result_data: dict) -> Optional[AddAssetResult]:
+    def _parse_result(self, result_data) -> Optional[AddAssetResult]:
         """Parse add asset result."""
         if not result_data:
             return None
 
-        failed_assets = []
-        if result_data.get("failedAssets"):
-            for asset in result_data["failedAssets"]:
-                failed_assets.append(FailedAsset(
-                    error_code=asset.get("errorCode"),
-                    message=asset.get("message"),
-                    sn=asset.get("sn"),
-                    mac=asset.get("mac")
-                ))
-
-        return AddAssetResult(
-            failed_assets=failed_assets if failed_assets else None
-        )
+        return decode(AddAssetResult, result_data)
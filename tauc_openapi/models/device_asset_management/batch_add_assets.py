@@ -1,10 +1,11 @@
 """Batch add assets request and response models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode
 
 
 @dataclass
@@ -20,9 +21,9 @@ class BatchAddingAssetsRequest(TAUCRequest):
     Request to batch add multiple assets.
 
     Attributes:
-        assets: List of assets to add
+        assets: List of assets to add (streamed when very large)
     """
-    assets: Optional[List[Asset]] = None
+    assets: Optional[List[Asset]] = field(default=None, metadata={'stream': True})
 
     def __post_init__(self):
         super().__init__()
@@ -49,7 +50,4 @@ class BatchAddingAssetsResponse(TAUCResponse[BatchAddingAssetsResult]):
         if not result_data:
             return None
 
-        return BatchAddingAssetsResult(
-            task_id=result_data.get("taskId"),
-            new_task=result_data.get("newTask")
-        )
+        return decode(BatchAddingAssetsResult, result_data)
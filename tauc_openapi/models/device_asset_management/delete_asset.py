@@ -5,6 +5,7 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode
 
 
 @dataclass
@@ -62,16 +63,4 @@ class DeleteAssetResponse(TAUCResponse[DeleteAssetResult]):
         if not isinstance(result_data, dict):
             return None
 
-        failed_assets = []
-        if result_data.get("failedAssets"):
-            for asset in result_data["failedAssets"]:
-                failed_assets.append(FailedAsset(
-                    error_code=asset.get("errorCode"),
-                    message=asset.get("message"),
-                    sn=asset.get("sn"),
-                    mac=asset.get("mac")
-                ))
-
-        return DeleteAssetResult(
-            failed_assets=failed_assets if failed_assets else None
-        )
+        return decode(DeleteAssetResult, result_data)
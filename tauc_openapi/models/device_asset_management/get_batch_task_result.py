@@ -5,6 +5,7 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode
 from .add_asset import FailedAsset
 
 
@@ -38,21 +39,9 @@ class GetBatchTaskResultData:
 class GetBatchTaskResultResponse(TAUCResponse[GetBatchTaskResultData]):
     """Response for get batch task result operation."""
 
-    def _parse_result(self, result_data: dict) -> Optional[GetBatchTaskResultData]:
+    def _parse_result(self, result_data) -> Optional[GetBatchTaskResultData]:
         """Parse batch task result."""
         if not result_data:
             return None
 
-        failed_assets = []
-        if result_data.get("failedAssets"):
-            for asset in result_data["failedAssets"]:
-                failed_assets.append(FailedAsset(
-                    error_code=asset.get("errorCode"),
-                    message=asset.get("message"),
-                    sn=asset.get("sn"),
-                    mac=asset.get("mac")
-                ))
-
-        return GetBatchTaskResultData(
-            failed_assets=failed_assets if failed_assets else None
-        )
+        return decode(GetBatchTaskResultData, result_data)
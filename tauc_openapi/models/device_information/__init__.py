@@ -1,7 +1,17 @@
-"""Device information models."""
+"""Device information models (loaded lazily on first access)."""
 
-from .get_device_id import GetDeviceIdRequest, GetDeviceIdResponse, DeviceIdResult
-from .get_device_info import GetDeviceInfoRequest, GetDeviceInfoResponse, DeviceInfo
+from ...base.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    "GetDeviceIdRequest": ".get_device_id",
+    "GetDeviceIdResponse": ".get_device_id",
+    "DeviceIdResult": ".get_device_id",
+    "GetDeviceInfoRequest": ".get_device_info",
+    "GetDeviceInfoResponse": ".get_device_info",
+    "DeviceInfo": ".get_device_info",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "GetDeviceIdRequest",
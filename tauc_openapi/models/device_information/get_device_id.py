@@ -40,8 +40,4 @@ class DeviceIdResult:
 class GetDeviceIdResponse(TAUCResponse[DeviceIdResult]):
     """Response containing device ID."""
 
-    def _parse_result(self, result_data: dict) -> DeviceIdResult:
-        """Parse device ID result."""
-        if isinstance(result_data, dict):
-            return DeviceIdResult(device_id=result_data.get("deviceId"))
-        return result_data
+    result_class = DeviceIdResult
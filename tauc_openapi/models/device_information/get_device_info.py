@@ -1,10 +1,12 @@
 """Get device info request and response models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.dataclass_utils import slotted_dataclass
+from ...base.response_decoder import decode, decode_list
 
 
 @dataclass
@@ -28,7 +30,7 @@ class GetDeviceInfoRequest(TAUCRequest):
         return RequestUrlCollection.GET_DEVICE_INFO
 
 
-@dataclass
+@slotted_dataclass
 class DeviceInfo:
     """
     Device information data.
@@ -46,25 +48,16 @@ class DeviceInfo:
     device_id: str
     mac: str
     sn: str
-    topo_role: str
-    device_category: str
-    device_model: Optional[str] = None
-    fw_version: Optional[str] = None
+    topo_role: str = field(metadata={'intern': True})
+    device_category: str = field(metadata={'intern': True})
+    device_model: Optional[str] = field(default=None, metadata={'intern': True})
+    fw_version: Optional[str] = field(default=None, metadata={'intern': True})
     imei: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data: dict) -> 'DeviceInfo':
         """Create DeviceInfo from API response dict."""
-        return cls(
-            device_id=data.get("deviceId"),
-            mac=data.get("mac"),
-            sn=data.get("sn"),
-            device_model=data.get("deviceModel"),
-            fw_version=data.get("fwVersion"),
-            imei=data.get("imei"),
-            topo_role=data.get("topoRole"),
-            device_category=data.get("deviceCategory")
-        )
+        return decode(cls, data)
 
 
 class GetDeviceInfoResponse(TAUCResponse[List[DeviceInfo]]):
@@ -77,7 +70,7 @@ class GetDeviceInfoResponse(TAUCResponse[List[DeviceInfo]]):
 
         # API returns an array of device info objects
         if isinstance(result_data, list):
-            return [DeviceInfo.from_dict(item) for item in result_data]
+            return decode_list(DeviceInfo, result_data)
         elif isinstance(result_data, dict):
             # Handle single object case
             return [DeviceInfo.from_dict(result_data)]
@@ -5,7 +5,8 @@ from typing import Optional
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
-from .get_nat_locked_inventory import InventoryData, NATLockedInventoryResult
+from ...base.columnar import ColumnarResponseMixin
+from .get_nat_locked_inventory import NATLockedInventoryResult
 
 
 @dataclass
@@ -33,34 +34,13 @@ class GetAllInventoryRequest(TAUCRequest):
 
 
 # Reuse the same result structure as NAT locked inventory
-class GetAllInventoryResponse(TAUCResponse[NATLockedInventoryResult]):
-    """Response containing all inventory devices."""
+class GetAllInventoryResponse(ColumnarResponseMixin, TAUCResponse[NATLockedInventoryResult]):
+    """Response containing all inventory devices (as_frame() gives one row per mesh unit)."""
 
-    def _parse_result(self, result_data: dict) -> NATLockedInventoryResult:
-        """Parse inventory result (same structure as NAT locked)."""
-        # Import here to avoid circular dependency
-        from .get_nat_locked_inventory import GetNATLockedInventoryResponse, MeshUnit
+    result_class = NATLockedInventoryResult
 
-        if isinstance(result_data, dict):
-            data_list = []
-            if result_data.get("data"):
-                for item in result_data["data"]:
-                    mesh_units = []
-                    if item.get("meshUnitList"):
-                        for unit in item["meshUnitList"]:
-                            mesh_units.append(MeshUnit(
-                                sn=unit.get("sn"),
-                                mac=unit.get("mac")
-                            ))
-                    data_list.append(InventoryData(
-                        network_name=item.get("networkName"),
-                        mesh_unit_list=mesh_units
-                    ))
-
-            return NATLockedInventoryResult(
-                total=result_data.get("total"),
-                page=result_data.get("page"),
-                page_size=result_data.get("pageSize"),
-                data=data_list
-            )
-        return result_data
+    frame_columns = (("network_name", "networkName", "string"),)
+    frame_explode = ("meshUnitList", "mesh_unit_list", (
+        ("sn", "sn", "string"),
+        ("mac", "mac", "string"),
+    ))
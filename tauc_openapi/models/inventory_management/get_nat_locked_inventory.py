@@ -1,10 +1,12 @@
 """Get NAT locked inventory request and response models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.columnar import ColumnarResponseMixin
+from ...base.dataclass_utils import slotted_dataclass
 
 
 @dataclass
@@ -31,18 +33,18 @@ class GetNATLockedInventoryRequest(TAUCRequest):
         return RequestUrlCollection.GET_NAT_LOCKED_INVENTORY
 
 
-@dataclass
+@slotted_dataclass
 class MeshUnit:
     """Mesh unit data."""
     sn: Optional[str] = None
     mac: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class InventoryData:
     """Inventory data for a network."""
     network_name: Optional[str] = None
-    mesh_unit_list: Optional[List[MeshUnit]] = None
+    mesh_unit_list: Optional[List[MeshUnit]] = field(default=None, metadata={'empty_list': True})
 
 
 @dataclass
@@ -51,35 +53,16 @@ class NATLockedInventoryResult:
     total: Optional[int] = None
     page: Optional[int] = None
     page_size: Optional[int] = None
-    data: Optional[List[InventoryData]] = None
-
-
-class GetNATLockedInventoryResponse(TAUCResponse[NATLockedInventoryResult]):
-    """Response containing NAT-locked devices."""
-
-    def _parse_result(self, result_data: dict) -> NATLockedInventoryResult:
-        """Parse NAT locked inventory result."""
-        if isinstance(result_data, dict):
-            # Parse data list
-            data_list = []
-            if result_data.get("data"):
-                for item in result_data["data"]:
-                    mesh_units = []
-                    if item.get("meshUnitList"):
-                        for unit in item["meshUnitList"]:
-                            mesh_units.append(MeshUnit(
-                                sn=unit.get("sn"),
-                                mac=unit.get("mac")
-                            ))
-                    data_list.append(InventoryData(
-                        network_name=item.get("networkName"),
-                        mesh_unit_list=mesh_units
-                    ))
-
-            return NATLockedInventoryResult(
-                total=result_data.get("total"),
-                page=result_data.get("page"),
-                page_size=result_data.get("pageSize"),
-                data=data_list
-            )
-        return result_data
+    data: Optional[List[InventoryData]] = field(default=None, metadata={'empty_list': True})
+
+
+class GetNATLockedInventoryResponse(ColumnarResponseMixin, TAUCResponse[NATLockedInventoryResult]):
+    """Response containing NAT-locked devices (as_frame() gives one row per mesh unit)."""
+
+    result_class = NATLockedInventoryResult
+
+    frame_columns = (("network_name", "networkName", "string"),)
+    frame_explode = ("meshUnitList", "mesh_unit_list", (
+        ("sn", "sn", "string"),
+        ("mac", "mac", "string"),
+    ))
@@ -1,12 +1,26 @@
-"""Network system management models."""
+"""Network system management models (loaded lazily on first access)."""
 
-from .get_network_id import GetNetworkIdRequest, GetNetworkIdResponse, NetworkIdResult
-from .nat_lock import NATLockMeshControllerRequest, NATLockMeshControllerResponse
-from .nat_unlock import NATUnlockMeshControllerRequest, NATUnlockMeshControllerResponse
-from .get_network_details import GetNetworkDetailsRequest, GetNetworkDetailsResponse
-from .get_network_status import GetNetworkStatusRequest, GetNetworkStatusResponse
-from .get_network_name_list_v2 import GetNetworkNameListV2Request, GetNetworkNameListV2Response
-from .delete_network import DeleteNetworkRequest, DeleteNetworkResponse
+from ...base.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    "GetNetworkIdRequest": ".get_network_id",
+    "GetNetworkIdResponse": ".get_network_id",
+    "NetworkIdResult": ".get_network_id",
+    "NATLockMeshControllerRequest": ".nat_lock",
+    "NATLockMeshControllerResponse": ".nat_lock",
+    "NATUnlockMeshControllerRequest": ".nat_unlock",
+    "NATUnlockMeshControllerResponse": ".nat_unlock",
+    "GetNetworkDetailsRequest": ".get_network_details",
+    "GetNetworkDetailsResponse": ".get_network_details",
+    "GetNetworkStatusRequest": ".get_network_status",
+    "GetNetworkStatusResponse": ".get_network_status",
+    "GetNetworkNameListV2Request": ".get_network_name_list_v2",
+    "GetNetworkNameListV2Response": ".get_network_name_list_v2",
+    "DeleteNetworkRequest": ".delete_network",
+    "DeleteNetworkResponse": ".delete_network",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "GetNetworkIdRequest",
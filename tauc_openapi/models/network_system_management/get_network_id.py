@@ -5,6 +5,7 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode_list
 
 
 @dataclass
@@ -41,11 +42,5 @@ class GetNetworkIdResponse(TAUCResponse[List[NetworkIdResult]]):
     def _parse_result(self, result_data: dict) -> Optional[List[NetworkIdResult]]:
         """Parse network ID result list."""
         if isinstance(result_data, list):
-            results = []
-            for item in result_data:
-                results.append(NetworkIdResult(
-                    networkName=item.get("networkName"),
-                    id=item.get("id")
-                ))
-            return results
+            return decode_list(NetworkIdResult, result_data)
         return None
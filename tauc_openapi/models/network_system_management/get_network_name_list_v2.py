@@ -5,6 +5,9 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.columnar import ColumnarResponseMixin
+from ...base.dataclass_utils import slotted_dataclass
+from ...base.response_decoder import decode
 
 
 @dataclass
@@ -55,7 +58,7 @@ class GetNetworkNameListV2Request(TAUCRequest):
         return RequestUrlCollection.GET_NETWORK_NAME_LIST_V2
 
 
-@dataclass
+@slotted_dataclass
 class NetworkData:
     """Network data with ID and name."""
     id: Optional[int] = None
@@ -71,8 +74,13 @@ class GetNetworkNameListV2Result:
     data: Optional[List[NetworkData]] = None
 
 
-class GetNetworkNameListV2Response(TAUCResponse[GetNetworkNameListV2Result]):
-    """Response for get network name list V2 operation."""
+class GetNetworkNameListV2Response(ColumnarResponseMixin, TAUCResponse[GetNetworkNameListV2Result]):
+    """Response for get network name list V2 operation (supports as_frame())."""
+
+    frame_columns = (
+        ("id", "id", "Int64"),
+        ("network_name", "networkName", "string"),
+    )
 
     def _parse_result(self, result_data) -> Optional[GetNetworkNameListV2Result]:
         """Parse get network name list V2 result."""
@@ -82,18 +90,4 @@ class GetNetworkNameListV2Response(TAUCResponse[GetNetworkNameListV2Result]):
         if not isinstance(result_data, dict):
             return None
 
-        # Parse data list
-        data_list = []
-        if result_data.get("data"):
-            for item in result_data["data"]:
-                data_list.append(NetworkData(
-                    id=item.get("id"),
-                    network_name=item.get("networkName")
-                ))
-
-        return GetNetworkNameListV2Result(
-            total=result_data.get("total"),
-            page=result_data.get("page"),
-            page_size=result_data.get("pageSize"),
-            data=data_list if len(data_list) > 0 else None
-        )
+        return decode(GetNetworkNameListV2Result, result_data)
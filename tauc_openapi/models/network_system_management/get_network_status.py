@@ -1,6 +1,6 @@
 """Get network status request and response models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
@@ -31,14 +31,10 @@ class GetNetworkStatusRequest(TAUCRequest):
 @dataclass
 class NetworkStatusResult:
     """Network status result data."""
-    status: Optional[str] = None
+    status: Optional[str] = field(default=None, metadata={'intern': True})
 
 
 class GetNetworkStatusResponse(TAUCResponse[NetworkStatusResult]):
     """Response containing network status."""
 
-    def _parse_result(self, result_data: dict) -> NetworkStatusResult:
-        """Parse network status result."""
-        if isinstance(result_data, dict):
-            return NetworkStatusResult(status=result_data.get("status"))
-        return result_data
+    result_class = NetworkStatusResult
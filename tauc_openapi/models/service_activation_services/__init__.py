@@ -1,35 +1,40 @@
-"""Service activation services models."""
+"""Service activation services models (loaded lazily on first access)."""
 
-from .add_network import (
-    AddNetworkRequest,
-    AddNetworkResponse,
-    AddNetworkResult,
-    FailedMeshUnit,
-    MeshUnit,
-    Tag,
-    PreConfig,
-    PreConfigInternet,
-    PreConfigWireless,
-    PreConfigSipUserInfo,
-    PreConfigSipAlg
-)
-from .batch_add_networks import (
-    BatchAddingNetworksRequest,
-    BatchAddingNetworksResponse,
-    BatchAddingNetworksResult,
-    SingleNetwork
-)
-from .get_batch_adding_result import (
-    GetBatchAddingResultRequest,
-    GetBatchAddingResultResponse,
-    BatchAddingResultNetwork,
-    BatchMeshUnit
-)
-from .delete_network_list import (
-    DeleteNetworkListRequest,
-    DeleteNetworkListResponse,
-    DeleteNetworkListResult
-)
+from ...base.lazy_loader import lazy_exports
+
+_EXPORTS = {
+    # Add Network
+    "AddNetworkRequest": ".add_network",
+    "AddNetworkResponse": ".add_network",
+    "AddNetworkResult": ".add_network",
+    "FailedMeshUnit": ".add_network",
+    "MeshUnit": ".add_network",
+    "Tag": ".add_network",
+    "PreConfig": ".add_network",
+    "PreConfigInternet": ".add_network",
+    "PreConfigWireless": ".add_network",
+    "PreConfigSipUserInfo": ".add_network",
+    "PreConfigSipAlg": ".add_network",
+
+    # Batch Add Networks
+    "BatchAddingNetworksRequest": ".batch_add_networks",
+    "BatchAddingNetworksResponse": ".batch_add_networks",
+    "BatchAddingNetworksResult": ".batch_add_networks",
+    "SingleNetwork": ".batch_add_networks",
+
+    # Get Batch Adding Result
+    "GetBatchAddingResultRequest": ".get_batch_adding_result",
+    "GetBatchAddingResultResponse": ".get_batch_adding_result",
+    "BatchAddingResultNetwork": ".get_batch_adding_result",
+    "BatchMeshUnit": ".get_batch_adding_result",
+
+    # Delete Network List
+    "DeleteNetworkListRequest": ".delete_network_list",
+    "DeleteNetworkListResponse": ".delete_network_list",
+    "DeleteNetworkListResult": ".delete_network_list",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Add Network
@@ -5,6 +5,7 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode
 
 
 @dataclass
@@ -173,16 +174,4 @@ class AddNetworkResponse(TAUCResponse[AddNetworkResult]):
         if not isinstance(result_data, dict):
             return None
 
-        failed_units = []
-        if result_data.get("failedMeshUnitList"):
-            for unit in result_data["failedMeshUnitList"]:
-                failed_units.append(FailedMeshUnit(
-                    sn=unit.get("sn"),
-                    mac=unit.get("mac"),
-                    error=unit.get("error")
-                ))
-
-        return AddNetworkResult(
-            id=result_data.get("id"),
-            failed_mesh_unit_list=failed_units if failed_units else None
-        )
+        return decode(AddNetworkResult, result_data)
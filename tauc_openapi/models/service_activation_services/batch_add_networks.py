@@ -1,10 +1,11 @@
 """Batch add networks request and response models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode
 from .add_network import (
     PreConfig, MeshUnit, Tag,
     PreConfigInternet, PreConfigWireless,
@@ -36,9 +37,9 @@ class BatchAddingNetworksRequest(TAUCRequest):
     Request to batch add multiple networks.
 
     Attributes:
-        networks_list: List of networks to add
+        networks_list: List of networks to add (streamed when very large)
     """
-    networks_list: Optional[List[SingleNetwork]] = None
+    networks_list: Optional[List[SingleNetwork]] = field(default=None, metadata={'stream': True})
 
     def __post_init__(self):
         super().__init__()
@@ -64,6 +65,4 @@ class BatchAddingNetworksResponse(TAUCResponse[BatchAddingNetworksResult]):
         if not result_data:
             return None
 
-        return BatchAddingNetworksResult(
-            task_id=result_data.get("taskId")
-        )
+        return decode(BatchAddingNetworksResult, result_data)
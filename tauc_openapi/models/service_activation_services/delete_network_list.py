@@ -5,6 +5,7 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode_list
 
 
 @dataclass
@@ -45,11 +46,4 @@ class DeleteNetworkListResponse(TAUCResponse[List[DeleteNetworkListResult]]):
         if not isinstance(result_data, list):
             return None
 
-        results = []
-        for item in result_data:
-            results.append(DeleteNetworkListResult(
-                network_id=item.get("networkId"),
-                error_reason=item.get("errorReason")
-            ))
-
-        return results if results else None
+        return decode_list(DeleteNetworkListResult, result_data) or None
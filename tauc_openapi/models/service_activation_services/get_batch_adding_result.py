@@ -5,6 +5,7 @@ from typing import Optional, List
 from ...base.tauc_request import TAUCRequest, HttpMethod
 from ...base.tauc_response import TAUCResponse
 from ...base.request_url_collection import RequestUrlCollection
+from ...base.response_decoder import decode_list
 from .add_network import PreConfig, Tag
 
 
@@ -59,54 +60,11 @@ class GetBatchAddingResultResponse(TAUCResponse[List[BatchAddingResultNetwork]])
     """Response for get batch adding result operation."""
 
     def _parse_result(self, result_data) -> Optional[List[BatchAddingResultNetwork]]:
-        """Parse batch adding result."""
+        """Parse batch adding result (including nested preConfig)."""
         if not result_data:
             return None
 
         if not isinstance(result_data, list):
             return None
 
-        networks = []
-        for network_data in result_data:
-            mesh_units = []
-            if network_data.get("meshUnitList"):
-                for unit in network_data["meshUnitList"]:
-                    mesh_units.append(BatchMeshUnit(
-                        sn=unit.get("sn"),
-                        mac=unit.get("mac"),
-                        error_info=unit.get("errorInfo")
-                    ))
-
-            tags = []
-            if network_data.get("tags"):
-                for tag_data in network_data["tags"]:
-                    tags.append(Tag(
-                        name=tag_data.get("name"),
-                        value=tag_data.get("value")
-                    ))
-
-            # Parse pre_config if present
-            pre_config = None
-            if network_data.get("preConfig"):
-                # Note: Full parsing of preConfig would require importing
-                # and parsing all nested structures. For now, we'll set it to None
-                # and can expand this later if needed.
-                pass
-
-            networks.append(BatchAddingResultNetwork(
-                network_name=network_data.get("networkName"),
-                username=network_data.get("username"),
-                phone_number=network_data.get("phoneNumber"),
-                email=network_data.get("email"),
-                olt=network_data.get("olt"),
-                address=network_data.get("address"),
-                subscribe_download=network_data.get("subscribeDownload"),
-                subscribe_upload=network_data.get("subscribeUpload"),
-                subscribe_date=network_data.get("subscribeDate"),
-                user_network_profile_city=network_data.get("userNetworkProfileCity"),
-                mesh_unit_list=mesh_units if mesh_units else None,
-                tags=tags if tags else None,
-                pre_config=pre_config
-            ))
-
-        return networks
+        return decode_list(BatchAddingResultNetwork, result_data)
@@ -3,6 +3,7 @@
 Test script to verify snake_case to camelCase conversion in request_utils.py
 """
 
+import hashlib
 import json
 from tauc_openapi.base.request_utils import RequestUtils
 
@@ -148,6 +149,102 @@ def test_json_serialization():
         raise AssertionError("Request body is None")
 
 
+def test_camel_case_memoized():
+    """Test that key conversion is memoized."""
+    print("Testing _to_camel_case() memoization...")
+
+    RequestUtils._to_camel_case.cache_clear()
+    for _ in range(100):
+        RequestUtils._to_camel_case("mesh_unit_list")
+
+    info = RequestUtils._to_camel_case.cache_info()
+    print(f"  cache: hits={info.hits}, misses={info.misses}")
+    assert info.misses == 1, f"Expected 1 miss, got {info.misses}"
+    assert info.hits == 99, f"Expected 99 hits, got {info.hits}"
+
+    print("  ✓ Key conversion memoized!\n")
+
+
+def test_to_camel_case_dict_filtering():
+    """Test None filtering and empty-dict dropping in nested structures."""
+    print("Testing _to_camel_case_dict() filtering...")
+
+    from tauc_openapi.models.service_activation_services import PreConfig, PreConfigWireless
+
+    snake_dict = {
+        "network_name": "Net",
+        "email": None,
+        "empty_nested": {"only_none": None, "inner": {"also_none": None}},
+        "unit_list": [{"device_sn": "SN1"}, {}],
+        "pre_config": PreConfig(
+            operation_mode="Router",
+            wireless=PreConfigWireless(enable_band_steering=False)
+        ),
+        "zero_value": 0,
+    }
+
+    result = RequestUtils._to_camel_case_dict(snake_dict)
+    print(f"  {result}")
+
+    assert "email" not in result, "None value not filtered"
+    assert "emptyNested" not in result, "Empty nested dict not dropped"
+    assert result["unitList"] == [{"deviceSn": "SN1"}, {}], "List items mismatch"
+    assert result["preConfig"] == {
+        "operationMode": "Router",
+        "wireless": {"enableBandSteering": False}
+    }, "Dataclass conversion mismatch"
+    assert result["zeroValue"] == 0, "Falsy value dropped"
+
+    print("  ✓ Filtering passed!\n")
+
+
+def test_batch_networks_serialization():
+    """Test serialization of a large (streamed) BatchAddingNetworksRequest body."""
+    print("Testing BatchAddingNetworksRequest serialization...")
+
+    from tauc_openapi.models.service_activation_services import (
+        BatchAddingNetworksRequest, SingleNetwork, MeshUnit, Tag, PreConfig, PreConfigWireless
+    )
+
+    count = 5000
+    request = BatchAddingNetworksRequest(networks_list=[
+        SingleNetwork(
+            network_name=f"Network{i}",
+            mesh_unit_list=[
+                MeshUnit(sn=f"SN{i:05d}A", mac="AA:BB:CC:DD:EE:01"),
+                MeshUnit(sn=f"SN{i:05d}B")
+            ],
+            tags=[Tag(name="site", value=f"S{i % 10}")],
+            pre_config=PreConfig(wireless=PreConfigWireless(ssid=f"SSID{i}"))
+        )
+        for i in range(count)
+    ])
+
+    body = RequestUtils.process_request_body(request.get_url(), request)
+
+    # Large batches are streamed - the chunks must join into the same JSON document
+    from tauc_openapi.base.streaming_body import StreamingBody
+    assert isinstance(body, StreamingBody), f"Expected StreamingBody, got {type(body).__name__}"
+    streamed = body
+    body = streamed.to_bytes()
+    assert len(streamed) == len(body), "Content length mismatch"
+    assert streamed.md5_digest() == hashlib.md5(body).digest(), "Content-MD5 mismatch"
+    body_dict = json.loads(body)
+
+    networks = body_dict["networksList"]
+    assert len(networks) == count, f"Expected {count} networks, got {len(networks)}"
+    assert networks[0] == {
+        "networkName": "Network0",
+        "meshUnitList": [{"sn": "SN00000A", "mac": "AA:BB:CC:DD:EE:01"}, {"sn": "SN00000B"}],
+        "tags": [{"name": "site", "value": "S0"}],
+        "preConfig": {"wireless": {"ssid": "SSID0"}}
+    }, f"First network mismatch: {networks[0]}"
+    assert networks[-1]["networkName"] == f"Network{count - 1}", "Network order not preserved"
+    assert b" " not in body, "Body is not compact"
+
+    print(f"  ✓ {count} networks serialized ({len(body):,} bytes)!\n")
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -158,6 +255,9 @@ def main():
         test_to_camel_case()
         test_to_camel_case_dict()
         test_json_serialization()
+        test_camel_case_memoized()
+        test_to_camel_case_dict_filtering()
+        test_batch_networks_serialization()
 
         print("=" * 60)
         print("✓ ALL TESTS PASSED!")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for the server clock-skew estimator.
+
+Feeds Date headers of a server whose clock runs ahead of (or behind) the
+local clock into a ClockSkewEstimator and checks the estimate and the
+corrected signature timestamps.
+"""
+
+import time
+from email.utils import formatdate
+
+from tauc_openapi.execute.clock_skew import ClockSkewEstimator
+
+
+def observe_skew(estimator: ClockSkewEstimator, skew: float, round_trip: float = 0.1) -> None:
+    """Feed one response from a server whose clock is ``skew`` seconds ahead."""
+    sent_at = time.time()
+    received_at = sent_at + round_trip
+    # Date headers have one-second resolution (the estimator takes the middle)
+    server_time = round((sent_at + received_at) / 2 + skew - 0.5)
+    estimator.observe(formatdate(server_time, usegmt=True), sent_at, received_at)
+
+
+def test_moving_average():
+    """Test that samples are smoothed, slow round trips ignored and jumps reset the estimate."""
+    print("Testing the moving average...")
+
+    estimator = ClockSkewEstimator()
+    observe_skew(estimator, 120)
+    assert abs(estimator.offset - 120) <= 0.6, f"First sample should set the estimate, got {estimator.offset}"
+
+    observe_skew(estimator, 130)
+    expected = 120 + ClockSkewEstimator.ALPHA * 10
+    assert abs(estimator.offset - expected) <= 0.6, f"Expected about {expected}, got {estimator.offset}"
+
+    before = estimator.offset
+    observe_skew(estimator, 125, round_trip=ClockSkewEstimator.MAX_ROUND_TRIP + 1)
+    estimator.observe(None, time.time(), time.time())
+    estimator.observe("not a date", time.time(), time.time())
+    assert estimator.offset == before and estimator.samples == 2, "Slow or dateless responses should be ignored"
+
+    observe_skew(estimator, -200)
+    assert abs(estimator.offset + 200) <= 0.6, f"A jump past RESET_THRESHOLD should reset, got {estimator.offset}"
+    print(f"  ✓ Smoothed, filtered and reset ({estimator.metrics()})\n")
+
+
+def test_corrected_timestamps():
+    """Test that timestamps are corrected only once the skew reaches MIN_CORRECTION."""
+    print("Testing corrected timestamps...")
+
+    estimator = ClockSkewEstimator()
+    assert abs(estimator.timestamp() - time.time()) <= 1, "No samples: local time"
+
+    estimator._offset = ClockSkewEstimator.MIN_CORRECTION / 2
+    now = int(time.time())
+    assert estimator.timestamp() in (now, now + 1), "A skew below MIN_CORRECTION should not be applied"
+
+    observe_skew(estimator, 3600)
+    corrected = estimator.timestamp()
+    assert abs(corrected - (time.time() + 3600)) <= 1.5, f"Expected server time, got {corrected - time.time():+.1f}s"
+    print(f"  ✓ Timestamps follow the server clock ({corrected - int(time.time()):+d}s)\n")
+
+
+def test_skew_rejections():
+    """Test that only failures signed far from the server clock count as skew rejections."""
+    print("Testing skew rejections...")
+
+    estimator = ClockSkewEstimator()
+    now = int(time.time())
+    server_date = formatdate(now, usegmt=True)
+    assert not estimator.check_rejection(server_date, now + 5), "A small difference is not a skew rejection"
+    assert not estimator.check_rejection(None, now - 600), "Without a Date header nothing is attributed"
+    assert estimator.check_rejection(server_date, now - 600), "A timestamp 10 minutes off is a skew rejection"
+    assert estimator.metrics()["skew_rejections"] == 1
+    print("  ✓ Rejections attributed to clock skew only when the timestamp was off\n")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing ClockSkewEstimator")
+    print("=" * 60 + "\n")
+
+    try:
+        test_moving_average()
+        test_corrected_timestamps()
+        test_skew_rejections()
+
+        print("=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except Exception as e:
+        print("=" * 60)
+        print(f"✗ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""
+Test the local SQLite inventory mirror, the in-memory inventory index, the
+device cache and bulk device lookup.
+
+Runs InventoryMirror against an ApiClient whose transport is a local
+stand-in for the network list, network details and device endpoints, and
+checks that syncs write only the differences and that lookups read the
+mirror; then loads an InventoryIndex from the mirror and checks its lookups
+and mutations, checks that repeat device lookups make no API calls, and that bulk
+lookups are pipelined and rate limited.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+from tauc_openapi.base.client_type import ClientType
+from tauc_openapi.execute import api_client
+from tauc_openapi.execute.api_client import ApiClient
+from tauc_openapi.execute import RateLimiter
+from tauc_openapi.inventory import (
+    BulkDeviceResolver, DetailsCrawler, DeviceCache, InventoryIndex, InventoryMirror, SnapshotStore, StatusSweeper
+)
+
+
+class StandInTransport:
+    """
+    Local stand-in for HttpClient (AK/SK client, so no token endpoint).
+
+    Serves ``networks`` (status -> list of {id, networkName}) from the
+    network list endpoint, one mesh unit and tag per network from the
+    network details endpoint, ``statuses`` (id -> status, default ONLINE)
+    from the network status endpoint, ``inventory`` (list of {networkName,
+    meshUnitList}) from the all-inventory endpoint, and devices whose SN
+    starts with "SN" from the device endpoints (with undecodable device
+    information for SNs containing "BROKEN").
+    """
+
+    def __init__(self, networks, device_delay: float = 0.0):
+        self.lock = threading.Lock()
+        self.networks = networks
+        self.device_delay = device_delay
+        self.fail_details = set()
+        self.details_without_id = set()
+        self.statuses = {}
+        self.status_requests = 0
+        self.inventory = []
+        self.list_requests = 0
+        self.details_requests = 0
+        self.device_requests = 0
+
+    def request(self, method, url, headers=None, params=None, json_data=None, data=None):
+        if "/device-information/" in url:
+            with self.lock:
+                self.device_requests += 1
+            time.sleep(self.device_delay)
+            if url.endswith("/device-id"):
+                if not params["sn"].startswith("SN"):
+                    return self._response({"errorCode": -70346, "msg": "Invalid parameter"})
+                return self._response({"errorCode": 0, "result": {"deviceId": f"dev-{params['sn']}-{params['mac']}"}})
+            device_id = url.rsplit("/", 1)[-1]
+            if "BROKEN" in device_id:
+                return self._response({"errorCode": 0, "result": [5]})
+            return self._response({"errorCode": 0, "result": [{
+                "deviceId": device_id, "sn": "SN", "mac": "MAC", "topoRole": "MASTER", "deviceCategory": "DECO",
+                "deviceModel": "X50" if device_id[-1] in "02468" else "X20", "fwVersion": "1.2.0"
+            }]})
+
+        if url.endswith("/all-inventory"):
+            page, size = int(params["page"]), int(params["pageSize"])
+            return self._response({"errorCode": 0, "result": {
+                "total": len(self.inventory), "page": page, "pageSize": size,
+                "data": self.inventory[page * size:(page + 1) * size]
+            }})
+
+        if "network-name-list" in url:
+            with self.lock:
+                self.list_requests += 1
+            rows = self.networks.get(params["networkStatus"], [])
+            if not rows:
+                return self._response({"errorCode": -70301, "msg": "Network does not exist"})
+            page, size = int(params["page"]), int(params["pageSize"])
+            return self._response({"errorCode": 0, "result": {
+                "total": len(rows), "page": page, "pageSize": size,
+                "data": rows[page * size:(page + 1) * size]
+            }})
+
+        network_id = int(url.rstrip("/").rsplit("/", 1)[-1])
+        if "/status/" in url:
+            with self.lock:
+                self.status_requests += 1
+            status = self.statuses.get(network_id, "ONLINE")
+            if status is None:
+                return self._response({"errorCode": -70301, "msg": "Network does not exist"})
+            return self._response({"errorCode": 0, "result": {"status": status}})
+
+        with self.lock:
+            self.details_requests += 1
+        if network_id in self.fail_details:
+            return self._response({"errorCode": -1, "msg": "Internal error"})
+        network = {
+            "id": network_id,
+            "networkName": f"Net-{network_id}",
+            "meshUnitList": [{"sn": f"SN{network_id}", "mac": f"50-C7-BF-00-00-{network_id:02X}",
+                              "deviceId": f"dev-{network_id}", "topoRole": "MASTER"}],
+            "tags": [{"name": "region", "value": "eu" if network_id % 2 else "us"}],
+        }
+        if network_id in self.details_without_id:
+            del network["id"], network["networkName"]
+        return self._response({"errorCode": 0, "result": {"network": network}})
+
+    @staticmethod
+    def _response(payload: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response._content = json.dumps(payload).encode("utf-8")
+        return response
+
+    def close(self):
+        pass
+
+
+def build_mirror(transport: StandInTransport, path: str = ":memory:") -> InventoryMirror:
+    """Build a mirror over an AK/SK ApiClient using the stand-in transport."""
+    http_client_class = api_client.HttpClient
+    api_client.HttpClient = lambda cert_path, key_path: transport
+    try:
+        client = ApiClient(ClientType.ACCESS_KEY, "tauc.example", "client.crt", "client.key",
+                           access_key="access-key", secret="secret-key")
+    finally:
+        api_client.HttpClient = http_client_class
+    return InventoryMirror(client, path)
+
+
+def networks(first: int, last: int):
+    """Network list rows with ids first..last."""
+    return [{"id": i, "networkName": f"Net-{i}"} for i in range(first, last + 1)]
+
+
+def test_incremental_sync():
+    """Test that unchanged listings write nothing and fresh statuses skip the API."""
+    print("Testing incremental sync...")
+
+    transport = StandInTransport({"ONLINE": networks(1, 2500), "OFFLINE": networks(2501, 2600)})
+    mirror = build_mirror(transport)
+
+    first = {s.status: s for s in mirror.sync()}
+    assert first["ONLINE"].added == 2500 and first["OFFLINE"].added == 100
+    assert mirror.status_counts() == {"ONLINE": 2500, "OFFLINE": 100}
+
+    second = mirror.sync()
+    assert all(s.unchanged and not s.added for s in second), "Unchanged listings should write nothing"
+
+    requests_before = transport.list_requests
+    third = mirror.sync(max_age=60)
+    assert all(s.cached for s in third) and transport.list_requests == requests_before
+    assert [s.count for s in third[:2]] == [2500, 100]
+    print("  ✓ First sync adds, unchanged resync writes nothing, fresh statuses skip the API\n")
+
+
+def test_sync_applies_differences():
+    """Test renames, status moves and removals."""
+    print("Testing sync of renames, moves and removals...")
+
+    online, offline = networks(1, 50), networks(51, 60)
+    transport = StandInTransport({"ONLINE": online, "OFFLINE": offline})
+    mirror = build_mirror(transport)
+    mirror.sync()
+
+    online[0]["networkName"] = "Renamed"
+    offline.append(online.pop(1))  # id 2 goes offline
+    online.pop(1)  # id 3 is deleted
+    results = {s.status: s for s in mirror.sync()}
+
+    assert (results["ONLINE"].updated, results["ONLINE"].removed) == (1, 2)
+    assert results["OFFLINE"].updated == 1
+    assert mirror.find_by_name("RENAMED") == [{"id": 1, "name": "Renamed", "status": "ONLINE"}]
+    assert mirror.get_network(2)["status"] == "OFFLINE"
+    assert mirror.get_network(3) is None, "A network gone from every status should be deleted"
+
+    # Moving back while only OFFLINE is refreshed must not lose the network
+    online.append(offline.pop())
+    mirror.sync(["OFFLINE"])
+    mirror.sync()
+    assert mirror.get_network(2)["status"] == "ONLINE"
+    print("  ✓ Renames, moves and removals applied\n")
+
+
+def test_details_and_lookups():
+    """Test mesh unit and tag storage, lookups, and persistence to a file."""
+    print("Testing details sync and lookups...")
+
+    transport = StandInTransport({"ONLINE": networks(1, 20)})
+    path = os.path.join(tempfile.mkdtemp(), "inventory.sqlite3")
+    mirror = build_mirror(transport, path)
+    mirror.sync()
+
+    assert mirror.sync_details() == 20 and transport.details_requests == 20
+    assert mirror.sync_details() == 0 and transport.details_requests == 20, "Fetched details should not be refetched"
+
+    units = mirror.find_mesh_units(mac="50:c7:bf:00:00:0a")
+    assert [(u["network_id"], u["sn"], u["topo_role"]) for u in units] == [(10, "SN10", "MASTER")]
+    assert len(mirror.find_by_tag("region", "eu")) == 10
+
+    mirror.remove_networks([10])
+    assert mirror.find_mesh_units(sn="SN10") == []
+    mirror.close()
+
+    reopened = build_mirror(transport, path)
+    assert reopened.status_counts() == {"ONLINE": 19}
+    assert reopened.find_mesh_units(device_id="dev-7")[0]["network_name"] == "Net-7"
+    reopened.close()
+    print("  ✓ Details stored once, lookups by MAC/SN/device ID/tag, mirror persisted\n")
+
+
+def test_details_crawler():
+    """Test the fleet details crawl, its resume, and fleet queries."""
+    print("Testing DetailsCrawler...")
+
+    transport = StandInTransport({"ONLINE": networks(1, 300), "OFFLINE": networks(301, 320)})
+    mirror = build_mirror(transport)
+    crawler = DetailsCrawler(mirror, max_workers=8, rate=None)
+
+    # Interrupted after 100 networks: their details are kept
+    def interrupt(done, total):
+        if done == 100:
+            raise KeyboardInterrupt
+    try:
+        crawler.crawl(statuses=["ONLINE"], progress=interrupt)
+    except KeyboardInterrupt:
+        pass
+    requests_before = transport.details_requests
+
+    transport.fail_details = {250, 290}
+    resumed = crawler.crawl(statuses=["ONLINE"])
+    assert resumed.resumed and resumed.finished and set(resumed.failed) == {250, 290}
+    assert resumed.total <= 200 + 2 * 8 and transport.details_requests - requests_before == resumed.total
+    assert resumed.devices == 298, "Each stored device's model should be fetched once"
+
+    # A network that keeps failing does not keep the crawl open
+    repeated = crawler.crawl(statuses=["ONLINE"], max_age=3600)
+    assert not repeated.resumed and repeated.finished and repeated.total == 2 and set(repeated.failed) == {250, 290}
+
+    transport.fail_details = set()
+    retried = crawler.crawl(statuses=["ONLINE"], max_age=3600)
+    assert not retried.resumed and retried.total == 2 and retried.finished and not retried.failed
+
+    fresh = crawler.crawl(statuses=["ONLINE"], max_age=3600)
+    assert not fresh.resumed and fresh.total == 0 and fresh.devices == 0, "Fresh details should not be refetched"
+
+    # Details without an id or name are stored under the requested network, keeping its listed name
+    transport.details_without_id = {7}
+    store_details = mirror.store_details
+
+    def failing_store(network_id, network, fetched_at=None):
+        if network_id == 9:
+            raise RuntimeError("disk full")
+        return store_details(network_id, network, fetched_at)
+    mirror.store_details = failing_store
+    try:
+        refetched = crawler.crawl(statuses=["ONLINE"])
+    finally:
+        del mirror.store_details
+        transport.details_without_id = set()
+    assert refetched.finished and list(refetched.failed) == [9] and refetched.fetched == 299, \
+        "A store error should be recorded for its network without ending the crawl"
+    assert mirror.find_mesh_units(sn="SN7")[0]["network_id"] == 7 and mirror.get_network(7)["name"] == "Net-7"
+
+    assert mirror.topo_role_counts() == {"MASTER": 300}
+    assert [n["id"] for n in mirror.find_by_model("x50")] == list(range(2, 301, 2))
+    assert mirror.model_counts() == {"X50": 150, "X20": 150}
+    assert mirror.find_mesh_units(sn="SN42", topo_role="MASTER")[0]["model"] == "X50"
+    assert {(t["name"], t["value"], t["networks"]) for t in mirror.tag_counts()} == {("region", "eu", 150), ("region", "us", 150)}
+    print("  ✓ Interrupted crawl resumed, failures retried without pinning the crawl, fresh details skipped, fleet queries by model/role/tag\n")
+
+
+def test_status_sweeper():
+    """Test fleet status sweeps: seeding, change detection, subsets and scheduling."""
+    print("Testing StatusSweeper...")
+
+    transport = StandInTransport({})
+    client = build_mirror(transport).client
+    sweeper = StatusSweeper(client, max_workers=16, rate=None)
+
+    # Seeded from the listing: network 3 was listed OFFLINE, 4 is unknown
+    sweeper.track({i: ("OFFLINE" if i == 3 else None if i == 4 else "ONLINE") for i in range(1, 2001)})
+    first = sweeper.sweep()
+    assert first.checked == 2000 and [(c.network_id, c.old_status, c.new_status) for c in first.changes] == [
+        (3, "OFFLINE", "ONLINE")
+    ], "Only differences from the known status are changes"
+    assert sweeper.status_of(4) == "ONLINE" and sweeper.counts() == {"ONLINE": 2000}
+
+    transport.statuses.update({10: "OFFLINE", 11: "ABNORMAL", 12: None})
+    seen = []
+    second = sweeper.sweep(on_change=seen.append)
+    assert sorted((c.network_id, c.new_status) for c in second.changes) == [(10, "OFFLINE"), (11, "ABNORMAL")]
+    assert seen == second.changes and list(second.failed) == [12] and sweeper.status_of(12) == "ONLINE"
+    assert sweeper.networks_with_status("OFFLINE") == [10]
+    assert [c.network_id for c in sweeper.recent_changes()][-1] == 3
+
+    requests_before = transport.status_requests
+    transport.statuses[10] = "ONLINE"
+    subset = sweeper.sweep([10, 11, 99999])
+    assert subset.checked == 2 and transport.status_requests - requests_before == 2
+    assert [(c.old_status, c.new_status) for c in subset.changes] == [("OFFLINE", "ONLINE")]
+
+    # Re-tracking keeps sweep results; networks no longer listed are dropped
+    sweeper.track({i: None for i in range(1, 1001)})
+    assert len(sweeper) == 1000 and sweeper.status_of(11) == "ABNORMAL" and sweeper.status_of(1500) is None
+
+    transport.statuses[20] = "OFFLINE"
+    sweeper.start(interval=0.05, network_ids=[20])
+    time.sleep(0.2)
+    sweeper.stop()
+    assert not sweeper.running and sweeper.status_of(20) == "OFFLINE"
+
+    # Stopping does not wait for a slow, rate-limited sweep to finish
+    slow = StatusSweeper(client, max_workers=16, rate=5)
+    slow.track({i: None for i in range(1001, 1041)})
+    slow.start(interval=60)
+    time.sleep(0.3)
+    start = time.perf_counter()
+    slow.stop()
+    stop_time = time.perf_counter() - start
+    assert stop_time < 0.5 and not slow.running, f"stop() blocked for {stop_time:.2f}s"
+    assert slow.last_sweep.stopped and slow.last_sweep.checked < 40 and not slow.last_sweep.failed
+    limiter = slow.limiter
+    slow.set_rate(5)
+    assert slow.limiter is limiter, "An unchanged rate should keep the limiter's bucket"
+    slow.set_rate(50)
+    assert slow.limiter.rate == 50 and slow.limiter.burst == 16
+    slow.set_rate(None)
+    assert slow.limiter is None
+    assert sweeper._ids.itemsize * len(sweeper._ids) + len(sweeper._codes) == 9 * 1000, "Status arrays should be compact"
+    print(f"  ✓ {first.checked} networks swept in {first.elapsed:.2f}s, only changes reported, subsets and schedule\n")
+
+
+def test_snapshot_diff():
+    """Test snapshots and the streaming diff between them."""
+    print("Testing SnapshotStore...")
+
+    online, offline = networks(1, 3000), networks(3001, 3100)
+    transport = StandInTransport({"ONLINE": online, "OFFLINE": offline})
+    transport.inventory = [
+        {"networkName": f"Net-{i}", "meshUnitList": [{"sn": f"SN{i}", "mac": f"50-C7-BF-00-{i // 256:02X}-{i % 256:02X}"}]}
+        for i in range(1, 3101)
+    ]
+    store = SnapshotStore(build_mirror(transport).client)
+
+    first = store.take(label="yesterday")
+    assert first.complete and (first.networks, first.mesh_units) == (3100, 3100)
+    assert list(store.diff(first.id, store.take().id)) == [], "Identical snapshots should have no changes"
+
+    online[4]["networkName"] = "Renamed"             # id 5 renamed (its unit is not moved)
+    offline.append(online.pop(9))                    # id 10 goes offline
+    online.pop(19)                                   # id 21 deleted
+    online.append({"id": 5000, "networkName": "Net-5000"})
+    transport.inventory[4]["networkName"] = "Renamed"
+    transport.inventory[29]["meshUnitList"] = transport.inventory[30]["meshUnitList"]  # SN31 moves to Net-30
+    transport.inventory[30]["meshUnitList"] = []
+    transport.inventory.pop(20)                      # Net-21 and its unit are gone
+    transport.inventory.append({"networkName": "Net-5000", "meshUnitList": [{"sn": "SN5000", "mac": "aabbccddeeff"}]})
+    second = store.take()
+
+    start = time.perf_counter()
+    changes = list(store.diff(first.id, second.id))
+    elapsed = time.perf_counter() - start
+    by_key = {(c.kind, c.key): c for c in changes}
+    assert by_key[("network", 5)].category == "renamed" and by_key[("network", 5)].fields == ("name",)
+    assert by_key[("network", 10)].category == "status_changed" and by_key[("network", 10)].new["status"] == "OFFLINE"
+    assert by_key[("network", 21)].change == "removed" and by_key[("network", 5000)].change == "added"
+    assert by_key[("mesh_unit", "SN31")].category == "units_moved" and by_key[("mesh_unit", "SN31")].new["network_id"] == 30
+    assert by_key[("mesh_unit", "SN30")].change == "removed" and ("mesh_unit", "SN5") not in by_key
+    assert by_key[("mesh_unit", "SN21")].change == "removed"
+    assert store.diff_summary(first.id, second.id) == {
+        "renamed": 1, "status_changed": 1, "networks_removed": 1, "networks_added": 1,
+        "units_moved": 1, "units_removed": 2, "units_added": 1,
+    }
+    assert [c.key for c in changes if c.kind == "network"] == [5, 10, 21, 5000], "Changes should stream in key order"
+
+    assert store.latest(before=second.taken_at).id == second.id - 1
+    assert store.prune(keep=2) == 1 and len(store.list_snapshots()) == 2
+    print(f"  ✓ Renames, status flips, adds/removes and moved units found in {elapsed * 1000:.1f} ms over 2x6200 records\n")
+
+
+def test_inventory_index():
+    """Test index lookups, mutations, version counter and TTL."""
+    print("Testing InventoryIndex...")
+
+    transport = StandInTransport({"ONLINE": networks(1, 1000), "OFFLINE": [{"id": 1001, "networkName": "net-1"}]})
+    mirror = build_mirror(transport)
+    mirror.sync()
+    mirror.sync_details(range(1, 11))
+
+    index = InventoryIndex(ttl=0.2)
+    assert index.expired and len(index) == 0
+    index.load(mirror.get_networks(), mirror.get_mesh_units())
+    assert not index.expired and len(index) == 1001
+
+    assert [n["id"] for n in index.find_by_name("NET-1")] == [1, 1001]
+    assert [n["id"] for n in index.find_by_name("net-1", case_sensitive=True)] == [1001]
+    assert index.find_by_sn("SN5")["id"] == 5
+    assert index.find_by_mac("50c7bf00000a") == {"id": 10, "name": "Net-10", "status": "ONLINE"}
+
+    version = index.version
+    index.add_network(2000, "Brand New")
+    index.set_status(5, "NAT-LOCKED")
+    index.add_network(7, "Renamed")
+    index.remove_network(10)
+    assert index.version == version + 4
+    assert index.find_by_name("brand new") == [{"id": 2000, "name": "Brand New", "status": None}]
+    assert index.get(5)["status"] == "NAT-LOCKED"
+    assert index.find_by_name("net-7") == [] and index.find_by_name("renamed")[0]["id"] == 7
+    assert index.find_by_mac("50:C7:BF:00:00:0A") is None and index.find_by_sn("SN10") is None
+
+    time.sleep(0.25)
+    assert index.expired, "Index should expire after its TTL"
+    print("  ✓ O(1) lookups by name/SN/MAC, mutations bump the version, TTL expiry\n")
+
+
+def test_device_cache():
+    """Test that repeat device lookups are served from the cache."""
+    print("Testing DeviceCache...")
+
+    transport = StandInTransport({})
+    client = build_mirror(transport).client
+    cache = DeviceCache(max_size=2, negative_ttl=0.2, info_ttl=60)
+
+    first = cache.resolve(client, "SN1", "aa:bb:cc:dd:ee:01")
+    assert first.device_id == "dev-SN1-AABBCCDDEE01" and first.device_info[0].topo_role == "MASTER"
+    assert transport.device_requests == 2 and not first.id_cached
+
+    again = cache.resolve(client, "SN1", "AA-BB-CC-DD-EE-01")
+    assert again.id_cached and again.info_cached and transport.device_requests == 2, "Repeat lookup hit the API"
+    assert again.id_response is first.id_response
+
+    missing = cache.resolve(client, "BAD", "aabbccddee02")
+    assert missing.device_id is None and missing.id_response.error_code == -70346
+    assert cache.resolve(client, "BAD", "aabbccddee02").id_cached, "Negative result should be cached"
+    time.sleep(0.25)
+    assert not cache.resolve(client, "BAD", "aabbccddee02").id_cached, "Negative result should expire"
+
+    # Bounded: the least recently used pair is evicted
+    cache.resolve(client, "SN2", "aabbccddee03", with_info=False)
+    cache.resolve(client, "SN3", "aabbccddee04", with_info=False)
+    assert cache.get_device_id("SN1", "aabbccddee01") is None
+    print(f"  ✓ Repeat lookups make no API calls, negatives expire, LRU bounded ({cache.metrics()})\n")
+
+
+def test_bulk_device_lookup():
+    """Test the pipelined, rate-limited bulk resolver."""
+    print("Testing BulkDeviceResolver...")
+
+    transport = StandInTransport({}, device_delay=0.01)
+    client = build_mirror(transport).client
+    pairs = [(f"SN{i}", f"aa-bb-cc-00-{i // 256:02x}-{i % 256:02x}") for i in range(400)]
+    pairs += pairs[:50] + [("BAD1", "aabbccddee01"), ("SNBROKEN", "aabbccddee02")]
+
+    resolver = BulkDeviceResolver(client, cache=DeviceCache(), max_workers=16, rate=None)
+    start = time.perf_counter()
+    lookups = list(resolver.resolve_many(iter(pairs)))
+    elapsed = time.perf_counter() - start
+
+    assert len(lookups) == len(pairs)
+    found = [lookup for lookup in lookups if lookup.device_id]
+    assert len(found) == 451 and all(lookup.device_info[0].topo_role == "MASTER" for lookup in found
+                                     if lookup.sn != "SNBROKEN")
+    assert sum(1 for lookup in lookups if lookup.id_response.error_code == -70346) == 1
+    # An undecodable response is reported for its own row
+    broken = next(lookup for lookup in lookups if lookup.sn == "SNBROKEN")
+    assert broken.device_info == [] and "decode" in broken.info_response.msg
+    # Repeated pairs are served from the cache (at most a few raced their first lookup)
+    assert 803 <= resolver.api_calls <= 803 + 2 * 16 and resolver.api_calls == transport.device_requests
+    assert elapsed < 803 * 0.01 / 4, f"Lookups were not pipelined ({elapsed:.2f}s)"
+
+    limiter = RateLimiter(rate=200, burst=5)
+    start = time.perf_counter()
+    for _ in range(25):
+        limiter.acquire()
+    assert time.perf_counter() - start >= 20 / 200 * 0.9, "Rate limiter did not pace calls"
+    print(f"  ✓ {len(pairs)} lookups in {elapsed:.2f}s with {resolver.api_calls} API calls, rate limiter paces\n")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing InventoryMirror, DetailsCrawler, StatusSweeper, SnapshotStore, InventoryIndex, DeviceCache and bulk lookup")
+    print("=" * 60 + "\n")
+
+    try:
+        test_incremental_sync()
+        test_sync_applies_differences()
+        test_details_and_lookups()
+        test_details_crawler()
+        test_status_sweeper()
+        test_snapshot_diff()
+        test_inventory_index()
+        test_device_cache()
+        test_bulk_device_lookup()
+
+        print("=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except Exception as e:
+        print("=" * 60)
+        print(f"✗ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Stress test for the thread-safe, single-flight AccessTokenManager.
+
+64 worker threads hit an expired (or rejected) token at the same moment
+through an ApiClient whose transport is a local stand-in for the TAUC token
+endpoint; exactly one token request must be made, and all workers must get
+its outcome.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tauc_openapi import TAUCApiException
+from tauc_openapi.base.client_type import ClientType
+from tauc_openapi.execute import api_client
+from tauc_openapi.execute.api_client import ApiClient
+from tauc_openapi.execute.auth_manager import AccessTokenManager
+from tauc_openapi.models import GetNetworkNameListV2Request, GetNetworkNameListV2Response
+
+WORKERS = 64
+
+
+class StandInTransport:
+    """
+    Local stand-in for HttpClient.
+
+    The token endpoint issues "token-<n>" after a short delay (so concurrent
+    callers overlap) to clients sending the right secret; other endpoints
+    accept only the latest issued token.
+    """
+
+    def __init__(self, fail_token_requests: bool = False):
+        self.lock = threading.Lock()
+        self.fail_token_requests = fail_token_requests
+        self.token_requests = 0
+        self.current_token = None
+
+    def request(self, method, url, headers=None, params=None, json_data=None, data=None):
+        if url.endswith("/token"):
+            with self.lock:
+                self.token_requests += 1
+                issued = f"token-{self.token_requests}"
+            time.sleep(0.05)
+            if (params or {}).get("client_secret") != "client-secret":
+                return self._response({"errorCode": -1, "msg": "invalid client secret"})
+            if self.fail_token_requests:
+                return self._response({"errorCode": -1, "msg": "token endpoint unavailable"})
+            with self.lock:
+                self.current_token = issued
+            return self._response({"errorCode": 0, "result": {"access_token": issued, "expires_in": "3600"}})
+
+        with self.lock:
+            valid = headers.get("Authorization") == f"Bearer {self.current_token}"
+        if not valid:
+            return self._response({"errorCode": -70435, "msg": "invalid token"})
+        return self._response({"errorCode": 0, "result": {"total": 0, "data": []}})
+
+    @staticmethod
+    def _response(payload: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response._content = json.dumps(payload).encode("utf-8")
+        return response
+
+    def close(self):
+        pass
+
+
+def build_client(client_id: str, transport: StandInTransport, secret: str = "client-secret") -> ApiClient:
+    """Build an OAuth ApiClient using the stand-in transport (no certificates needed)."""
+    http_client_class = api_client.HttpClient
+    api_client.HttpClient = lambda cert_path, key_path: transport
+    try:
+        return ApiClient(ClientType.OAUTH_TWO, "tauc.example", "client.crt", "client.key",
+                         secret=secret, client_id=client_id)
+    finally:
+        api_client.HttpClient = http_client_class
+
+
+def run_concurrently(fn):
+    """Run fn on WORKERS threads released at the same moment; return results or exceptions."""
+    barrier = threading.Barrier(WORKERS)
+
+    def worker(_):
+        barrier.wait()
+        try:
+            return fn()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        return list(executor.map(worker, range(WORKERS)))
+
+
+def test_concurrent_expiry_single_flight():
+    """Test that 64 workers with no valid token share one token request."""
+    print(f"Testing {WORKERS} workers on an expired token...")
+
+    transport = StandInTransport()
+    client = build_client("stress-expiry", transport)
+    AccessTokenManager.remove_expired_token(client.client_id, secret=client.secret)
+
+    results = run_concurrently(client.get_access_token)
+    AccessTokenManager.cancel_refresh(client.client_id, client.secret)
+
+    print(f"  token requests: {transport.token_requests}, distinct tokens: {set(map(str, results))}")
+    assert transport.token_requests == 1, f"Expected 1 token request, got {transport.token_requests}"
+    assert results == ["token-1"] * WORKERS, f"Workers got different results: {set(map(str, results))}"
+    print("  ✓ One token request shared by all workers\n")
+
+
+def test_concurrent_invalid_token_single_flight():
+    """Test that 64 API calls rejected with -70435 share one re-authentication."""
+    print(f"Testing {WORKERS} API calls on a rotated token...")
+
+    transport = StandInTransport()
+    client = build_client("stress-rotation", transport)
+    client.get_access_token()
+    transport.current_token = "rotated-by-server"
+    requests_before = transport.token_requests
+
+    def call():
+        request = GetNetworkNameListV2Request(networkStatus="ONLINE", page=0, pageSize=10)
+        return client.api_call(request, GetNetworkNameListV2Response).is_success()
+
+    results = run_concurrently(call)
+    AccessTokenManager.cancel_refresh(client.client_id, client.secret)
+
+    token_requests = transport.token_requests - requests_before
+    print(f"  token requests: {token_requests}, successful calls: {results.count(True)}/{WORKERS}")
+    assert token_requests == 1, f"Expected 1 token request, got {token_requests}"
+    assert results == [True] * WORKERS, "Some calls failed after re-authentication"
+    print("  ✓ One re-authentication, all calls replayed successfully\n")
+
+
+def test_concurrent_failure_shared():
+    """Test that a failed token request is reported to all waiters without retries."""
+    print(f"Testing {WORKERS} workers on a failing token endpoint...")
+
+    transport = StandInTransport(fail_token_requests=True)
+    client = build_client("stress-failure", transport)
+    AccessTokenManager.remove_expired_token(client.client_id, secret=client.secret)
+
+    results = run_concurrently(client.get_access_token)
+
+    print(f"  token requests: {transport.token_requests}")
+    assert transport.token_requests == 1, f"Expected 1 token request, got {transport.token_requests}"
+    assert all(isinstance(r, TAUCApiException) for r in results), "Expected every worker to get the error"
+    print("  ✓ One token request, error shared by all workers\n")
+
+
+def test_wrong_secret_not_served_from_cache():
+    """Test that a client with a wrong secret never receives another client's cached token."""
+    print("Testing a wrong secret with a token cached for the client ID...")
+
+    transport = StandInTransport()
+    client = build_client("stress-secret", transport)
+    token = client.get_access_token()
+    AccessTokenManager.cancel_refresh(client.client_id, client.secret)
+
+    impostor = build_client("stress-secret", transport, secret="WRONG")
+    try:
+        leaked = impostor.get_access_token()
+    except TAUCApiException:
+        leaked = None
+
+    print(f"  cached token: {token}, wrong-secret result: {leaked}")
+    assert leaked is None, "A wrong secret received the cached token"
+    assert transport.token_requests == 2, "The wrong secret was not checked by the token endpoint"
+    assert client.get_access_token() == token, "The right secret lost its cached token"
+    print("  ✓ Wrong secret rejected by the token endpoint\n")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing AccessTokenManager Single-Flight Refresh")
+    print("=" * 60 + "\n")
+
+    try:
+        test_concurrent_expiry_single_flight()
+        test_concurrent_invalid_token_single_flight()
+        test_concurrent_failure_shared()
+        test_wrong_secret_not_served_from_cache()
+
+        print("=" * 60)
+        print("✓ ALL TESTS PASSED!")
+        print("=" * 60)
+        return 0
+
+    except Exception as e:
+        print("=" * 60)
+        print(f"✗ TEST FAILED: {e}")
+        print("=" * 60)
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
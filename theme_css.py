@@ -1,5 +1,19 @@
 """Theme CSS generator for TAUC Dashboard."""
 
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+# Served by Streamlit at app/static/ (server.enableStaticServing)
+STATIC_DIR = Path(__file__).parent / "static"
+STATIC_URL = "app/static"
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+
 
 def get_theme_css(theme: str = 'dark') -> str:
     """Generate CSS matching the TP-Link TAUC aesthetic."""
@@ -1068,3 +1082,63 @@ def get_theme_css(theme: str = 'dark') -> str:
     }}
 </style>
 """
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = _COMMENT_RE.sub("", css)
+    css = _SPACE_RE.sub(" ", css)
+    css = _PUNCT_RE.sub(r"\1", css)
+    css = css.replace(": ", ":").replace(";}", "}")
+    return css.strip()
+
+
+@lru_cache(maxsize=None)
+def get_theme_stylesheet(theme: str = 'dark') -> Tuple[str, str]:
+    """
+    Get the minified stylesheet for a theme, built once per process.
+
+    Returns:
+        (minified CSS without <style> tags, content fingerprint)
+    """
+    css = get_theme_css(theme).strip()
+    css = css[len("<style>"):-len("</style>")]
+    minified = minify_css(css)
+    fingerprint = hashlib.sha256(minified.encode("utf-8")).hexdigest()[:12]
+    return minified, fingerprint
+
+
+@lru_cache(maxsize=None)
+def get_theme_html(theme: str = 'dark', static_serving: bool = True) -> str:
+    """
+    Get the HTML that applies a theme, built once per process.
+
+    With static serving, the stylesheet is published once as
+    static/theme-<theme>.<fingerprint>.css and referenced with a <link>
+    tag: the browser caches it under the content-addressed URL, and reruns
+    only resend the short tag. Otherwise (or if the file cannot be
+    written) the minified CSS is inlined in a <style> tag.
+
+    Args:
+        theme: 'dark' or 'light'
+        static_serving: Whether Streamlit serves the static/ folder
+
+    Returns:
+        HTML to inject with st.markdown(..., unsafe_allow_html=True)
+    """
+    css, fingerprint = get_theme_stylesheet(theme)
+
+    if static_serving:
+        filename = f"theme-{theme}.{fingerprint}.css"
+        path = STATIC_DIR / filename
+        try:
+            if not path.exists():
+                STATIC_DIR.mkdir(exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_text(css, encoding="utf-8")
+                tmp_path.replace(path)
+            return f'<link rel="stylesheet" href="{STATIC_URL}/{filename}">'
+        except OSError:
+            pass
+
+    return f"<style>{css}</style>"
@@ -15,6 +15,18 @@ from .ui_components import (
 
 from .api_helpers import (
     make_api_call,
+    NETWORK_STATUSES,
+    LOOKUP_MAX_AGE,
+    combine_network_frames,
+    fetch_networks_by_status,
+    get_inventory_mirror,
+    get_inventory_index,
+    refresh_inventory,
+    forget_networks,
+    crawl_inventory_details,
+    get_status_sweeper,
+    stop_status_sweeper,
+    get_snapshot_store,
     get_network_by_name,
     validate_response,
     normalize_mac_address,
@@ -30,6 +42,18 @@ __all__ = [
     "display_success_message",
     # API Helpers
     "make_api_call",
+    "NETWORK_STATUSES",
+    "LOOKUP_MAX_AGE",
+    "combine_network_frames",
+    "fetch_networks_by_status",
+    "get_inventory_mirror",
+    "get_inventory_index",
+    "refresh_inventory",
+    "forget_networks",
+    "crawl_inventory_details",
+    "get_status_sweeper",
+    "stop_status_sweeper",
+    "get_snapshot_store",
     "get_network_by_name",
     "validate_response",
     "normalize_mac_address",
@@ -4,10 +4,15 @@ API helper functions for the TAUC Streamlit Dashboard.
 This module provides common patterns for making API calls and handling responses.
 """
 
+import threading
+
 import streamlit as st
-from typing import Optional, Dict, List, Tuple, TypeVar, Type
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple, TypeVar, Type
 from tauc_openapi.base.tauc_response import TAUCResponse
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 T = TypeVar('T', bound=TAUCResponse)
 
 
@@ -82,52 +87,357 @@ def validate_response(response, success_message: Optional[str] = None,
     return False
 
 
-def get_network_by_name(network_name: str, page_size: str = "100",
-                       case_sensitive: bool = False) -> Tuple[Optional[int], List[Dict]]:
+# All values of GetNetworkNameListV2's networkStatus parameter
+NETWORK_STATUSES = ["ONLINE", "OFFLINE", "ABNORMAL", "INVENTORY", "NAT-LOCKED", "SUSPEND"]
+
+
+def combine_network_frames(frames: List["pd.DataFrame"]) -> "pd.DataFrame":
     """
-    Look up network ID by name using GetNetworkNameListV2.
+    Combine per-status network frames into one table of unique networks.
 
     Args:
-        network_name: Name of network to find
-        page_size: Maximum results per query
-        case_sensitive: Whether to match case-sensitively
+        frames: Frames from GetNetworkNameListV2Response.as_frame() with a "status" column
 
     Returns:
-        Tuple of (network_id, list of all matching networks)
-        Returns (None, []) if not found or error
+        DataFrame with id, network_name and status columns, one row per network ID
+    """
+    import pandas as pd
+
+    if not frames:
+        return pd.DataFrame(columns=["id", "network_name", "status"])
+
+    combined = pd.concat(frames, ignore_index=True)
+    combined = combined[combined["id"].notna() & (combined["id"] != 0)]
+    # Later statuses win, matching the previous dict-based merge
+    return combined.drop_duplicates(subset="id", keep="last").reset_index(drop=True)
+
+
+# Inventory mirrors, indexes, status sweepers and snapshot stores, one per TAUC account (see get_inventory_mirror)
+_inventory_mirrors = {}
+_inventory_indexes = {}
+_status_sweepers = {}
+_snapshot_stores = {}
+_inventory_lock = threading.Lock()
+
+# Name lookups reuse mirrored statuses refreshed within this many seconds
+LOOKUP_MAX_AGE = 300
+
+
+def _account_db_path(account: str, prefix: str) -> str:
+    """
+    Get an account's SQLite file in TAUC_INVENTORY_DB_DIR, or ":memory:" if it is not set.
+
+    Args:
+        account: Account key (see ApiClient.account_key)
+        prefix: File name prefix (e.g. "inventory")
+    """
+    import hashlib
+    import os
+
+    directory = os.getenv("TAUC_INVENTORY_DB_DIR")
+    if not directory:
+        return ":memory:"
+    os.makedirs(directory, exist_ok=True)
+    name = hashlib.sha256(account.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(directory, f"{prefix}-{name}.sqlite3")
+
+
+def get_inventory_mirror():
+    """
+    Get the local inventory mirror for the authenticated account.
+
+    Mirrors are shared by all sessions of the same account in this process.
+    With TAUC_INVENTORY_DB_DIR set, the mirror is an SQLite file in that
+    directory, shared with other dashboard processes and kept across
+    restarts; otherwise it is in memory.
+
+    Returns:
+        InventoryMirror, or None if not authenticated
+    """
+    from tauc_openapi.inventory import InventoryMirror
+
+    client = st.session_state.get('client')
+    if not client:
+        return None
+
+    account = client.account_key
+    with _inventory_lock:
+        mirror = _inventory_mirrors.get(account)
+        if mirror is None:
+            mirror = _inventory_mirrors[account] = InventoryMirror(client, _account_db_path(account, "inventory"))
+
+    # Refresh through the session's current client (it changes on re-login)
+    mirror.client = client
+    return mirror
+
+
+def get_inventory_index():
     """
-    from tauc_openapi.models import GetNetworkNameListV2Request, GetNetworkNameListV2Response
+    Get the in-memory inventory index for the authenticated account.
+
+    The index is loaded from the inventory mirror by refresh_inventory() and
+    shared by all sessions of the same account in this process.
+
+    Returns:
+        InventoryIndex, or None if not authenticated
+    """
+    from tauc_openapi.inventory import InventoryIndex
+
+    client = st.session_state.get('client')
+    if not client:
+        return None
+
+    with _inventory_lock:
+        index = _inventory_indexes.get(client.account_key)
+        if index is None:
+            index = _inventory_indexes[client.account_key] = InventoryIndex(LOOKUP_MAX_AGE)
+        return index
 
-    # Normalize search term
-    search_name = network_name if case_sensitive else network_name.lower()
 
-    # Query all network statuses
-    statuses = ["ONLINE", "OFFLINE", "ABNORMAL", "INVENTORY", "NAT-LOCKED", "SUSPEND"]
-    matched_networks = []
+def refresh_inventory(statuses: Optional[List[str]] = None,
+                      page_size: Optional[int] = None,
+                      max_age: Optional[float] = None) -> Optional[List]:
+    """
+    Refresh the inventory mirror and, if anything changed, the inventory index.
+
+    Args:
+        statuses: Network statuses to refresh (default: NETWORK_STATUSES)
+        page_size: Fixed page size (default: largest size the API accepts)
+        max_age: Reuse statuses refreshed less than this many seconds ago
+                 without calling the API (default: always refresh)
+
+    Returns:
+        Per-status StatusSync summaries, or None if not authenticated
+    """
+    mirror = get_inventory_mirror()
+    index = get_inventory_index()
+    if mirror is None or index is None:
+        return None
+
+    summaries = mirror.sync(
+        list(statuses or NETWORK_STATUSES),
+        max_age,
+        int(page_size) if page_size else None,
+        st.session_state.get('access_token')
+    )
+    if index.expired or any(s.added or s.updated or s.removed for s in summaries):
+        index.load(mirror.get_networks(), mirror.get_mesh_units())
+    return summaries
 
-    for status in statuses:
-        request = GetNetworkNameListV2Request(
-            page="0",
-            pageSize=page_size,
-            networkStatus=status
-        )
 
-        response = make_api_call(
-            request,
-            GetNetworkNameListV2Response,
-            show_spinner=False
-        )
+def forget_networks(network_ids: List[int]) -> None:
+    """
+    Remove deleted networks from the inventory mirror and index.
+
+    Args:
+        network_ids: IDs of the deleted networks
+    """
+    mirror = get_inventory_mirror()
+    index = get_inventory_index()
+    if mirror is None or index is None:
+        return
+
+    mirror.remove_networks(network_ids)
+    for network_id in network_ids:
+        index.remove_network(network_id)
+
+
+def crawl_inventory_details(max_age: Optional[float] = None,
+                            rate: Optional[float] = None,
+                            progress=None):
+    """
+    Crawl the details (mesh units, tags, device models) of every network into
+    the inventory mirror, then reload the inventory index.
+
+    An interrupted crawl is resumed by the next call; failed requests are
+    retried by the next crawl.
+
+    Args:
+        max_age: Keep details fetched less than this many seconds ago
+                 (default: refetch all)
+        rate: API calls per second (default: DetailsCrawler's)
+        progress: Called with (networks done, networks due)
+
+    Returns:
+        CrawlResult, or None if not authenticated
+    """
+    from tauc_openapi.inventory import DetailsCrawler
+    from tauc_openapi.inventory.crawler import DEFAULT_RATE
+
+    mirror = get_inventory_mirror()
+    index = get_inventory_index()
+    if mirror is None or index is None:
+        return None
 
-        if response and response.is_success() and response.result and response.result.data:
-            for network in response.result.data:
-                network_check_name = network.network_name if case_sensitive else (network.network_name or "").lower()
+    crawler = DetailsCrawler(mirror, rate=rate or DEFAULT_RATE, access_token=st.session_state.get('access_token'))
+    result = crawler.crawl(max_age=max_age, list_max_age=LOOKUP_MAX_AGE, progress=progress)
+    index.load(mirror.get_networks(), mirror.get_mesh_units())
+    return result
 
-                if network_check_name == search_name:
-                    matched_networks.append({
-                        "id": network.id,
-                        "name": network.network_name,
-                        "status": status
-                    })
+
+def get_snapshot_store():
+    """
+    Get the inventory snapshot store for the authenticated account.
+
+    With TAUC_INVENTORY_DB_DIR set, snapshots are kept in an SQLite file in
+    that directory (separate from the inventory mirror, which is only a
+    cache); otherwise they are in memory and last until the app restarts.
+
+    Returns:
+        SnapshotStore, or None if not authenticated
+    """
+    from tauc_openapi.inventory import SnapshotStore
+
+    client = st.session_state.get('client')
+    if not client:
+        return None
+
+    account = client.account_key
+    with _inventory_lock:
+        store = _snapshot_stores.get(account)
+        if store is None:
+            store = _snapshot_stores[account] = SnapshotStore(client, _account_db_path(account, "snapshots"))
+
+    store.client = client
+    return store
+
+
+def get_status_sweeper(statuses: Optional[List[str]] = None, track: bool = True):
+    """
+    Get the fleet status sweeper for the authenticated account.
+
+    The sweeper is shared by all sessions of the same account in this
+    process (its scheduled sweeps keep running between page views). With
+    ``track``, its tracked networks are set to the mirrored networks with
+    the given listing statuses (refreshed if older than LOOKUP_MAX_AGE);
+    networks first tracked start from their listing status if
+    GetNetworkStatus can report it (REPORTED_STATUSES), otherwise unknown.
+
+    Args:
+        statuses: Listing statuses of the networks to track (default: all)
+        track: Update the tracked networks (False: return the sweeper as is,
+               without API calls)
+
+    Returns:
+        StatusSweeper, or None if not authenticated (or, without track, not created yet)
+    """
+    from tauc_openapi.inventory import REPORTED_STATUSES, StatusSweeper
+
+    client = st.session_state.get('client')
+    if not client:
+        return None
+
+    account = client.account_key
+    with _inventory_lock:
+        sweeper = _status_sweepers.get(account)
+        if sweeper is None:
+            if not track:
+                return None
+            sweeper = _status_sweepers[account] = StatusSweeper(client)
+    if not track:
+        return sweeper
+
+    sweeper.client = client
+    sweeper.access_token = st.session_state.get('access_token')
+    statuses = list(statuses or NETWORK_STATUSES)
+    refresh_inventory(statuses, max_age=LOOKUP_MAX_AGE)
+    # Keep the statuses sweeps found; the listing only seeds new networks,
+    # and only with statuses a sweep can find (a network listed NAT-LOCKED
+    # would otherwise show up as a change to ONLINE on the first sweep)
+    sweeper.track({
+        network["id"]: network["status"]
+        if network["status"] in REPORTED_STATUSES and not sweeper.status_of(network["id"]) else None
+        for network in get_inventory_mirror().get_networks(statuses)
+    })
+    return sweeper
+
+
+def stop_status_sweeper() -> None:
+    """
+    Stop the authenticated account's scheduled status sweeps and drop its sweeper.
+
+    Called on logout, so the background thread stops calling the API with
+    the account's credentials. The sweeper is shared, so this also stops
+    auto-sweeps started from other sessions of the same account.
+    """
+    client = st.session_state.get('client')
+    if not client:
+        return
+
+    with _inventory_lock:
+        sweeper = _status_sweepers.pop(client.account_key, None)
+    if sweeper is not None:
+        sweeper.stop()
+
+
+def fetch_networks_by_status(statuses: Optional[List[str]] = None,
+                             page_size: Optional[int] = None,
+                             max_age: Optional[float] = None) -> Optional[Dict[str, object]]:
+    """
+    Refresh the networks of several statuses and read them from the inventory mirror.
+
+    Every status is queried at the same time, each one paginated (see
+    InventoryMirror.sync), so fetching all statuses takes about as long as
+    the slowest one instead of the sum of all; only changes are written to
+    the mirror. The networks are then read from the mirror as one table
+    with a status column, one row per network ID. A status whose query
+    fails is reported in its summary and keeps its mirrored networks.
+
+    Args:
+        statuses: Network statuses to query (default: NETWORK_STATUSES)
+        page_size: Fixed page size (default: largest size the API accepts)
+        max_age: Reuse statuses refreshed less than this many seconds ago
+                 without calling the API (default: always refresh)
+
+    Returns:
+        Dictionary with:
+            networks: DataFrame with id, network_name and status columns
+            statuses: Per-status StatusSync summaries, in query order
+        None if not authenticated
+    """
+    import pandas as pd
+
+    statuses = list(statuses or NETWORK_STATUSES)
+    summaries = refresh_inventory(statuses, page_size, max_age)
+    if summaries is None:
+        st.error("Not authenticated. Please login first.")
+        return None
+
+    rows = get_inventory_mirror().get_networks(statuses)
+    networks = pd.DataFrame({
+        "id": pd.array([row["id"] for row in rows], dtype="Int64"),
+        "network_name": pd.array([row["name"] for row in rows], dtype="string"),
+        "status": pd.array([row["status"] for row in rows], dtype="string"),
+    })
+    return {"networks": networks, "statuses": summaries}
+
+
+def get_network_by_name(network_name: str, page_size: Optional[str] = None,
+                       case_sensitive: bool = False) -> Tuple[Optional[int], List[Dict]]:
+    """
+    Look up network ID by name in the inventory index (no API call when fresh).
+
+    If the index has expired, it is reloaded first (see refresh_inventory),
+    refreshing statuses older than LOOKUP_MAX_AGE seconds from
+    GetNetworkNameListV2.
+
+    Args:
+        network_name: Name of network to find
+        page_size: Results per page (default: largest accepted); all pages are searched
+        case_sensitive: Whether to match case-sensitively
+
+    Returns:
+        Tuple of (network_id, list of all matching networks)
+        Returns (None, []) if not found or error
+    """
+    index = get_inventory_index()
+    if index is None:
+        st.error("Not authenticated. Please login first.")
+        return None, []
+
+    if index.expired:
+        show_status_errors(refresh_inventory(NETWORK_STATUSES, page_size, LOOKUP_MAX_AGE))
+    matched_networks = index.find_by_name(network_name, case_sensitive)
 
     # Return first match and all matches
     if matched_networks:
@@ -136,52 +446,51 @@ def get_network_by_name(network_name: str, page_size: str = "100",
     return None, []
 
 
-def get_all_networks(page_size: str = "100",
+def get_all_networks(page_size: Optional[str] = None,
                     status_filter: Optional[str] = None) -> Dict[int, Dict]:
     """
     Fetch all networks across all statuses.
 
     Args:
-        page_size: Maximum results per status query
+        page_size: Results per page (default: largest accepted); all pages are fetched
         status_filter: Optional status to filter by (ONLINE, OFFLINE, etc.)
                       If None, queries all statuses
 
     Returns:
         Dictionary of networks {id: {id, name, status}}
     """
-    from tauc_openapi.models import GetNetworkNameListV2Request, GetNetworkNameListV2Response
-
-    all_networks = {}
-
     # Determine which statuses to query
     if status_filter and status_filter != "ALL":
         statuses_to_query = [status_filter]
     else:
-        statuses_to_query = ["ONLINE", "OFFLINE", "ABNORMAL", "INVENTORY", "NAT-LOCKED", "SUSPEND"]
-
-    for status in statuses_to_query:
-        request = GetNetworkNameListV2Request(
-            page="0",
-            pageSize=page_size,
-            networkStatus=status
-        )
-
-        response = make_api_call(
-            request,
-            GetNetworkNameListV2Response,
-            show_spinner=False
-        )
-
-        if response and response.is_success() and response.result and response.result.data:
-            for network in response.result.data:
-                if network.id:
-                    all_networks[network.id] = {
-                        "id": network.id,
-                        "name": network.network_name or "Unnamed",
-                        "status": status
-                    }
-
-    return all_networks
+        statuses_to_query = NETWORK_STATUSES
+
+    summaries = refresh_inventory(statuses_to_query, page_size)
+    if summaries is None:
+        st.error("Not authenticated. Please login first.")
+        return {}
+    show_status_errors(summaries)
+
+    return {
+        network["id"]: {
+            "id": network["id"],
+            "name": network["name"] or "Unnamed",
+            "status": network["status"]
+        }
+        for network in get_inventory_mirror().get_networks(statuses_to_query)
+    }
+
+
+def show_status_errors(summaries: List) -> None:
+    """
+    Show a warning for each status whose query failed.
+
+    Args:
+        summaries: Per-status StatusSync summaries (see InventoryMirror.sync)
+    """
+    for summary in summaries:
+        if summary.error:
+            st.warning(f"Error fetching {summary.status} networks: {summary.error}")
 
 
 def batch_delete_with_progress(items: List[Dict], delete_function,
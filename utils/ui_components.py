@@ -7,9 +7,19 @@ This module provides consistent UI patterns across all pages.
 import streamlit as st
 import pandas as pd
 import json
+from dataclasses import asdict, is_dataclass
 from typing import Dict, List, Optional, Any
 
 
+def _to_plain(value: Any) -> Any:
+    """Convert result objects (including slotted dataclasses) to plain dicts for display."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if hasattr(value, '__dict__'):
+        return vars(value)
+    return value
+
+
 def display_api_response(response, endpoint: str, show_full_data: bool = False):
     """
     Display API response in an expandable section with formatted JSON.
@@ -38,8 +48,7 @@ def display_api_response(response, endpoint: str, show_full_data: bool = False):
                 }
 
                 if show_full_data and hasattr(response.result, 'data') and response.result.data:
-                    result_data["data"] = [vars(item) if hasattr(item, '__dict__') else item
-                                          for item in response.result.data]
+                    result_data["data"] = [_to_plain(item) for item in response.result.data]
                 else:
                     data_count = len(response.result.data) if hasattr(response.result, 'data') and response.result.data else 0
                     result_data["dataCount"] = data_count
@@ -47,7 +56,7 @@ def display_api_response(response, endpoint: str, show_full_data: bool = False):
                 response_json["result"] = result_data
             else:
                 # Non-paginated response
-                response_json["result"] = vars(response.result) if hasattr(response.result, '__dict__') else response.result
+                response_json["result"] = _to_plain(response.result)
         else:
             response_json["result"] = None
 